@@ -16,7 +16,7 @@ Dependencies:
 - Flask
 - Flask-CORS
 - Requests
-- Scrapy (HtmlResponse)
+- lxml (HTML parsing; Scrapy optional, see utils/html_backend.py)
 
 Folder Structure:
 -----------------
@@ -24,17 +24,40 @@ Folder Structure:
 - match_ids.json         # Local match mapping file
 """
 
-import json
+import base64
+import hashlib
+import os
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import flask
-import requests
-from flask import Flask, jsonify, request, redirect, send_from_directory
+from flask import Flask, Response, g, jsonify, request, redirect, send_from_directory
 from flask_cors import CORS
-from scrapy.http import HtmlResponse
-from utils.fetcher import fetch_all_ipl_matches
+from utils.fetcher import fetch_all_ipl_matches, refresh_ipl_matches, resolve_seasons
+from utils.scorecard import (
+    LIVE_SCORES_URL, SCORECARD_URL, is_match_completed, parse_live_ipl_match_id,
+)
+from utils.archive import open_archive
+from utils.cache import TTLCache
+from utils.deltas import DeltaTracker
+from utils.html_backend import parse_html
+from utils.json_codec import FastJSONProvider, Payload, dumps, loads
+from utils.parse_pool import ParsePool
+from utils.singleflight import SingleFlight
+from utils.live_poller import LivePoller
+from utils.live_schedule import LiveMatchFinder, LiveSchedule, Prewarmer
+from utils import http_client, metrics
+from utils.jobs import JobRegistry
+from utils.model import Match
+from utils.shared_cache import open_shared_cache
+from utils.match_index import MATCH_STATUSES, MatchIndex, match_status
+from utils.match_stats import MatchStats
 from utils.update_series import update_ipl_series
-from utils.fantasy_points import calculate_total_points
+from utils.fantasy_points import calculate_total_points, get_scoring_table
+from utils.fantasy_engine import SeasonStats, roster_resolver
+from utils.player_index import PLAYER_INDEX_PATH, PlayerIndex
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,19 +65,146 @@ logger = logging.getLogger(__name__)
 
 
 app = flask.Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)
 
-def safe_int(val):
-    try:
-        return int(val)
-    except:
-        return 0
+# Completed scorecards never change, so they stay cached until evicted;
+# live (or not yet started) matches are only reused for a short window.
+SCORECARD_CACHE_SIZE = int(os.environ.get("SCORECARD_CACHE_SIZE", 256))
+LIVE_SCORECARD_TTL = float(os.environ.get("LIVE_SCORECARD_TTL", 15))
+scorecard_cache = TTLCache(maxsize=SCORECARD_CACHE_SIZE)
+# Encoded bodies of immutable responses (completed scorecards, the match list),
+# so repeat reads skip serialization and compression.
+payload_cache = TTLCache(maxsize=SCORECARD_CACHE_SIZE)
+# Completed scorecards persisted on disk, shared by every worker (None if disabled).
+scorecard_archive = open_archive()
+# Scorecards and the live match ID shared by every worker process (None unless SHARED_CACHE_URL is set).
+shared_cache = open_shared_cache()
+SHARED_COMPLETED_SCORECARD_TTL = float(os.environ.get("SHARED_COMPLETED_SCORECARD_TTL", 86400))
+SHARED_LIVE_MATCH_ID_TTL = float(os.environ.get("SHARED_LIVE_MATCH_ID_TTL", 10))
+
+# Scorecard HTML is parsed in worker processes under load when PARSE_POOL_SIZE > 0.
+parse_pool = ParsePool()
+
+# Previous snapshot and recent JSON Patches per match, for delta clients.
+scorecard_deltas = DeltaTracker()
+
+# Concurrent requests for the same upstream page share one fetch+parse.
+upstream_flight = SingleFlight()
+
+refresh_jobs = JobRegistry()
+
+# Columnar fantasy stats per season, extended with newly archived matches.
+fantasy_stats_cache = TTLCache(maxsize=32)
+
+# Per-player lines and career totals; loaded from the offline build
+# (python -m utils.player_index build) and extended as matches are archived.
+player_index = PlayerIndex.load(PLAYER_INDEX_PATH) if PLAYER_INDEX_PATH else PlayerIndex()
+# Archive size the player index was last synced at; syncs run on a background thread.
+_player_index_synced = None
+_player_index_sync_lock = threading.Lock()
+
+# match_ids.json is parsed once here and reloaded only when the file changes.
+match_index = MatchIndex("./match_ids.json")
+match_index.reload()
+# Head-to-head, venue and standings aggregates, updated per changed season when match_ids.json changes.
+match_stats = MatchStats(match_index)
+
+LIVE_POLL_INTERVAL = float(os.environ.get("LIVE_POLL_INTERVAL", 10))
+# A shared live scorecard stored less than one poll interval ago is used
+# instead of scraping again, so N polling workers cost one scrape per interval.
+SHARED_SCORECARD_MIN_TTL = max(LIVE_SCORECARD_TTL - LIVE_POLL_INTERVAL, 0.0)
+
+# Shared pool for /scorecards, so concurrent batches together never exceed
+# BATCH_CONCURRENCY in-flight Cricbuzz fetches.
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", 8))
+BATCH_MAX_MATCHES = int(os.environ.get("BATCH_MAX_MATCHES", 100))
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix="batch")
+
+# Cache-Control lifetimes. Completed scorecards never change; live ones only
+# stay valid as long as the server-side cache would reuse them.
+COMPLETED_SCORECARD_MAX_AGE = int(os.environ.get("COMPLETED_SCORECARD_MAX_AGE", 86400))
+MATCH_LIST_MAX_AGE = int(os.environ.get("MATCH_LIST_MAX_AGE", 300))
+# Page sizes for filtered /get_all_matches queries.
+MATCH_LIST_PAGE_SIZE = int(os.environ.get("MATCH_LIST_PAGE_SIZE", 100))
+MATCH_LIST_MAX_PAGE_SIZE = int(os.environ.get("MATCH_LIST_MAX_PAGE_SIZE", 1000))
+LEADERBOARD_MAX_LIMIT = int(os.environ.get("LEADERBOARD_MAX_LIMIT", 500))
+# /scorecard/live points at a different match over time, so it is always revalidated.
+LIVE_CACHE_CONTROL = "no-cache"
+
+# Send a Server-Timing header with the per-stage breakdown of every response.
+SERVER_TIMING = os.environ.get("SERVER_TIMING", "").lower() in ("1", "true", "yes")
+
+
+@app.before_request
+def _start_request_metrics():
+    prewarmer.ensure_started()
+    g.request_start = time.perf_counter()
+    g.in_flight = True
+    metrics.IN_FLIGHT.inc()
+    metrics.start_request_timings()
+
+
+@app.after_request
+def _record_request_metrics(response):
+    elapsed = time.perf_counter() - g.request_start
+    endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    metrics.REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+    metrics.REQUEST_LATENCY.observe(elapsed, endpoint=endpoint)
+    if SERVER_TIMING:
+        timings = dict(metrics.request_timings() or {}, total=elapsed)
+        response.headers["Server-Timing"] = metrics.server_timing_header(timings)
+    return response
+
+
+@app.teardown_request
+def _end_request_metrics(error=None):
+    if g.pop("in_flight", False):
+        metrics.IN_FLIGHT.dec()
+
+
+def _collect_app_metrics():
+    cache = scorecard_cache.stats()
+    yield ("scorecard_cache_requests_total", "counter", "Scorecard cache lookups by result.",
+           ("result",), {("hit",): cache["hits"], ("miss",): cache["misses"]})
+    yield ("scorecard_cache_evictions_total", "counter", "Scorecards evicted from the LRU cache.",
+           (), {(): cache["evictions"]})
+    yield ("scorecard_cache_entries", "gauge", "Scorecards currently cached.", (), {(): cache["size"]})
+    payloads = payload_cache.stats()
+    yield ("payload_cache_requests_total", "counter", "Pre-encoded response body lookups by result.",
+           ("result",), {("hit",): payloads["hits"], ("miss",): payloads["misses"]})
+    if shared_cache is not None:
+        shared = shared_cache.stats()
+        yield ("shared_cache_requests_total", "counter", "Shared cache lookups by result.",
+               ("result",), {("hit",): shared["hits"], ("miss",): shared["misses"]})
+        yield ("shared_cache_errors_total", "counter", "Shared cache operations that failed.",
+               (), {(): shared["errors"]})
+        yield ("shared_cache_peer_refreshes_total", "counter",
+               "Refreshes skipped because another worker refreshed the same key.", (), {(): shared["peer_refreshes"]})
+    if scorecard_archive is not None:
+        archive = scorecard_archive.stats()
+        yield ("scorecard_archive_requests_total", "counter", "Scorecard archive lookups by result.",
+               ("result",), {("hit",): archive["hits"], ("miss",): archive["misses"]})
+    flight = upstream_flight.stats()
+    yield ("upstream_fetches_total", "counter", "Upstream fetches executed or coalesced onto one in flight.",
+           ("result",), {("executed",): flight["executed"], ("coalesced",): flight["coalesced"]})
+    pool = parse_pool.stats()
+    yield ("scorecard_parses_total", "counter", "Scorecard parses by where they ran.",
+           ("mode",), {("inline",): pool["inline"], ("process",): pool["offloaded"]})
+
+
+metrics.registry.add_collector(_collect_app_metrics)
+
+
+@app.route('/metrics', methods=["GET"])
+def metrics_endpoint():
+    """
+    Prometheus metrics for this worker process.
 
-def safe_float(val):
-    try:
-        return float(val)
-    except:
-        return 0.0
+    Returns:
+        Response: Metrics in the Prometheus text exposition format.
+    """
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
 
 
 @app.route("/", methods=["GET"])
@@ -79,13 +229,29 @@ def home():
         <p>&emsp;Usage:</p>
         <pre>
 1. /scorecard/live                  - Get live IPL match scorecard
-2. /scorecard?ipl_match_no=match_no - Get IPL scorecard by match number
+   /scorecard/live/stream           - Server-Sent Events stream of live scorecard updates (?mode=patch for JSON Patch)
+   /scorecard/live/delta?since=seq  - Live scorecard changes since seq as JSON Patch
+2. /scorecard?ipl_match_no=match_no - Get IPL scorecard by match number (optional &season=2024)
 3. /scorecard/match_id              - Get scorecard by Cricbuzz match ID
+   /scorecard/match_id/delta?since=seq - Scorecard changes since seq as JSON Patch
+   /scorecards?match_ids=id1,id2    - Stream many scorecards as NDJSON (or ?season=2024)
 4. /get_all_matches                 - List all IPL matches
-5. /get_all_matches_refresh         - Refresh match IDs for all seasons or a specific year
+   /get_all_matches?team=kolkata&status=completed&limit=20&fields=match_id,match_name
+                                     - Filtered, paginated, projected match list
+5. /get_all_matches_refresh         - Refresh match IDs for all seasons or a specific year (background job)
+   /get_all_matches_refresh/status  - Status and per-season timings of the refresh job
 6. /update_series                   - Refresh and update latest IPL series IDs dynamically
 7. /fantasy/points?match_id=<id>    - Calculate Fantasy Points for a match
+   /fantasy/leaderboard?season=2024  - Season fantasy leaderboard over archived matches
+   /fantasy/players/name?season=2024 - Season fantasy aggregates for one player
+   /players/name                     - Career batting, bowling and fantasy totals of a player
+   /players/name/season/2024         - One season's totals and per-match lines of a player
+   /stats/head-to-head/team[/opponent] - Team record against every opponent, or against one
+   /stats/venues[/venue]             - Bat-first vs chase win rates per venue
+   /stats/standings[/2024]           - Season points table, playoffs and champion
 8. /tests/report                    - Run all tests and show an interactive HTML Test Report in your browser
+9. /debug/stats                     - Cache and upstream request counters
+   /metrics                         - Prometheus metrics (latency histograms, cache and upstream counters)
 
         </pre>
     </body>
@@ -116,71 +282,317 @@ def run_tests():
     except Exception as e:
         return f"Error running tests: {str(e)}"
 
+def compute_fantasy_points(scorecard, scoring=None):
+    """
+    Calculate fantasy points for every player in one scorecard.
+
+    Batting and bowling rows carry parsed numbers and are scored directly;
+    a player who batted and bowled gets the sum of both. Row names are
+    resolved against the playing XI (see roster_resolver), so players are
+    keyed the same way as in the season leaderboard and player endpoints.
+
+    Args:
+        scorecard (Match): Parsed scorecard.
+        scoring (dict): Scoring table; defaults to the default table.
+
+    Returns:
+        dict: Player name to fantasy points.
+    """
+    resolve = roster_resolver(scorecard.playing_eleven)
+    teams = [innings.team for innings in scorecard.innings]
+    fantasy_summary = {}
+    for number, innings in enumerate(scorecard.innings):
+        # Bowlers play for the team batting in the other innings of the pair.
+        fielding_team = teams[number ^ 1] if (number ^ 1) < len(teams) else None
+        for rows, team in ((innings.batting, innings.team), (innings.bowling, fielding_team)):
+            for row in rows:
+                name = resolve(row.name, team)
+                fantasy_summary[name] = fantasy_summary.get(name, 0) + calculate_total_points(row, scoring)
+    return fantasy_summary
+
+
 @app.route('/fantasy/points')
 def fantasy_points():
     match_id = request.args.get('match_id')
 
     if not match_id:
         return {"message": "Provide match_id"}
+    try:
+        scoring = get_scoring_table(request.args.get('scoring', 'default'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Fetch scoreboard using your existing function
-    scorecard = get_entire_scorecard(match_id)
+    scorecard = load_scorecard(match_id)
 
-    fantasy_summary = {}
-
-    for inning in ['Innings1', 'Innings2']:
-        batting = scorecard[inning][0]['Batsman']
-        bowling = scorecard[inning][1]['Bowlers']
-
-        # Batting points
-        for batter in batting:
-            name = batter.get('name')
-            stats = {
-                'runs': safe_int(batter.get('runs')),
-                'fours': safe_int(batter.get('fours')),
-                'sixes': safe_int(batter.get('sixes')),
-                'balls_faced': safe_int(batter.get('balls')),
-                'wickets': 0,
-                'lbw_bowled': 0,
-                'overs_bowled': 0,
-                'runs_conceded': 0,
-                'maidens': 0,
-                'catches': 0,
-                'stumpings': 0,
-                'run_outs_direct': 0,
-                'run_outs_others': 0
-            }
-            fantasy_summary[name] = calculate_total_points(stats)
-
-        # Bowling points
-        for bowler in bowling:
-            name = bowler.get('name')
-            stats = {
-                'runs': 0,
-                'fours': 0,
-                'sixes': 0,
-                'balls_faced': 0,
-                'wickets': safe_int(bowler.get('wickets')),
-                'lbw_bowled': 0,  # Optional parsing
-                'overs_bowled': safe_float(bowler.get('overs')),
-                'runs_conceded': safe_int(bowler.get('runs')),
-                'maidens': safe_int(bowler.get('maidens')),
-                'catches': 0,
-                'stumpings': 0,
-                'run_outs_direct': 0,
-                'run_outs_others': 0
-            }
-            if name in fantasy_summary:
-                # Player is all-rounder (bat + bowl)
-                fantasy_summary[name] += calculate_total_points(stats)
-            else:
-                fantasy_summary[name] = calculate_total_points(stats)
+    fantasy_summary = compute_fantasy_points(scorecard, scoring)
 
     logger.info(f"[Fantasy] Points for match {match_id} → {fantasy_summary}")
 
     return jsonify(fantasy_summary)
 
 
+@app.route('/fantasy/leaderboard')
+def fantasy_leaderboard():
+    """
+    Season fantasy leaderboard computed over every archived scorecard.
+
+    Query Parameters:
+        season (str): 'IPL2024', '2024' or 'all'; defaults to the latest season.
+        limit (int): Number of players to return, 1 to LEADERBOARD_MAX_LIMIT (default 20).
+        scoring (str): Registered scoring table name (default 'default').
+
+    Returns:
+        dict: Ranked players with total and average points.
+    """
+    try:
+        scoring = get_scoring_table(request.args.get('scoring', 'default'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        limit = int(request.args.get('limit', 20))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+    if not 1 <= limit <= LEADERBOARD_MAX_LIMIT:
+        return jsonify({"error": f"limit must be between 1 and {LEADERBOARD_MAX_LIMIT}."}), 400
+    season = _fantasy_season(request.args.get('season'))
+    if season is not None and season not in match_index.seasons():
+        return jsonify({"message": f"No matches found for season {season}."}), 404
+    stats = season_fantasy_stats(season)
+    return jsonify({
+        "season": season or "all",
+        "matches_scored": stats.match_count,
+        "leaderboard": stats.leaderboard(scoring, limit=limit)
+    })
+
+
+@app.route('/fantasy/players/<path:name>')
+def fantasy_player(name):
+    """
+    Fantasy aggregates for one player across a season's archived scorecards.
+
+    Query Parameters:
+        season (str): 'IPL2024', '2024' or 'all'; defaults to the latest season.
+        scoring (str): Registered scoring table name (default 'default').
+
+    Returns:
+        dict: Stat totals, strike rate, economy and per-match points.
+    """
+    try:
+        scoring = get_scoring_table(request.args.get('scoring', 'default'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    season = _fantasy_season(request.args.get('season'))
+    if season is not None and season not in match_index.seasons():
+        return jsonify({"message": f"No matches found for season {season}."}), 404
+    summary = season_fantasy_stats(season).player_summary(name, scoring)
+    if summary is None:
+        return jsonify({"message": f"No archived matches found for {name}."}), 404
+    summary["season"] = season or "all"
+    return jsonify(summary)
+
+
+def _fantasy_season(season):
+    if season is not None and season.lower() == 'all':
+        return None
+    return match_index.normalize_season(season)
+
+
+def season_fantasy_stats(season):
+    """
+    Columnar stats for every archived scorecard of a season (None for all seasons).
+
+    When the number of archived matches changes, only the newly archived
+    matches are read and appended; the columns are rebuilt in full only if
+    matches disappeared from the archive.
+
+    Returns:
+        SeasonStats: Player-match stat columns.
+    """
+    if scorecard_archive is None:
+        return SeasonStats.from_scorecards([])
+    cached = fantasy_stats_cache.get(season)
+    if cached is not None and cached[0] == scorecard_archive.count(season):
+        return cached[1]
+    archived = scorecard_archive.match_ids(season)
+    if cached is not None and cached[2] <= archived:
+        stats = cached[1].extend(scorecard_archive.iter_scorecards(season, match_ids=archived - cached[2]))
+    else:
+        stats = SeasonStats.from_scorecards(scorecard_archive.iter_scorecards(season))
+    fantasy_stats_cache.set(season, (len(archived), stats, archived))
+    return stats
+
+
+@app.route('/players/<path:name>/season/<season>')
+def player_season(name, season):
+    """
+    One season of a player from the player index.
+
+    Args:
+        name (str): Player name, or a part of one that matches a single player.
+        season (str): 'IPL2024' or '2024'.
+
+    Returns:
+        dict: Season totals and the player's line in every indexed match.
+    """
+    player, error = _resolve_player(name)
+    if error is not None:
+        return error
+    season = match_index.normalize_season(season)
+    summary = player_index.season(player, season)
+    if summary is None:
+        return jsonify({"message": f"No indexed {season} matches found for {player}."}), 404
+    return jsonify(summary)
+
+
+@app.route('/players/<path:name>')
+def player_career(name):
+    """
+    Career totals of a player from the player index.
+
+    Args:
+        name (str): Player name, or a part of one that matches a single player.
+
+    Returns:
+        dict: Batting, bowling and fantasy totals, with a summary per season.
+    """
+    player, error = _resolve_player(name)
+    if error is not None:
+        return error
+    return jsonify(player_index.career(player))
+
+
+def _resolve_player(name):
+    if scorecard_archive is not None and scorecard_archive.count() != _player_index_synced:
+        sync_player_index_in_background()
+    player, candidates = player_index.find(name)
+    if player is not None:
+        return player, None
+    if candidates:
+        return None, (jsonify({"message": f"Several players match {name}.", "candidates": candidates}), 404)
+    return None, (jsonify({"message": f"No indexed matches found for {name}."}), 404)
+
+
+def sync_player_index():
+    """
+    Add archived matches missing from the player index (e.g. archived by another worker).
+
+    Only looks at the archive when its size changed since the last sync.
+    """
+    global _player_index_synced
+    if scorecard_archive is None:
+        return
+    version = scorecard_archive.count()
+    if version == _player_index_synced:
+        return
+    added = player_index.sync(scorecard_archive, match_index.season_of)
+    if added:
+        logger.info(f"Player index: added {added} archived matches")
+    _player_index_synced = version
+
+
+def sync_player_index_in_background():
+    """Run sync_player_index on a daemon thread, unless a sync is already running."""
+    if not _player_index_sync_lock.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            sync_player_index()
+        except Exception as e:
+            logger.warning(f"Player index sync failed: {e}")
+        finally:
+            _player_index_sync_lock.release()
+
+    threading.Thread(target=run, name="player-index-sync", daemon=True).start()
+
+
+# Catch up with matches archived since the index file was built, off the request path.
+sync_player_index_in_background()
+
+
+@app.route('/stats/head-to-head/<team>')
+@app.route('/stats/head-to-head/<team>/<opponent>')
+def head_to_head_stats(team, opponent=None):
+    """
+    Win/loss record of a team against every opponent, or against one.
+
+    Args:
+        team (str): Team name, or a part of one that matches a single team ('kolkata').
+        opponent (str): Optional opponent, matched the same way.
+
+    Returns:
+        dict: Record with wins per team and per-season breakdown.
+    """
+    document, candidates = match_stats.head_to_head(team, opponent)
+    if document is None:
+        name = team if opponent is None else f"{team} vs {opponent}"
+        return _stats_not_found(f"No head-to-head record found for {name}.", candidates)
+    return stats_response(document)
+
+
+@app.route('/stats/venues')
+def venue_stats():
+    """
+    Every venue with its matches and bat-first vs chase win rates, busiest first.
+    """
+    return stats_response({"venues": match_stats.venues()})
+
+
+@app.route('/stats/venues/<path:venue>')
+def venue_stats_one(venue):
+    """
+    Record of one venue, by name or a part of one ('wankhede').
+    """
+    document, candidates = match_stats.venue(venue)
+    if document is None:
+        return _stats_not_found(f"No matches found at {venue}.", candidates)
+    return stats_response(document)
+
+
+@app.route('/stats/standings')
+@app.route('/stats/standings/<season>')
+def standings_stats(season=None):
+    """
+    League-stage points table of a season (default: latest), with playoff results.
+
+    Points are 2 for a win (including a super over) and 1 for a no result;
+    match_ids.json carries no scores, so there is no net run rate.
+    """
+    season = match_index.normalize_season(season)
+    document = match_stats.standings(season)
+    if document is None:
+        return jsonify({"message": f"No matches found for season {season}."}), 404
+    return stats_response(document)
+
+
+def _stats_not_found(message, candidates):
+    body = {"message": message}
+    if candidates:
+        body["candidates"] = candidates
+    return jsonify(body), 404
+
+
+def stats_response(document):
+    """
+    Serve a /stats document with the same caching headers as /get_all_matches.
+
+    The ETag combines match_ids.json's content hash with the request path, so
+    it changes only when the underlying matches do.
+    """
+    etag = match_index.etag
+    if etag is not None:
+        etag = hashlib.sha1(f"{etag}{request.path}".encode("utf-8")).hexdigest()
+    if etag is not None and request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(document)
+    if etag is not None:
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = f"public, max-age={MATCH_LIST_MAX_AGE}"
+    return response
+
+
 @app.route('/scorecard/live', methods=["GET"])
 def get_live_match_scorecard():
     """
@@ -189,10 +601,78 @@ def get_live_match_scorecard():
     Returns:
         dict: Scorecard of live IPL match or error message.
     """
+    live_poller.ensure_started()
+    if live_poller.is_fresh():
+        snapshot = live_poller.snapshot()
+        if snapshot["match_id"] is None:
+            return {"message": "No live IPL match found."}
+        return scorecard_response(snapshot["scorecard"], cache_control=LIVE_CACHE_CONTROL)
+
     live_match_id = fetch_live_ipl_match_id()
     if live_match_id == -1:
         return {"message": "No live IPL match found."}
-    return get_entire_scorecard(match_id=live_match_id)
+    return scorecard_response(load_scorecard(live_match_id), cache_control=LIVE_CACHE_CONTROL)
+
+
+@app.route('/scorecard/live/stream', methods=["GET"])
+def stream_live_match_scorecard():
+    """
+    Stream the live IPL scorecard as Server-Sent Events.
+
+    Sends the current snapshot immediately, then one event per scorecard change.
+
+    Query Parameters:
+        mode (str): 'full' (default) sends every snapshot; 'patch' sends JSON Patch
+            events after the first snapshot.
+
+    Returns:
+        Response: text/event-stream of scorecard snapshots.
+    """
+    live_poller.ensure_started()
+    patches = request.args.get('mode', 'full').lower() == 'patch'
+    return Response(live_poller.stream(patches=patches), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.route('/scorecard/live/delta', methods=["GET"])
+def get_live_scorecard_delta():
+    """
+    Changes to the live IPL scorecard since a sequence number, as JSON Patch.
+
+    Query Parameters:
+        since (str): Sequence number ('<epoch>-<n>') of the last snapshot or patch the client applied.
+
+    Returns:
+        dict: A patch, or a full snapshot when the client must resync.
+    """
+    live_poller.ensure_started()
+    if live_poller.is_fresh():
+        live_match_id = live_poller.snapshot()["match_id"] or -1
+    else:
+        live_match_id = fetch_live_ipl_match_id()
+    if live_match_id == -1:
+        return {"message": "No live IPL match found."}
+    return get_scorecard_delta(str(live_match_id))
+
+
+@app.route('/scorecard/<match_id>/delta', methods=["GET"])
+def get_scorecard_delta(match_id):
+    """
+    Changes to a scorecard since a sequence number, as JSON Patch (RFC 6902).
+
+    Without ``since``, or when ``since`` is unknown or too old, a full snapshot
+    is returned instead; its ``seq`` is the starting point for the next call.
+
+    Query Parameters:
+        since (str): Sequence number ('<epoch>-<n>') of the last snapshot or patch the client applied.
+
+    Returns:
+        dict: {"type": "patch", "seq", "since", "patch"} or {"type": "snapshot", "seq", "scorecard"}.
+    """
+    since = request.args.get('since', default=None)
+    response = jsonify(scorecard_deltas.delta(match_id, load_scorecard(match_id), since))
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.route('/scorecard/<match_id>', methods=["GET"])
@@ -203,6 +683,7 @@ def get_entire_scorecard(match_id=None):
 
     Query Parameters:
         ipl_match_no (int): Optional IPL match number.
+        season (str): Optional season for ipl_match_no ('IPL2024' or '2024'); defaults to the latest season.
         match_id (str): Optional Cricbuzz match ID.
 
     Returns:
@@ -210,284 +691,594 @@ def get_entire_scorecard(match_id=None):
     """
     match_no = request.args.get('ipl_match_no', default=None, type=int)
     if match_no is not None:
-        match_id = get_match_id_from_no(match_no)
+        match_id = get_match_id_from_no(match_no, season=request.args.get('season'))
         if match_id == -1:
             return {"message": "Invalid IPL match number."}
     elif not match_id:
         return {"message": "Provide match_id or ipl_match_no."}
 
-    url = "https://www.cricbuzz.com/api/html/cricket-scorecard/" + str(match_id)
-    cricbuzz_resp = requests.get(url)
-    response = HtmlResponse(url=url, body=cricbuzz_resp.text, encoding='utf-8')
-
-    playing_eleven = get_playing_eleven(response)
-    innings_1_score, innings_2_score = get_scores(response)
-    toss = get_toss(response)
-    result = get_result_update(response)
-
-    response_json = {
-        "Innings1": [{"Batsman": get_batting_scorecard('"innings_1"', response)},
-                     {"Bowlers": get_bowling_scorecard('"innings_1"', response)},
-                     innings_1_score],
-        "Innings2": [{"Batsman": get_batting_scorecard('"innings_2"', response)},
-                     {"Bowlers": get_bowling_scorecard('"innings_2"', response)},
-                     innings_2_score],
-        "Result": result,
-        "Playing_Eleven": playing_eleven,
-        "Toss_Result": toss
-    }
+    return scorecard_response(load_scorecard(match_id), match_id=match_id)
 
-    return response_json
 
+def scorecard_cache_control(scorecard):
+    """Cache-Control policy for a scorecard: long-lived once completed, short for live matches."""
+    if is_match_completed(scorecard):
+        return f"public, max-age={COMPLETED_SCORECARD_MAX_AGE}"
+    return f"public, max-age={int(LIVE_SCORECARD_TTL)}, must-revalidate"
 
-@app.route('/get_all_matches', methods=["GET"])
-def get_all_matches():
-    """
-    Returns the list of all IPL matches stored locally in match_ids.json.
 
-    Returns:
-        dict: Match number to Match ID mapping.
+def scorecard_payload(match_id, scorecard):
     """
-    with open("./match_ids.json", "r") as f:
-        match_ids = json.load(f)
-    return match_ids
+    Encoded body for a scorecard.
 
+    Completed scorecards are encoded once per cached scorecard object and the
+    payload reused; live ones are encoded for every response.
 
-@app.route('/get_all_matches_refresh', methods=["GET"])
-def refresh_match_ids():
-    season = request.args.get('season', default='all')
-    try:
-        refreshed_data = fetch_all_ipl_matches(season=season, save_to_file=True)
-        return jsonify({
-            "message": "Match IDs refreshed successfully",
-            "seasons": list(refreshed_data.keys())
-        })
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 400
-    except Exception as e:
-        return jsonify({"error": f"Unexpected error: {str(e)}"}), 500
+    Args:
+        match_id (str): Cricbuzz match ID, or None if unknown.
+        scorecard (Match): Parsed scorecard.
 
+    Returns:
+        Payload: Encoded scorecard.
+    """
+    if match_id is None or not is_match_completed(scorecard):
+        return Payload.from_obj(scorecard)
+    key = ("scorecard", str(match_id))
+    cached = payload_cache.get(key)
+    if cached is not None and cached[0] is scorecard:
+        return cached[1]
+    payload = Payload.from_obj(scorecard)
+    payload_cache.set(key, (scorecard, payload))
+    return payload
+
+
+def payload_response(payload, cache_control, compress=True):
+    """
+    Serve a Payload with its ETag, answering 304 when If-None-Match has any of its representations.
 
-@app.route('/update_series', methods=["GET"])
-def update_series_route():
-    try:
-        updated = update_ipl_series()
-        return jsonify({
-            "message": "IPL Series IDs updated successfully",
-            "updated_seasons": list(updated.keys())
-        })
-    except Exception as e:
-        return jsonify({"error": f"Failed to update series: {str(e)}"}), 500
+    Args:
+        payload (Payload): Encoded body.
+        cache_control (str): Cache-Control header value.
+        compress (bool): Send a gzip/br body if the client accepts one; only
+            worth it for payloads that are reused, since compression is kept
+            with the payload.
+    """
+    body, coding = payload.encoded(request.headers.get("Accept-Encoding")) if compress else (payload.body, None)
+    etag = payload.etag_for(coding)
+    if request.if_none_match.contains_weak(etag) or request.if_none_match.contains_weak(payload.etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+        if coding is not None:
+            response.headers["Content-Encoding"] = coding
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    if compress:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def scorecard_response(scorecard, cache_control=None, match_id=None):
+    """
+    JSON response for a scorecard with a strong content-hash ETag.
 
+    Returns 304 Not Modified when the request's If-None-Match already has it.
+    Completed scorecards are served from pre-encoded (and pre-compressed) bytes.
 
-def fetch_live_ipl_match_id():
+    Args:
+        scorecard (Match): Parsed scorecard.
+        cache_control (str): Overrides the completed/live Cache-Control policy.
+        match_id (str): Cricbuzz match ID, used to reuse encoded completed scorecards.
     """
-    Scrape Cricbuzz Live Scores page to find the first live IPL match ID.
+    payload = scorecard_payload(match_id, scorecard)
+    return payload_response(payload, cache_control or scorecard_cache_control(scorecard),
+                            compress=match_id is not None and is_match_completed(scorecard))
 
-    Returns:
-        str: Cricbuzz match ID if found, else -1.
+
+def load_scorecard(match_id):
     """
-    url = "https://www.cricbuzz.com/cricket-match/live-scores"
-    try:
-        cricbuzz_resp = requests.get(url)
-        response = HtmlResponse(url=url, body=cricbuzz_resp.text, encoding='utf-8')
-        live_links = response.xpath('//a[contains(@href, "/live-cricket-scores/")]/@href').extract()
-        for link in live_links:
-            if "premier-league" in link.lower() or "ipl" in link.lower():
-                match_id = link.split('/')[2]
-                return match_id
-        return -1
-    except Exception as e:
-        print(f"Error fetching live match ID: {e}")
-        return -1
+    Return the parsed scorecard for a match, serving it from cache when possible.
+
+    Lookup order is the in-process cache, the cache shared by all workers
+    (if configured), the on-disk archive of completed matches, then Cricbuzz.
+    Completed matches are cached until evicted; other matches expire after
+    LIVE_SCORECARD_TTL seconds.
 
+    Args:
+        match_id (str): Cricbuzz match ID.
 
-def get_match_id_from_no(match_no):
+    Returns:
+        Match: Complete scorecard with batting, bowling, toss, result, and playing XI.
     """
-    Retrieve Cricbuzz match ID based on IPL match number.
+    match_id = str(match_id)
+    scorecard = scorecard_cache.get(match_id)
+    if scorecard is not None:
+        return scorecard
+    if shared_cache is not None:
+        scorecard = _cache_shared_scorecard(match_id, *shared_cache.get_with_ttl(f"scorecard:{match_id}"))
+        if scorecard is not None:
+            return scorecard
+    if scorecard_archive is not None:
+        scorecard = scorecard_archive.get(match_id)
+        if scorecard is not None:
+            scorecard_cache.set(match_id, scorecard)
+            return scorecard
+    return refresh_scorecard(match_id)
+
+
+def _cache_shared_scorecard(match_id, data, ttl):
+    """Decode a scorecard read from the shared cache and keep it locally for as long as it has left."""
+    if data is None:
+        return None
+    scorecard = Match.from_dict(loads(data))
+    scorecard_cache.set(match_id, scorecard, ttl=ttl)
+    return scorecard
+
+
+def publish_scorecard(match_id, scorecard):
+    """Store a freshly fetched scorecard in the shared cache for the other workers."""
+    if shared_cache is not None:
+        ttl = SHARED_COMPLETED_SCORECARD_TTL if is_match_completed(scorecard) else LIVE_SCORECARD_TTL
+        shared_cache.set(f"scorecard:{match_id}", dumps(scorecard), ttl=ttl)
+
+
+def refresh_scorecard(match_id):
+    """
+    Fetch a fresh scorecard from Cricbuzz, bypassing the cache, and cache the result.
 
     Args:
-        match_no (int): IPL match number.
+        match_id (str): Cricbuzz match ID.
 
     Returns:
-        str: Cricbuzz match ID if found, else -1.
+        Match: Complete scorecard.
+    """
+    match_id = str(match_id)
+    return upstream_flight.do(("scorecard", match_id), _fetch_scorecard, match_id)
+
+
+def _fetch_scorecard(match_id):
     """
-    with open("./match_ids.json", "r") as f:
-        match_ids = json.load(f)
-    for match in match_ids["IPL2025"]:
-        if match['match_no'] == match_no:
-            return match['match_id']
-    return -1
+    Scrape, parse and cache one scorecard. Callers go through load_scorecard().
+
+    With a shared cache only one worker scrapes a match at a time; the others
+    wait for it and take its result. A result another worker stored within
+    the last poll interval is also taken instead of scraping again.
+    """
+    if shared_cache is None:
+        return _scrape_scorecard(match_id)
+    scorecard, peer = shared_cache.refresh_once(f"scorecard:{match_id}", lambda: _scrape_scorecard(match_id),
+                                                min_ttl=SHARED_SCORECARD_MIN_TTL)
+    return scorecard if peer is None else _cache_shared_scorecard(match_id, *peer)
+
 
+def _scrape_scorecard(match_id):
+    url = SCORECARD_URL + match_id
+    cricbuzz_resp = http_client.get(url)
+    with metrics.stage("parse"):
+        scorecard = parse_pool.parse(cricbuzz_resp.text, url=url)
 
-# --------------- Scraper Utility Functions ---------------
+    if cricbuzz_resp.status_code == 200:
+        store_scorecard(match_id, cricbuzz_resp.text, scorecard)
+    return scorecard
 
-def get_scores(response):
+
+def store_scorecard(match_id, html, scorecard):
     """
-    Extract innings scores from Cricbuzz scorecard HTML.
+    Everything done with a freshly scraped scorecard, by both the Flask and ASGI apps.
+
+    Records it for delta clients, caches it in process (completed matches
+    until evicted, others for LIVE_SCORECARD_TTL), publishes it to the shared
+    cache, and archives and indexes it once the match is completed. Blocks on
+    disk and network I/O, so the ASGI app calls it in an executor.
 
     Args:
-        response (HtmlResponse): Scrapy HTML response.
+        match_id (str): Cricbuzz match ID.
+        html (str): Raw scorecard page.
+        scorecard (Match): Parsed scorecard.
+    """
+    scorecard_deltas.record(match_id, scorecard)
+    completed = is_match_completed(scorecard)
+    scorecard_cache.set(match_id, scorecard, ttl=None if completed else LIVE_SCORECARD_TTL)
+    publish_scorecard(match_id, scorecard)
+    if completed and scorecard_archive is not None:
+        season = match_index.season_of(match_id)
+        scorecard_archive.put(match_id, html, scorecard, season=season)
+        player_index.add_match(match_id, season, scorecard)
+
+
+@app.route('/scorecards', methods=["GET"])
+def get_scorecards_batch():
+    """
+    Stream scorecards for many matches as NDJSON, one line per match as it completes.
+
+    Query Parameters:
+        match_ids (str): Comma-separated Cricbuzz match IDs.
+        season (str): Alternatively, every match of a season ('IPL2024' or '2024').
 
     Returns:
-        tuple: Innings 1 and Innings 2 score dictionaries.
+        Response: application/x-ndjson lines of {"match_id", "scorecard"} or {"match_id", "error"}.
     """
+    match_ids = [m.strip() for m in request.args.get('match_ids', '').split(',') if m.strip()]
+    season = request.args.get('season')
+    if not match_ids and season:
+        season = match_index.normalize_season(season)
+        if season not in match_index.data:
+            return jsonify({"error": f"Unknown season: {season}"}), 404
+        match_ids = [match["match_id"] for match in match_index.data[season]]
+    if not match_ids:
+        return jsonify({"error": "Provide match_ids or season."}), 400
+    match_ids = list(dict.fromkeys(match_ids))
+    if len(match_ids) > BATCH_MAX_MATCHES:
+        return jsonify({"error": f"At most {BATCH_MAX_MATCHES} matches per batch."}), 400
+
+    return Response(_stream_scorecards(match_ids), mimetype="application/x-ndjson")
+
+
+def _load_batch_item(match_id):
     try:
-        innings_1_score = {}
-        team1 = response.xpath('//*[@id="innings_1"]/div[1]/div[1]/span[1]/text()').extract()[0].replace("Innings", "").strip()
-        score1 = response.xpath('//*[@id="innings_1"]/div[1]/div[1]/span[2]/text()').extract()[0].replace("Innings", "").strip()
-        innings_1_score = {
-            "team": team1,
-            "score": score1,
-            "runs": int(score1.split('-')[0].strip()),
-            "wickets": int(score1.split('-')[1].split('(')[0].strip()),
-            "overs": score1.split('(')[1].split(')')[0].replace('Ov', '').strip()
-        }
-    except:
-        innings_1_score = {}
+        return {"match_id": match_id, "scorecard": load_scorecard(match_id)}
+    except Exception as e:
+        logger.warning(f"[Batch] Scorecard {match_id} failed: {e}")
+        return {"match_id": match_id, "error": str(e)}
+
 
+def _stream_scorecards(match_ids):
+    futures = [batch_executor.submit(_load_batch_item, match_id) for match_id in match_ids]
     try:
-        innings_2_score = {}
-        team2 = response.xpath('//*[@id="innings_2"]/div[1]/div[1]/span[1]/text()').extract()[0].strip().replace("Innings", "").strip()
-        score2 = response.xpath('//*[@id="innings_2"]/div[1]/div[1]/span[2]/text()').extract()[0].strip().replace("Innings", "").strip()
-        innings_2_score = {
-            "team": team2,
-            "score": score2,
-            "runs": int(score2.split('-')[0].strip()),
-            "wickets": int(score2.split('-')[1].split('(')[0].strip()),
-            "overs": score2.split('(')[1].split(')')[0].replace('Ov', '').strip()
-        }
-    except:
-        innings_2_score = {}
+        for future in as_completed(futures):
+            yield dumps(future.result()) + b"\n"
+    finally:
+        # Client went away: drop the fetches that have not started yet.
+        for future in futures:
+            future.cancel()
+
+
+MATCH_QUERY_PARAMS = ("season", "team", "venue", "status", "limit", "cursor", "fields")
+MATCH_FIELDS = ("match_id", "match_no", "match_name", "match_venue", "match_date", "match_time",
+                "match_result", "season", "status")
+
 
-    return innings_1_score, innings_2_score
+def _encode_cursor(etag, position):
+    token = f"{(etag or '')[:12]}:{position}".encode("ascii")
+    return base64.urlsafe_b64encode(token).decode("ascii").rstrip("=")
 
 
-def get_playing_eleven(response):
+def _decode_cursor(cursor, etag):
     """
-    Extract playing XI from scorecard.
+    Turn a cursor back into a start position.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for an older match list.
+    """
+    try:
+        token = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        cursor_etag, position = token.rsplit(":", 1)
+        position = int(position)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor.")
+    if cursor_etag != (etag or "")[:12]:
+        raise ValueError("Cursor is from an older match list; start again without it.")
+    return position
+
+
+def _project_match(season, match, fields):
+    if fields is None:
+        return dict(match, season=season)
+    record = {}
+    for field in fields:
+        if field == "season":
+            record[field] = season
+        elif field == "status":
+            record[field] = match_status(match.get("match_result"))
+        else:
+            record[field] = match.get(field, "NA")
+    return record
+
+
+def query_matches(args, etag):
+    """
+    Run a filtered, paginated match list query.
 
     Args:
-        response (HtmlResponse): Scrapy HTML response.
+        args: Query parameters (season, team, venue, status, limit, cursor, fields).
+        etag (str): Content hash of the current match list, for cursors.
 
     Returns:
-        dict: Team-wise playing eleven.
+        dict: ``{"matches", "count", "total", "next_cursor"}``.
+
+    Raises:
+        ValueError: On an invalid parameter.
     """
+    status = args.get("status")
+    if status is not None and status not in MATCH_STATUSES:
+        raise ValueError(f"status must be one of: {', '.join(MATCH_STATUSES)}")
     try:
-        playing_eleven = {}
-        team_name_one = response.xpath(f'/html/body/div[4]/div[2]/div[9]/text()').extract()[0].replace('Squad', '').strip()
-        team_one_playing_eleven = response.xpath(f'/html/body/div[4]/div[2]/div[10]/div[2]/a/text()').extract()
-        team_name_two = response.xpath(f'/html/body/div[4]/div[2]/div[12]/text()').extract()[0].replace('Squad', '').strip()
-        team_two_playing_eleven = response.xpath(f'/html/body/div[4]/div[2]/div[13]/div[2]/a/text()').extract()
-        playing_eleven = {team_name_one: team_one_playing_eleven, team_name_two: team_two_playing_eleven}
-    except Exception:
-        playing_eleven = {}
-    return playing_eleven
+        limit = int(args.get("limit", MATCH_LIST_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit must be an integer.")
+    if not 1 <= limit <= MATCH_LIST_MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MATCH_LIST_MAX_PAGE_SIZE}.")
+    fields = None
+    if args.get("fields"):
+        fields = [field.strip() for field in args["fields"].split(",") if field.strip()]
+        unknown = [field for field in fields if field not in MATCH_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(MATCH_FIELDS)}")
+    start = _decode_cursor(args["cursor"], etag) if args.get("cursor") else 0
+
+    page, total, next_position = match_index.query(
+        season=args.get("season"), team=args.get("team"), venue=args.get("venue"), status=status,
+        start=start, limit=limit)
+    return {
+        "matches": [_project_match(season, match, fields) for season, match in page],
+        "count": len(page),
+        "total": total,
+        "next_cursor": None if next_position is None else _encode_cursor(etag, next_position)
+    }
 
 
-def get_toss(response):
+def match_list_payload(snapshot):
+    """The full match list of one MatchIndex snapshot, encoded once and keyed by the file's hash."""
+    key = ("match_list", snapshot.etag)
+    payload = payload_cache.get(key) if snapshot.etag is not None else None
+    if payload is None:
+        payload = Payload.from_obj(snapshot.data, etag=snapshot.etag)
+        if snapshot.etag is not None:
+            payload_cache.set(key, payload)
+    return payload
+
+
+@app.route('/get_all_matches', methods=["GET"])
+def get_all_matches():
     """
-    Extract toss result from scorecard.
+    Returns the list of all IPL matches stored locally in match_ids.json.
 
-    Args:
-        response (HtmlResponse): Scrapy HTML response.
+    Without query parameters the whole season -> matches mapping is returned.
+    Any of season, team, venue, status, limit, cursor or fields switches to a
+    filtered, paginated list served from the in-memory index, so the response
+    only costs as much as the page asked for.
+
+    The ETag is the file's content hash (plus the query), so an unchanged list
+    is answered with 304 Not Modified before anything is serialized.
+
+    Query Parameters:
+        season (str): '2025' or 'IPL2025'.
+        team (str): Team name, or part of one ('kolkata').
+        venue (str): Venue name, or part of one.
+        status (str): 'completed', 'no_result' or 'scheduled'.
+        limit (int): Page size (default MATCH_LIST_PAGE_SIZE).
+        cursor (str): next_cursor from the previous page.
+        fields (str): Comma-separated fields to include in each match.
 
     Returns:
-        dict: Toss details.
+        dict: Season to matches mapping, or a page of matches with next_cursor.
     """
+    snapshot = match_index.current()
+    cache_control = f"public, max-age={MATCH_LIST_MAX_AGE}"
+    filtered = any(name in request.args for name in MATCH_QUERY_PARAMS)
+    etag = snapshot.etag
+    if etag is not None and filtered:
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.args.items(multi=True)))
+        etag = hashlib.sha1(f"{snapshot.etag}?{query}".encode("utf-8")).hexdigest()
+
+    if etag is not None and request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif filtered:
+        try:
+            response = jsonify(query_matches(request.args, snapshot.etag))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    else:
+        return payload_response(match_list_payload(snapshot), cache_control)
+    if etag is not None:
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    return response
+
+
+@app.route('/get_all_matches_refresh', methods=["GET"])
+def refresh_match_ids():
+    """
+    Start a background refresh of match_ids.json.
+
+    Query Parameters:
+        season (str): 'all' (default), '2025' or 'IPL2025'.
+        mode (str): 'incremental' (default) re-fetches only seasons that can still
+            change and merges changed records; 'full' rebuilds the requested seasons.
+        concurrency (int): Optional number of seasons fetched in parallel.
+        wait (bool): Block until the refresh finishes and return its result.
+
+    Returns:
+        Response: 202 with the job id and status URL, or the finished job if wait=true.
+    """
+    season = request.args.get('season', default='all')
+    concurrency = request.args.get('concurrency', default=None, type=int)
+    mode = request.args.get('mode', default='incremental').lower()
+    if mode not in ('incremental', 'full'):
+        return jsonify({"error": "mode must be 'incremental' or 'full'"}), 400
     try:
-        toss = {}
-        toss_text = response.xpath('/html/body/div[4]/div[2]/div[3]/div[2]/text()').extract()[0].strip()
-        toss_won_by = toss_text.split('won')[0].strip()
-        chosen_to = toss_text.split('opt to')[1].strip()
-        toss["update"] = toss_text
-        toss["winning_team"] = toss_won_by
-        toss["chose_to"] = chosen_to
-    except:
-        toss = {}
-    return toss
+        seasons = resolve_seasons(season)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    job, created = refresh_jobs.start("match-refresh", _run_match_refresh, season, concurrency, mode)
+    if request.args.get('wait', '').lower() in ('1', 'true', 'yes'):
+        job.join()
+        status = 200 if job.status == "succeeded" else 500
+        return jsonify(job.to_dict()), status
 
-def get_result_update(response):
+    return jsonify({
+        "message": "Match ID refresh started" if created else "Match ID refresh already running",
+        "job_id": job.id,
+        "seasons": list(seasons.keys()),
+        "status_url": f"/get_all_matches_refresh/status?job_id={job.id}"
+    }), 202
+
+
+@app.route('/get_all_matches_refresh/status', methods=["GET"])
+def refresh_match_ids_status():
     """
-    Extract match result from scorecard.
+    Report the status and per-season timings of a match refresh job.
 
-    Args:
-        response (HtmlResponse): Scrapy HTML response.
+    Query Parameters:
+        job_id (str): Optional job id; defaults to the most recent refresh.
 
     Returns:
-        dict: Match result.
+        dict: Job status, progress and result.
     """
+    job_id = request.args.get('job_id')
+    job = refresh_jobs.get(job_id) if job_id else refresh_jobs.latest("match-refresh")
+    if job is None:
+        return jsonify({"error": "No refresh job found."}), 404
+    return jsonify(job.to_dict())
+
+
+def _run_match_refresh(job, season, concurrency, mode):
+    if mode == 'incremental':
+        summary = refresh_ipl_matches(season=None if season.lower() == 'all' else season,
+                                      max_workers=concurrency, timings=job.progress)
+        match_index.current()
+        match_stats.current()
+        return {
+            "message": "Match IDs refreshed incrementally",
+            "seasons": summary
+        }
+
+    refreshed_data = fetch_all_ipl_matches(season=season, save_to_file=True,
+                                           max_workers=concurrency, timings=job.progress)
+    match_index.reload()
+    match_stats.current()
+    return {
+        "message": "Match IDs refreshed successfully",
+        "seasons": list(refreshed_data.keys())
+    }
+
+
+@app.route('/debug/stats', methods=["GET"])
+def debug_stats():
+    """
+    Expose cache and request-coalescing counters.
+
+    Returns:
+        dict: Scorecard cache hits/misses, single-flight executed/coalesced counts,
+        live poller state and upstream latency/breaker stats.
+    """
+    return jsonify({
+        "scorecard_cache": scorecard_cache.stats(),
+        "payload_cache": payload_cache.stats(),
+        "shared_cache": shared_cache.stats() if shared_cache is not None else None,
+        "player_index": player_index.stats(),
+        "match_stats": match_stats.stats(),
+        "scorecard_archive": scorecard_archive.stats() if scorecard_archive is not None else None,
+        "upstream_flight": upstream_flight.stats(),
+        "parse_pool": parse_pool.stats(),
+        "live_poller": live_poller.stats(),
+        "live_match": live_finder.stats(),
+        "prewarm": prewarmer.stats(),
+        "upstream": http_client.upstream_stats()
+    })
+
+
+@app.route('/update_series', methods=["GET"])
+def update_series_route():
     try:
-        result = response.xpath('/html/body/div[1]/text()').extract()[0].strip().lower()
-        if "won" not in result:
-            final_result = "Not Completed"
-            margin = "NA"
-        else:
-            final_result = result.split('won')[0].replace('(', '').replace("match tied", "").strip()
-            margin = result.split('by')[1].strip()
-    except:
-        final_result, margin, result = "NA", "NA", "NA"
-    return {"winning_team": final_result, "update": result, "winning_margin": margin}
+        updated = update_ipl_series()
+        return jsonify({
+            "message": "IPL Series IDs updated successfully",
+            "updated_seasons": list(updated.keys())
+        })
+    except Exception as e:
+        return jsonify({"error": f"Failed to update series: {str(e)}"}), 500
 
 
-def get_batting_scorecard(innings, response):
+def fetch_live_ipl_match_id():
     """
-    Extract batting scorecard.
+    Find the first live IPL match ID.
 
-    Args:
-        innings (str): Innings identifier.
-        response (HtmlResponse): Scrapy HTML response.
+    Answered from the schedule-aware cache in live_finder where possible (no
+    request at all outside match windows); otherwise concurrent callers share
+    a single scrape of the live-scores page. With a shared cache the result is
+    also shared by every worker for SHARED_LIVE_MATCH_ID_TTL seconds, and only
+    one worker scrapes at a time.
 
     Returns:
-        list: List of batsman stats.
+        str: Cricbuzz match ID if found, else -1.
     """
-    batting = []
-    for i in range(3, 13):
-        try:
-            batsman_name = response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[1]/a/text()').extract()[0].strip()
-            batsman = {
-                "name": batsman_name,
-                "dismissal": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[2]/span/text()').extract()[0].strip(),
-                "runs": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[3]/text()').extract()[0].strip(),
-                "balls": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[4]/text()').extract()[0].strip(),
-                "fours": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[5]/text()').extract()[0].strip(),
-                "sixes": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[6]/text()').extract()[0].strip(),
-                "sr": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[7]/text()').extract()[0].strip()
-            }
-            batting.append(batsman)
-        except:
-            pass
-    return batting
-
-
-def get_bowling_scorecard(innings, response):
-    """
-    Extract bowling scorecard.
+    return live_finder.get()
+
+
+def _fetch_live_page_match_id():
+    return upstream_flight.do("live-page", _find_live_ipl_match_id)
+
+
+def _find_live_ipl_match_id():
+    if shared_cache is None:
+        return _scrape_live_ipl_match_id()
+    cached = shared_cache.get("live-match-id")
+    if cached is not None:
+        return loads(cached)
+
+    def scrape_and_publish():
+        match_id = _scrape_live_ipl_match_id()
+        shared_cache.set("live-match-id", dumps(match_id), ttl=SHARED_LIVE_MATCH_ID_TTL)
+        return match_id
+
+    match_id, peer = shared_cache.refresh_once("live-match-id", scrape_and_publish)
+    return match_id if peer is None else loads(peer[0])
+
+
+def _scrape_live_ipl_match_id():
+    url = LIVE_SCORES_URL
+    try:
+        cricbuzz_resp = http_client.get(url)
+        response = parse_html(cricbuzz_resp.text, url=url)
+        return parse_live_ipl_match_id(response)
+    except Exception as e:
+        print(f"Error fetching live match ID: {e}")
+        return -1
+
+
+def _is_match_finished(match_id):
+    """True if the last scorecard seen for a match (cached, or polled) already has a result."""
+    scorecard = scorecard_cache.peek(str(match_id))
+    if scorecard is None and live_poller.match_id == str(match_id):
+        scorecard = live_poller.scorecard
+    return scorecard is not None and is_match_completed(scorecard)
+
+
+def prewarm_scorecard(match_id, start):
+    """
+    Fetch a fixture's scorecard ahead of its start and keep it cached until then.
+
+    A scorecard that is not completed is normally cached for only
+    LIVE_SCORECARD_TTL seconds, which would expire long before the start.
+    """
+    logger.info(f"Pre-warming scorecard of match {match_id} before its scheduled start")
+    scorecard = refresh_scorecard(match_id)
+    if not is_match_completed(scorecard):
+        scorecard_cache.set(str(match_id), scorecard, ttl=max(start - live_schedule.clock(), LIVE_SCORECARD_TTL))
+
+
+# When a match can be live, from the unplayed fixtures in match_ids.json.
+live_schedule = LiveSchedule(match_index)
+live_finder = LiveMatchFinder(_fetch_live_page_match_id, live_schedule, is_finished=_is_match_finished)
+live_poller = LivePoller(fetch_live_ipl_match_id, refresh_scorecard, interval=LIVE_POLL_INTERVAL)
+# Wakes up LIVE_PREWARM_LEAD seconds before each scheduled start; no requests in between.
+prewarmer = Prewarmer(live_schedule, prewarm_scorecard)
+
+
+def get_match_id_from_no(match_no, season=None):
+    """
+    Retrieve Cricbuzz match ID based on IPL match number.
 
     Args:
-        innings (str): Innings identifier.
-        response (HtmlResponse): Scrapy HTML response.
+        match_no (int): IPL match number.
+        season (str): Optional season ('IPL2024' or '2024'); defaults to the latest season.
 
     Returns:
-        list: List of bowler stats.
+        str: Cricbuzz match ID if found, else -1.
     """
-    bowling = []
-    for i in range(2, 13):
-        try:
-            bowler_name = response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[1]/a/text()').extract()[0].strip()
-            bowler = {
-                "name": bowler_name,
-                "overs": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[2]/text()').extract()[0].strip(),
-                "maidens": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[3]/text()').extract()[0].strip(),
-                "runs": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[4]/text()').extract()[0].strip(),
-                "wicket": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[5]/text()').extract()[0].strip(),
-                "economy": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[8]/text()').extract()[0].strip()
-            }
-            bowling.append(bowler)
-        except:
-            pass
-    return bowling
+    return match_index.match_id_for(match_no, season=season)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,330 @@
+"""
+Async (ASGI) serving path for the scorecard endpoints.
+
+Serves ``/scorecard/<match_id>``, ``/scorecard``, ``/scorecard/live``,
+``/scorecard/<match_id>/delta`` and ``/fantasy/points`` without holding a worker thread for the Cricbuzz
+round-trip: upstream pages are fetched with a non-blocking HTTP client and
+parsed in a thread pool so the event loop keeps accepting requests. Responses
+are byte-for-byte what the Flask views in app.py return, and the scorecard
+cache, archive and match index are the same objects the Flask app uses.
+
+Run:
+    uvicorn asgi:app --workers 2
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app import (
+    LIVE_CACHE_CONTROL, SERVER_TIMING, SHARED_LIVE_MATCH_ID_TTL, SHARED_SCORECARD_MIN_TTL, _cache_shared_scorecard,
+    compute_fantasy_points, live_finder, match_index, parse_pool, scorecard_archive, scorecard_cache,
+    prewarmer, scorecard_cache_control, scorecard_deltas, scorecard_payload, shared_cache, store_scorecard,
+)
+from utils import async_http, metrics
+from utils.http_client import upstream_stats
+from utils.fantasy_points import get_scoring_table
+from utils.html_backend import parse_html
+from utils.json_codec import dumps, loads
+from utils.scorecard import (
+    LIVE_SCORES_URL, SCORECARD_URL, is_match_completed, parse_live_ipl_match_id,
+)
+from utils.shared_cache import SHARED_CACHE_LOCK_WAIT
+from utils.singleflight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+ASGI_PARSE_WORKERS = int(os.environ.get("ASGI_PARSE_WORKERS", 4))
+parse_executor = ThreadPoolExecutor(max_workers=ASGI_PARSE_WORKERS, thread_name_prefix="parse")
+# Waiting on another worker's refresh lock can take SHARED_CACHE_LOCK_WAIT seconds;
+# those waits get their own threads so they never hold up parsing.
+ASGI_LOCK_WORKERS = int(os.environ.get("ASGI_LOCK_WORKERS", 8))
+lock_executor = ThreadPoolExecutor(max_workers=ASGI_LOCK_WORKERS, thread_name_prefix="shared-lock")
+
+upstream_flight = AsyncSingleFlight()
+# The running live match ID revalidation, if any; asyncio only holds tasks weakly.
+_revalidations = set()
+
+
+def json_response(data, status_code=200):
+    """Serialize exactly like Flask's jsonify: sorted keys, compact separators, trailing newline."""
+    body = dumps(data) + b"\n"
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def scorecard_response(request, scorecard, cache_control=None, match_id=None):
+    """Same body, ETag, Cache-Control, compression and 304 handling as app.scorecard_response()."""
+    payload = scorecard_payload(match_id, scorecard)
+    compress = match_id is not None and is_match_completed(scorecard)
+    body, coding = payload.encoded(request.headers.get("accept-encoding")) if compress else (payload.body, None)
+    headers = {
+        "ETag": f'"{payload.etag_for(coding)}"',
+        "Cache-Control": cache_control or scorecard_cache_control(scorecard)
+    }
+    if compress:
+        headers["Vary"] = "Accept-Encoding"
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, headers["ETag"]) or _etag_matches(if_none_match, f'"{payload.etag}"'):
+        return Response(status_code=304, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def run_in_executor(fn, *args, executor=parse_executor):
+    # Copy the context so stage timings recorded in the pool reach this request's breakdown.
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, context.run, fn, *args)
+
+
+# --------------- Scorecards ---------------
+
+async def load_scorecard(match_id):
+    """
+    Async counterpart of app.load_scorecard(): cache, shared cache, archive, then Cricbuzz.
+
+    Args:
+        match_id (str): Cricbuzz match ID.
+
+    Returns:
+        Match: Complete scorecard.
+    """
+    match_id = str(match_id)
+    scorecard = scorecard_cache.get(match_id)
+    if scorecard is not None:
+        return scorecard
+    if shared_cache is not None:
+        data, ttl = await run_in_executor(shared_cache.get_with_ttl, f"scorecard:{match_id}")
+        scorecard = _cache_shared_scorecard(match_id, data, ttl)
+        if scorecard is not None:
+            return scorecard
+    if scorecard_archive is not None:
+        scorecard = await run_in_executor(scorecard_archive.get, match_id)
+        if scorecard is not None:
+            scorecard_cache.set(match_id, scorecard)
+            return scorecard
+    return await upstream_flight.do(("scorecard", match_id), _fetch_scorecard, match_id)
+
+
+async def _fetch_scorecard(match_id):
+    if shared_cache is None:
+        return await _scrape_scorecard(match_id)
+    lock, peer = await run_in_executor(shared_cache.claim_refresh, f"scorecard:{match_id}",
+                                       SHARED_CACHE_LOCK_WAIT, SHARED_SCORECARD_MIN_TTL, executor=lock_executor)
+    try:
+        if peer is not None:
+            return _cache_shared_scorecard(match_id, *peer)
+        return await _scrape_scorecard(match_id)
+    finally:
+        await run_in_executor(shared_cache.release_refresh, lock)
+
+
+async def _scrape_scorecard(match_id):
+    url = SCORECARD_URL + match_id
+    cricbuzz_resp = await async_http.get(url)
+    start = time.perf_counter()
+    scorecard = await run_in_executor(parse_pool.parse, cricbuzz_resp.text, url)
+    metrics.record_stage("parse", time.perf_counter() - start)
+
+    if cricbuzz_resp.status_code == 200:
+        await run_in_executor(store_scorecard, match_id, cricbuzz_resp.text, scorecard)
+    return scorecard
+
+
+async def fetch_live_ipl_match_id():
+    """
+    Find the first live IPL match ID; concurrent callers share one page fetch.
+
+    Uses the same schedule-aware cache as the Flask app: no fetch outside
+    match windows, and a stale answer is served while one background task
+    revalidates it.
+
+    Returns:
+        str: Cricbuzz match ID if found, else -1.
+    """
+    match_id, fresh = live_finder.lookup()
+    if match_id is None:
+        return await _refresh_live_match_id()
+    if not fresh and not _revalidations:
+        task = asyncio.create_task(_refresh_live_match_id())
+        _revalidations.add(task)
+        task.add_done_callback(_revalidations.discard)
+    return match_id
+
+
+async def _refresh_live_match_id():
+    return live_finder.record(await upstream_flight.do("live-page", _find_live_ipl_match_id))
+
+
+async def _find_live_ipl_match_id():
+    if shared_cache is None:
+        return await _scrape_live_ipl_match_id()
+    cached = await run_in_executor(shared_cache.get, "live-match-id")
+    if cached is not None:
+        return loads(cached)
+    lock, peer = await run_in_executor(shared_cache.claim_refresh, "live-match-id", executor=lock_executor)
+    try:
+        if peer is not None:
+            return loads(peer[0])
+        match_id = await _scrape_live_ipl_match_id()
+        await run_in_executor(shared_cache.set, "live-match-id", dumps(match_id), SHARED_LIVE_MATCH_ID_TTL)
+        return match_id
+    finally:
+        await run_in_executor(shared_cache.release_refresh, lock)
+
+
+async def _scrape_live_ipl_match_id():
+    try:
+        cricbuzz_resp = await async_http.get(LIVE_SCORES_URL)
+        return await run_in_executor(_parse_live_page, cricbuzz_resp.text)
+    except Exception as e:
+        logger.warning(f"Error fetching live match ID: {e}")
+        return -1
+
+
+def _parse_live_page(html):
+    return parse_live_ipl_match_id(parse_html(html, url=LIVE_SCORES_URL))
+
+
+# --------------- Routes ---------------
+
+async def get_entire_scorecard(request):
+    """Same contract as the Flask /scorecard and /scorecard/<match_id> views."""
+    match_id = request.path_params.get("match_id")
+    match_no = request.query_params.get("ipl_match_no")
+    if match_no is not None:
+        try:
+            match_no = int(match_no)
+        except ValueError:
+            match_no = None
+    if match_no is not None:
+        match_id = match_index.match_id_for(match_no, season=request.query_params.get("season"))
+        if match_id == -1:
+            return json_response({"message": "Invalid IPL match number."})
+    elif not match_id:
+        return json_response({"message": "Provide match_id or ipl_match_no."})
+
+    return scorecard_response(request, await load_scorecard(match_id), match_id=match_id)
+
+
+async def get_live_match_scorecard(request):
+    live_match_id = await fetch_live_ipl_match_id()
+    if live_match_id == -1:
+        return json_response({"message": "No live IPL match found."})
+    return scorecard_response(request, await load_scorecard(live_match_id), cache_control=LIVE_CACHE_CONTROL)
+
+
+async def get_scorecard_delta(request):
+    """Same contract as the Flask /scorecard/<match_id>/delta view."""
+    match_id = request.path_params["match_id"]
+    scorecard = await load_scorecard(match_id)
+    response = json_response(scorecard_deltas.delta(match_id, scorecard, request.query_params.get("since")))
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+async def fantasy_points(request):
+    match_id = request.query_params.get("match_id")
+    if not match_id:
+        return json_response({"message": "Provide match_id"})
+    try:
+        scoring = get_scoring_table(request.query_params.get("scoring", "default"))
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
+    scorecard = await load_scorecard(match_id)
+    fantasy_summary = compute_fantasy_points(scorecard, scoring)
+    logger.info(f"[Fantasy] Points for match {match_id} → {fantasy_summary}")
+    return json_response(fantasy_summary)
+
+
+async def debug_stats(request):
+    return json_response({
+        "scorecard_cache": scorecard_cache.stats(),
+        "shared_cache": shared_cache.stats() if shared_cache is not None else None,
+        "upstream_flight": upstream_flight.stats(),
+        "parse_pool": parse_pool.stats(),
+        "live_match": live_finder.stats(),
+        "upstream": upstream_stats()
+    })
+
+
+async def metrics_endpoint(request):
+    return Response(metrics.render(), headers={"Content-Type": metrics.CONTENT_TYPE})
+
+
+class RequestMetricsMiddleware:
+    """Request count, latency, in-flight gauge and optional Server-Timing, as in the Flask app."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        timings = metrics.start_request_timings()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if SERVER_TIMING:
+                    header = metrics.server_timing_header(dict(timings, total=time.perf_counter() - start))
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        metrics.IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.IN_FLIGHT.dec()
+            route = scope.get("route")
+            endpoint = route.path if route is not None else "unmatched"
+            metrics.REQUESTS.inc(endpoint=endpoint, status=status["code"])
+            metrics.REQUEST_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    prewarmer.ensure_started()
+    yield
+    prewarmer.stop()
+    await async_http.aclose()
+    parse_executor.shutdown(wait=False)
+    lock_executor.shutdown(wait=False)
+    parse_pool.shutdown()
+
+
+app = Starlette(
+    routes=[
+        Route("/scorecard/live", get_live_match_scorecard),
+        Route("/scorecard/{match_id}/delta", get_scorecard_delta),
+        Route("/scorecard/{match_id}", get_entire_scorecard),
+        Route("/scorecard", get_entire_scorecard),
+        Route("/fantasy/points", fantasy_points),
+        Route("/debug/stats", debug_stats),
+        Route("/metrics", metrics_endpoint),
+    ],
+    middleware=[Middleware(RequestMetricsMiddleware), Middleware(CORSMiddleware, allow_origins=["*"])],
+    lifespan=lifespan
+)
@@ -0,0 +1,87 @@
+"""
+Benchmark live-scorecard updates: full snapshots vs sequenced JSON Patches.
+
+Usage:
+    python benchmarks/bench_delta.py [--updates 120] [--fixture playing.html]
+
+Starting from the playing.html scorecard, each simulated update advances one
+delivery: the striker's runs and balls, the bowler's figures and the innings
+total change. Reports payload bytes per update and the client's cost to
+decode a full snapshot vs decoding and applying the patch.
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import jsonpatch  # noqa: E402
+from utils.deltas import DeltaTracker  # noqa: E402
+from utils.scorecard import parse_scorecard_html  # noqa: E402
+
+
+def next_delivery(scorecard, ball):
+    """Return a copy of the scorecard one delivery later."""
+    card = copy.deepcopy(scorecard)
+    batting, bowling, score = card["Innings2"][0]["Batsman"], card["Innings2"][1]["Bowlers"], card["Innings2"][2]
+    runs = (1, 0, 4, 1, 6, 0)[ball % 6]
+    batter = batting[ball % 2]
+    batter["runs"] = str(int(batter["runs"]) + runs)
+    batter["balls"] = str(int(batter["balls"]) + 1)
+    bowler = bowling[(ball // 6) % len(bowling)]
+    bowler["runs"] = str(int(bowler["runs"]) + runs)
+    bowler["overs"] = f"{int(float(bowler['overs']))}.{ball % 6}"
+    score["runs"] += runs
+    score["score"] = f"{score['runs']}-{score['wickets']} ({score['overs']} Ov)"
+    return card
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--updates", type=int, default=120)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    with open(args.fixture, "r", encoding="utf-8") as f:
+        scorecard = parse_scorecard_html(f.read()).to_dict()
+
+    tracker = DeltaTracker()
+    initial = tracker.delta("1", scorecard)
+    client = json.loads(json.dumps(initial["scorecard"]))
+    seq = initial["seq"]
+    full_payloads, patch_payloads = [], []
+    for ball in range(args.updates):
+        scorecard = next_delivery(scorecard, ball)
+        full_payloads.append(json.dumps(scorecard).encode())
+        delta = tracker.delta("1", scorecard, since=seq)
+        assert delta["type"] == "patch"
+        seq = delta["seq"]
+        patch_payloads.append(json.dumps(delta).encode())
+
+    # Client side: decode every full snapshot vs decode + apply every patch.
+    start = time.perf_counter()
+    for payload in full_payloads:
+        json.loads(payload)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in patch_payloads:
+        client = jsonpatch.apply(client, json.loads(payload)["patch"])
+    patch_time = time.perf_counter() - start
+    assert client == scorecard, "patched client diverged from the server snapshot"
+
+    full_bytes = sum(map(len, full_payloads)) / args.updates
+    patch_bytes = sum(map(len, patch_payloads)) / args.updates
+    print(f"updates: {args.updates}")
+    print(f"full snapshot : {full_bytes:8.0f} bytes/update  {full_time / args.updates * 1e6:8.1f} us client decode")
+    print(f"json patch    : {patch_bytes:8.0f} bytes/update  {patch_time / args.updates * 1e6:8.1f} us client decode+apply")
+    print(f"reduction     : {full_bytes / patch_bytes:8.1f}x bytes          {full_time / patch_time:8.1f}x client time")
+
+
+if __name__ == "__main__":
+    main()
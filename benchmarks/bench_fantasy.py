@@ -0,0 +1,64 @@
+"""
+Benchmark season-wide fantasy scoring: per-player calculate_total_points() vs the vectorized engine.
+
+Usage:
+    python benchmarks/bench_fantasy.py [--matches 74] [--iterations 20]
+
+The playing.html scorecard is replicated ``--matches`` times to stand in for a season.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.fantasy_engine import SeasonStats  # noqa: E402
+from utils.fantasy_points import calculate_total_points  # noqa: E402
+from utils.scorecard import parse_scorecard_html  # noqa: E402
+
+
+def per_player_season(scorecards):
+    """The /fantasy/points loop, run once per match."""
+    totals = {}
+    for _, _, scorecard in scorecards:
+        for innings in scorecard.innings:
+            for row in innings.batting + innings.bowling:
+                totals[row.name] = totals.get(row.name, 0) + calculate_total_points(row)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--matches", type=int, default=74)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "playing.html"), "r", encoding="utf-8") as f:
+        scorecard = parse_scorecard_html(f.read())
+    scorecards = [(str(i), "IPL2024", scorecard) for i in range(args.matches)]
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        per_player_season(scorecards)
+    scalar = (time.perf_counter() - start) / args.iterations
+
+    start = time.perf_counter()
+    stats = SeasonStats.from_scorecards(scorecards)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        stats.leaderboard(limit=20)
+    vectorized = (time.perf_counter() - start) / args.iterations
+
+    print(f"matches: {args.matches}, player-match rows: {len(stats)}")
+    print(f"per-player scoring loop : {scalar * 1000:8.3f} ms/season")
+    print(f"columnar build (once)   : {build * 1000:8.3f} ms")
+    print(f"vectorized leaderboard  : {vectorized * 1000:8.3f} ms/season")
+
+
+if __name__ == "__main__":
+    main()
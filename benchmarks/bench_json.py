@@ -0,0 +1,65 @@
+"""
+Benchmark response encoding: stdlib json vs orjson vs pre-serialized payloads.
+
+Usage:
+    python benchmarks/bench_json.py [--iterations 200] [--fixture playing.html]
+
+Encodes the full match list (match_ids.json) and a completed scorecard the
+way the API serves them, and reports the cost per response of encoding with
+the json module, encoding with orjson, gzip-compressing every response, and
+serving a Payload that was encoded and compressed once.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import json_codec  # noqa: E402
+from utils.json_codec import Payload  # noqa: E402
+from utils.scorecard import parse_scorecard_html  # noqa: E402
+
+
+def per_call_us(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "match_ids.json"), "rb") as f:
+        match_list = json.load(f)
+    with open(args.fixture, encoding="utf-8") as f:
+        scorecard = parse_scorecard_html(f.read()).to_dict()
+
+    for name, document in (("match list", match_list), ("scorecard", scorecard)):
+        payload = Payload.from_obj(document)
+        payload.encoded("gzip")
+        cases = {
+            "json module": lambda: json.dumps(document, sort_keys=True, separators=(",", ":")).encode(),
+            "orjson": lambda: json_codec.orjson.dumps(document, option=json_codec._ORJSON_OPTIONS),
+            "json module + gzip": lambda: gzip.compress(
+                json.dumps(document, sort_keys=True, separators=(",", ":")).encode(), 6),
+            "payload (identity)": lambda: payload.encoded(None),
+            "payload (gzip)": lambda: payload.encoded("gzip"),
+        }
+        if json_codec.orjson is None:
+            del cases["orjson"]
+        print(f"{name}: {len(payload)} bytes, {len(payload.encoded('gzip')[0])} gzipped")
+        for case, fn in cases.items():
+            print(f"  {case:20s} {per_call_us(fn, args.iterations):10.1f} us/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark live match discovery: scraping the live-scores page per request vs the schedule-aware cache.
+
+Usage:
+    python benchmarks/bench_live.py [--days 7] [--request-interval 5]
+
+Replays ``--days`` of the latest season in match_ids.json on a simulated
+clock, with one /scorecard/live lookup every ``--request-interval`` seconds,
+and counts the live-scores page fetches each approach needs.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.live_schedule import IN_WINDOW, LIVE_MATCH_DURATION, LiveMatchFinder, LiveSchedule  # noqa: E402
+from utils.match_index import MatchIndex  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--request-interval", type=float, default=5)
+    args = parser.parse_args()
+
+    index = MatchIndex(os.path.join(ROOT, "match_ids.json"))
+    index.reload()
+    season = index.latest_season()
+    year = int(season[3:])
+    now = [datetime(year, 4, 1, tzinfo=timezone.utc).timestamp()]
+    clock = lambda: now[0]  # noqa: E731
+    schedule = LiveSchedule(index, clock=clock)
+
+    def fetch():
+        # Stand-in for the live-scores page: a match is on until 3.5 hours after its start.
+        state, end = schedule.window()
+        return "1" if state == IN_WINDOW and end - now[0] > LIVE_MATCH_DURATION - 3.5 * 3600 else -1
+
+    finder = LiveMatchFinder(fetch, schedule, is_finished=lambda match_id: fetch() == -1, clock=clock)
+    # Background revalidation would run on a thread; refresh inline so the count is deterministic.
+    finder.revalidate_in_background = finder.refresh
+
+    requests = 0
+    in_window = 0
+    end = now[0] + args.days * 86400
+    start = time.perf_counter()
+    while now[0] < end:
+        finder.get()
+        requests += 1
+        in_window += schedule.window()[0] == IN_WINDOW
+        now[0] += args.request_interval
+    elapsed = time.perf_counter() - start
+
+    print(f"season: {season}, simulated days: {args.days}, lookups: {requests:,} ({in_window:,} inside match windows)")
+    print(f"live-page fetches, scrape per request : {requests:9,}")
+    print(f"live-page fetches, schedule-aware     : {finder.fetches:9,}")
+    print(f"lookups answered without a fetch      : {finder.hits + finder.stale_hits + finder.skipped:9,}")
+    print(f"time per simulated request            : {elapsed / requests * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark /get_all_matches: the full list vs filtered, paginated, projected pages.
+
+Usage:
+    python benchmarks/bench_match_list.py [--iterations 200]
+
+Calls the Flask app in-process (no network) and reports response bytes and
+time per request for each query, so the cost of building and serializing the
+response can be compared with how much of the list was asked for.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from app import app  # noqa: E402
+
+QUERIES = {
+    "full list": "/get_all_matches",
+    "season": "/get_all_matches?season=2024&limit=100",
+    "team + status": "/get_all_matches?team=kolkata&status=completed&limit=100",
+    "venue, 20 rows": "/get_all_matches?venue=wankhede&limit=20",
+    "ids only, 20 rows": "/get_all_matches?limit=20&fields=match_id",
+    "team, ids only": "/get_all_matches?team=chennai&fields=match_id,season&limit=1000",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    print(f"{'query':20s} {'bytes':>9s} {'us/request':>11s}")
+    for name, path in QUERIES.items():
+        body = client.get(path).data
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            client.get(path)
+        elapsed = (time.perf_counter() - start) / args.iterations
+        print(f"{name:20s} {len(body):9d} {elapsed * 1e6:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark the typed scorecard model against the dict-of-strings form it replaced.
+
+Usage:
+    python benchmarks/bench_model.py [--copies 200] [--iterations 2000] [--fixture playing.html]
+
+Reports the memory held by ``--copies`` cached scorecards in each form
+(measured with tracemalloc) and the cost of scoring one scorecard for
+/fantasy/points: the old loop converting strings into a 13-key stats dict per
+player, against scoring the parsed rows directly.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.fantasy_points import STAT_FIELDS, calculate_total_points  # noqa: E402
+from utils.json_codec import dumps, loads  # noqa: E402
+from utils.model import BattingRow, Match  # noqa: E402
+from utils.scorecard import parse_scorecard_html  # noqa: E402
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def legacy_fantasy_points(scorecard):
+    """The pre-model /fantasy/points loop over the dict form."""
+    summary = {}
+    for inning in ('Innings1', 'Innings2'):
+        for batter in scorecard[inning][0]['Batsman']:
+            stats = dict.fromkeys(STAT_FIELDS, 0)
+            stats.update(runs=_int(batter.get('runs')), fours=_int(batter.get('fours')),
+                         sixes=_int(batter.get('sixes')), balls_faced=_int(batter.get('balls')),
+                         dismissed=int(batter.get('dismissal', '').strip().lower() not in BattingRow.NOT_OUT))
+            summary[batter.get('name')] = calculate_total_points(stats)
+        for bowler in scorecard[inning][1]['Bowlers']:
+            stats = dict.fromkeys(STAT_FIELDS, 0)
+            stats.update(wickets=_int(bowler.get('wicket')), overs_bowled=float(bowler.get('overs')),
+                         runs_conceded=_int(bowler.get('runs')), maidens=_int(bowler.get('maidens')))
+            name = bowler.get('name')
+            summary[name] = summary.get(name, 0) + calculate_total_points(stats)
+    return summary
+
+
+def model_fantasy_points(match):
+    summary = {}
+    for innings in match.innings:
+        for row in innings.batting + innings.bowling:
+            summary[row.name] = summary.get(row.name, 0) + calculate_total_points(row)
+    return summary
+
+
+def held_bytes(build, copies):
+    """Bytes still allocated after building ``copies`` independent objects."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build() for _ in range(copies)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    with open(args.fixture, encoding="utf-8") as f:
+        match = parse_scorecard_html(f.read())
+    encoded = dumps(match)
+    assert model_fantasy_points(match) == legacy_fantasy_points(match.to_dict())
+
+    # Decoding JSON gives every copy its own strings, like separately parsed scorecards.
+    dict_bytes = held_bytes(lambda: loads(encoded), args.copies)
+    model_bytes = held_bytes(lambda: Match.from_dict(loads(encoded)), args.copies)
+    print(f"cached scorecard : dict form {dict_bytes / 1024:7.1f} KiB   model {model_bytes / 1024:7.1f} KiB   "
+          f"({dict_bytes / model_bytes:.1f}x smaller)")
+
+    document = match.to_dict()
+    timings = {}
+    for name, fn, card in (("dict form", legacy_fantasy_points, document), ("model", model_fantasy_points, match)):
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            fn(card)
+        timings[name] = (time.perf_counter() - start) / args.iterations * 1e6
+    print(f"fantasy points   : dict form {timings['dict form']:7.1f} us     model {timings['model']:7.1f} us     "
+          f"({timings['dict form'] / timings['model']:.1f}x faster)")
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        match.to_dict()
+    print(f"to_dict          : {(time.perf_counter() - start) / args.iterations * 1e6:7.1f} us per scorecard")
+
+
+if __name__ == "__main__":
+    main()
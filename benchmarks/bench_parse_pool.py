@@ -0,0 +1,56 @@
+"""
+Benchmark scorecard parsing throughput: threads (GIL-bound) vs the process pool.
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--parses 200] [--max-workers <cores>]
+
+Parses the playing.html fixture ``--parses`` times with 1..max-workers concurrent
+callers, once with every parse inline on a thread and once offloaded to a
+ParsePool of the same size.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.parse_pool import ParsePool  # noqa: E402
+
+
+def throughput(pool, html, parses, callers):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        list(executor.map(lambda _: pool.parse(html), range(parses)))
+    return parses / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parses", type=int, default=200)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    with open(args.fixture, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    inline = ParsePool(size=0)
+    print(f"{os.cpu_count()} CPU(s), {args.parses} parses per run")
+    print(f"{'workers':>7}  {'threads parses/s':>16}  {'processes parses/s':>18}")
+    workers = 1
+    while workers <= args.max_workers:
+        pool = ParsePool(size=workers, inline_below=0)
+        throughput(pool, html, workers * 2, workers)  # start the worker processes
+        threaded = throughput(inline, html, args.parses, workers)
+        offloaded = throughput(pool, html, args.parses, workers)
+        pool.shutdown()
+        print(f"{workers:>7}  {threaded:>16.1f}  {offloaded:>18.1f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark the single-pass scorecard parser against the legacy per-cell XPath extractors.
+
+Usage:
+    python benchmarks/bench_parser.py [--iterations 200] [--fixture playing.html]
+
+The legacy extractors below are the pre-refactor implementation, kept only as a
+baseline: they evaluate one absolute XPath per cell and stop after a fixed number
+of rows.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.html_backend import parse_html  # noqa: E402
+from utils.scorecard import (  # noqa: E402
+    get_playing_eleven, get_result_update, get_toss, parse_scorecard,
+)
+
+
+def legacy_batting(innings, response):
+    batting = []
+    for i in range(3, 13):
+        try:
+            batting.append({
+                "name": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[1]/a/text()').extract()[0].strip(),
+                "dismissal": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[2]/span/text()').extract()[0].strip(),
+                "runs": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[3]/text()').extract()[0].strip(),
+                "balls": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[4]/text()').extract()[0].strip(),
+                "fours": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[5]/text()').extract()[0].strip(),
+                "sixes": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[6]/text()').extract()[0].strip(),
+                "sr": response.xpath(f'//*[@id={innings}]/div[1]/div[{i}]/div[7]/text()').extract()[0].strip()
+            })
+        except IndexError:
+            pass
+    return batting
+
+
+def legacy_bowling(innings, response):
+    bowling = []
+    for i in range(2, 13):
+        try:
+            bowling.append({
+                "name": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[1]/a/text()').extract()[0].strip(),
+                "overs": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[2]/text()').extract()[0].strip(),
+                "maidens": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[3]/text()').extract()[0].strip(),
+                "runs": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[4]/text()').extract()[0].strip(),
+                "wicket": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[5]/text()').extract()[0].strip(),
+                "economy": response.xpath(f'//*[@id={innings}]/div[4]/div[{i}]/div[8]/text()').extract()[0].strip()
+            })
+        except IndexError:
+            pass
+    return bowling
+
+
+def legacy_score(innings, response):
+    try:
+        team = response.xpath(f'//*[@id={innings}]/div[1]/div[1]/span[1]/text()').extract()[0].replace("Innings", "").strip()
+        score = response.xpath(f'//*[@id={innings}]/div[1]/div[1]/span[2]/text()').extract()[0].replace("Innings", "").strip()
+        return {
+            "team": team,
+            "score": score,
+            "runs": int(score.split('-')[0].strip()),
+            "wickets": int(score.split('-')[1].split('(')[0].strip()),
+            "overs": score.split('(')[1].split(')')[0].replace('Ov', '').strip()
+        }
+    except Exception:
+        return {}
+
+
+def legacy_parse(response):
+    scorecard = {}
+    for number in (1, 2):
+        innings = f'"innings_{number}"'
+        scorecard[f"Innings{number}"] = [{"Batsman": legacy_batting(innings, response)},
+                                         {"Bowlers": legacy_bowling(innings, response)},
+                                         legacy_score(innings, response)]
+    scorecard["Result"] = get_result_update(response)
+    scorecard["Playing_Eleven"] = get_playing_eleven(response)
+    scorecard["Toss_Result"] = get_toss(response)
+    return scorecard
+
+
+def check_equivalent(legacy, current):
+    """The new parser must reproduce every legacy row and may only add rows past the old limits."""
+    for innings in ("Innings1", "Innings2"):
+        for index, key in ((0, "Batsman"), (1, "Bowlers")):
+            old_rows = legacy[innings][index][key]
+            new_rows = current[innings][index][key]
+            assert new_rows[:len(old_rows)] == old_rows, f"{innings} {key} rows differ"
+        assert legacy[innings][2] == current[innings][2], f"{innings} score differs"
+    for key in ("Result", "Playing_Eleven", "Toss_Result"):
+        assert legacy[key] == current[key], f"{key} differs"
+
+
+def timed(func, body, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        # Build a fresh response each time so lxml's parse cost is included for both.
+        func(parse_html(body, url="https://www.cricbuzz.com/"))
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    with open(args.fixture, "r", encoding="utf-8") as f:
+        body = f.read()
+
+    response = parse_html(body, url="https://www.cricbuzz.com/")
+    legacy, current = legacy_parse(response), parse_scorecard(response)
+    check_equivalent(legacy, current)
+
+    legacy_time = timed(legacy_parse, body, args.iterations)
+    current_time = timed(parse_scorecard, body, args.iterations)
+    rows = lambda card: sum(len(card[i][0]["Batsman"]) + len(card[i][1]["Bowlers"]) for i in ("Innings1", "Innings2"))
+
+    print(f"fixture: {args.fixture} ({len(body)} bytes), iterations: {args.iterations}")
+    print(f"legacy per-cell XPath : {legacy_time * 1000:8.3f} ms/scorecard ({rows(legacy)} rows)")
+    print(f"single-pass parser    : {current_time * 1000:8.3f} ms/scorecard ({rows(current)} rows)")
+    print(f"speedup               : {legacy_time / current_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
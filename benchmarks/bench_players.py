@@ -0,0 +1,88 @@
+"""
+Benchmark player career lookups: re-scoring archived scorecards vs the player index.
+
+Usage:
+    python benchmarks/bench_players.py [--matches 1000] [--iterations 200]
+
+The playing.html scorecard is archived ``--matches`` times (in a temporary
+SQLite file) across the seasons of match_ids.json to stand in for the full history.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.archive import ScorecardArchive  # noqa: E402
+from utils.fantasy_engine import SeasonStats  # noqa: E402
+from utils.player_index import PlayerIndex  # noqa: E402
+from utils.scorecard import parse_scorecard_html  # noqa: E402
+
+PLAYER = "Sunil Narine"
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "playing.html"), "r", encoding="utf-8") as f:
+        html = f.read()
+    scorecard = parse_scorecard_html(html)
+    with open(os.path.join(ROOT, "match_ids.json"), "r") as f:
+        seasons = sorted(json.load(f))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = ScorecardArchive(os.path.join(tmp, "scorecards.db"))
+        for i in range(args.matches):
+            archive.put(str(i), html, scorecard, season=seasons[i % len(seasons)])
+        season = seasons[-1]
+
+        def rescore():
+            return SeasonStats.from_scorecards(archive.iter_scorecards()).player_summary(PLAYER)
+
+        rescan = timed(rescore, max(1, args.iterations // 100))
+
+        index = PlayerIndex()
+        start = time.perf_counter()
+        index.sync(archive, lambda match_id: None)
+        build = time.perf_counter() - start
+
+        index_path = os.path.join(tmp, "player_index.json")
+        index.save(index_path)
+        size = os.path.getsize(index_path)
+        load = timed(lambda: PlayerIndex.load(index_path), 3)
+
+    index = PlayerIndex()
+    for i in range(args.matches):
+        index.add_match(str(i), seasons[i % len(seasons)], scorecard)
+    add = timed(lambda: index.add_match(str(args.matches + 1), season, scorecard), 1)
+    career = timed(lambda: index.career(PLAYER), args.iterations)
+    season_lines = timed(lambda: index.season(PLAYER, season), args.iterations)
+    find = timed(lambda: index.find("narine"), args.iterations)
+
+    print(f"matches: {args.matches}, players: {len(index)}")
+    print(f"re-score archive per lookup : {rescan * 1000:9.2f} ms")
+    print(f"index build from archive    : {build * 1000:9.2f} ms (once)")
+    print(f"index load from file        : {load * 1000:9.2f} ms ({size / 1024:.0f} KiB)")
+    print(f"add one completed match     : {add * 1e6:9.1f} us")
+    print(f"career lookup               : {career * 1e6:9.1f} us")
+    print(f"season lookup with lines    : {season_lines * 1e6:9.1f} us")
+    print(f"partial-name find           : {find * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the Flask (gunicorn) and async (uvicorn) serving paths side by side.
+
+Usage:
+    python benchmarks/bench_serving.py [--requests 400] [--concurrency 50] [--latency-ms 200]
+
+Both servers fetch from a local stub upstream (benchmarks/stub_upstream.py)
+with the scorecard cache and archive disabled and a distinct match_id per
+request, so every request pays the full upstream round-trip plus a parse.
+"""
+
+import argparse
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadtest import run_load, start_server, stop_server  # noqa: E402
+from stub_upstream import serve_in_background  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4, help="gunicorn threads per worker")
+    args = parser.parse_args()
+
+    stub = serve_in_background(latency=args.latency_ms / 1000)
+    env = dict(os.environ,
+               CRICBUZZ_BASE_URL=f"http://127.0.0.1:{stub.server_port}",
+               SCORECARD_CACHE_SIZE="0",
+               SCORECARD_ARCHIVE_PATH="",
+               UPSTREAM_RETRIES="0")
+
+    servers = {
+        f"flask  (gunicorn {args.workers}x{args.threads} threads)": (
+            [sys.executable, "-m", "gunicorn", "-w", str(args.workers), "--threads", str(args.threads),
+             "-b", "127.0.0.1:8901", "app:app"], 8901),
+        f"asgi   (uvicorn {args.workers} workers)": (
+            [sys.executable, "-m", "uvicorn", "--workers", str(args.workers), "--log-level", "warning",
+             "--port", "8902", "asgi:app"], 8902),
+    }
+
+    bodies = []
+    print(f"{args.requests} requests, concurrency {args.concurrency}, upstream latency {args.latency_ms:.0f} ms")
+    for offset, (label, (command, port)) in enumerate(servers.items()):
+        process = start_server(command, port, env)
+        try:
+            bodies.append(requests.get(f"http://127.0.0.1:{port}/scorecard/1").content)
+            first_id = (offset + 1) * 100000
+            paths = [f"/scorecard/{first_id + i}" for i in range(args.requests)]
+            result = run_load(f"http://127.0.0.1:{port}", paths, args.concurrency)
+        finally:
+            stop_server(process)
+        print(f"{label:36s} {result['requests_per_s']:8.1f} req/s  p50 {result['p50_ms']:7.1f} ms  "
+              f"p95 {result['p95_ms']:7.1f} ms  errors {result['errors']}")
+
+    print("identical responses:", bodies[0] == bodies[1])
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure worker startup cost per HTML parser backend: import time and resident memory.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+
+Each run is a fresh interpreter that imports app.py (as a gunicorn worker
+does) and parses one scorecard. With HTML_PARSER_BACKEND=scrapy that first
+parse pulls in Scrapy/Twisted, which is what every worker paid before the lxml
+backend; with the default lxml backend Scrapy is never imported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+from utils.scorecard import parse_scorecard_html
+with open("playing.html", encoding="utf-8") as f:
+    parse_scorecard_html(f.read())
+ready = time.perf_counter() - start
+print(json.dumps({
+    "import_s": imported,
+    "first_parse_s": ready,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": len(sys.modules),
+    "scrapy_loaded": "scrapy" in sys.modules
+}))
+"""
+
+
+def probe(backend):
+    env = dict(os.environ, HTML_PARSER_BACKEND=backend, SCORECARD_ARCHIVE_PATH="")
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'backend':8s} {'import app':>11s} {'+1st parse':>11s} {'max RSS':>9s} {'modules':>8s}  scrapy")
+    for backend in ("scrapy", "lxml"):
+        runs = [probe(backend) for _ in range(args.runs)]
+        median = lambda key: statistics.median(run[key] for run in runs)
+        print(f"{backend:8s} {median('import_s') * 1000:9.0f}ms {median('first_parse_s') * 1000:9.0f}ms "
+              f"{median('rss_mb'):7.1f}MB {median('modules'):8.0f}  {runs[0]['scrapy_loaded']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark /stats aggregates: scanning match_ids.json per request vs precomputed documents.
+
+Usage:
+    python benchmarks/bench_stats.py [--iterations 200]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.match_index import MatchIndex  # noqa: E402
+from utils.match_stats import MatchStats, SeasonAggregate, parse_result  # noqa: E402
+
+
+def scan_head_to_head(data, team, opponent):
+    """What answering one head-to-head query costs without the aggregates."""
+    record = {"matches": 0, team: 0, opponent: 0}
+    for matches in data.values():
+        for match in matches:
+            parsed = parse_result(match)
+            if parsed is not None and set(parsed["teams"]) == {team, opponent}:
+                record["matches"] += 1
+                if parsed["winner"] is not None:
+                    record[parsed["winner"]] += 1
+    return record
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "match_ids.json")
+        shutil.copy(os.path.join(ROOT, "match_ids.json"), path)
+        index = MatchIndex(path)
+        index.reload()
+        data = index.data
+        stats = MatchStats(index)
+
+        scan = timed(lambda: scan_head_to_head(data, "KOLKATA KNIGHT RIDERS", "MUMBAI INDIANS"),
+                     max(1, args.iterations // 10))
+        start = time.perf_counter()
+        stats.current()
+        build = time.perf_counter() - start
+        lookup = timed(lambda: stats.head_to_head("KOLKATA KNIGHT RIDERS", "MUMBAI INDIANS"), args.iterations)
+        partial = timed(lambda: stats.head_to_head("kolkata", "mumbai"), args.iterations)
+        standings = timed(lambda: stats.standings("IPL2024"), args.iterations)
+        full_seasons = timed(lambda: [SeasonAggregate(season, matches) for season, matches in data.items()], 5)
+
+        latest = index.latest_season()
+        changed = json.loads(json.dumps(data))
+        changed[latest][0]["match_result"] = "Match abandoned"
+        with open(path, "w") as f:
+            json.dump(changed, f)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        index.current()
+        start = time.perf_counter()
+        stats.current()
+        incremental = time.perf_counter() - start
+
+    print(f"matches: {sum(len(m) for m in data.values())}, seasons: {len(data)}")
+    print(f"scan per head-to-head query  : {scan * 1e6:9.1f} us")
+    print(f"full build (all seasons)      : {build * 1000:9.2f} ms (season parsing alone {full_seasons * 1000:.2f} ms)")
+    print(f"update after one season change: {incremental * 1000:9.2f} ms")
+    print(f"head-to-head lookup           : {lookup * 1e6:9.1f} us")
+    print(f"head-to-head, partial names   : {partial * 1e6:9.1f} us")
+    print(f"standings lookup              : {standings * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Helpers shared by the end-to-end benchmarks: start an API server and drive load at it.
+"""
+
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(command, port, env, timeout=30):
+    """Start a server process and wait until it answers HTTP on ``port``."""
+    process = subprocess.Popen(command, cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/scorecard", timeout=5)
+            return process
+        except requests.RequestException:
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(f"Server did not start: {' '.join(command)}")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_load(base_url, paths, concurrency):
+    """
+    Request every path once, ``concurrency`` at a time, over keep-alive sessions.
+
+    Args:
+        base_url (str): Server root, e.g. http://127.0.0.1:8901.
+        paths (list): Request paths.
+        concurrency (int): Concurrent clients.
+
+    Returns:
+        dict: Throughput, latency percentiles (ms) and error count.
+    """
+    sessions = {}
+
+    def one(i):
+        session = sessions.setdefault(i % concurrency, requests.Session())
+        start = time.perf_counter()
+        try:
+            status = session.get(base_url + paths[i], timeout=60).status_code
+        except requests.RequestException:
+            status = None
+        return time.perf_counter() - start, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(len(paths))))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(seconds * 1000 for seconds, _ in results)
+    return {
+        "requests": len(paths),
+        "concurrency": concurrency,
+        "requests_per_s": round(len(paths) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2),
+        "errors": sum(1 for _, status in results if status != 200)
+    }
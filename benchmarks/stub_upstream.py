@@ -0,0 +1,118 @@
+"""
+Local stand-in for Cricbuzz used by the serving benchmarks.
+
+Serves recorded fixtures after a configurable delay (latency +/- jitter):
+
+- ``/api/html/cricket-scorecard/<id>``: playing.html
+- ``/cricket-series/<id>/<slug>/matches``: matches.html
+- ``/cricket-series``: a series page linking every season in ipl_series.json
+- ``/cricket-match/live-scores``: a page linking one live IPL match
+
+Usage:
+    python benchmarks/stub_upstream.py [--port 8900] [--latency-ms 200] [--jitter-ms 50]
+
+Point the API at it with CRICBUZZ_BASE_URL=http://127.0.0.1:8900.
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LIVE_PAGE = (
+    '<html><body>'
+    '<a href="/live-cricket-scores/12345/kkr-vs-pbks-indian-premier-league-2025">KKR vs PBKS</a>'
+    '</body></html>'
+)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, fixture=os.path.join(ROOT, "playing.html"), latency=0.0, jitter=0.0,
+                 matches_fixture=os.path.join(ROOT, "matches.html"),
+                 series_file=os.path.join(ROOT, "ipl_series.json")):
+        super().__init__(address, StubHandler)
+        with open(fixture, "rb") as f:
+            self.scorecard_body = f.read()
+        with open(matches_fixture, "rb") as f:
+            self.matches_body = f.read()
+        self.series_body = series_page(series_file)
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def delay(self):
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        with self.server._lock:
+            self.server.requests += 1
+        time.sleep(self.server.delay())
+        if self.path.startswith("/api/html/cricket-scorecard/"):
+            self._send(200, self.server.scorecard_body)
+        elif self.path.startswith("/cricket-series/") and self.path.endswith("/matches"):
+            self._send(200, self.server.matches_body)
+        elif self.path.rstrip("/") == "/cricket-series":
+            self._send(200, self.server.series_body)
+        elif self.path.startswith("/cricket-match/live-scores"):
+            self._send(200, LIVE_PAGE.encode("utf-8"))
+        else:
+            self._send(404, b"not found")
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def series_page(series_file):
+    """Build a series listing page with one link per season, shaped like Cricbuzz's."""
+    with open(series_file, "r") as f:
+        series = json.load(f)
+    links = "".join(
+        f'<a href="/cricket-series/{series_id}/indian-premier-league-{season[-4:]}">IPL {season[-4:]}</a>'
+        for season, series_id in series.items())
+    return f"<html><body>{links}</body></html>".encode("utf-8")
+
+
+def serve_in_background(port=0, latency=0.0, jitter=0.0, **fixtures):
+    """Start a stub server on a daemon thread and return it (``server.server_port`` is the bound port)."""
+    server = StubServer(("127.0.0.1", port), latency=latency, jitter=jitter, **fixtures)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Cricbuzz stub")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--fixture", default=os.path.join(ROOT, "playing.html"))
+    args = parser.parse_args()
+
+    server = StubServer(("127.0.0.1", args.port), args.fixture,
+                        args.latency_ms / 1000, args.jitter_ms / 1000)
+    print(f"Stub upstream on http://127.0.0.1:{args.port} "
+          f"({args.latency_ms:.0f} ms latency, +/-{args.jitter_ms:.0f} ms jitter)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Benchmark and load-test suite against a local Cricbuzz stand-in.
+
+Usage:
+    python benchmarks/suite.py [--output benchmarks/results/latest.json] [--baseline old.json]
+                               [--latency-ms 100] [--jitter-ms 25] [--requests 200] [--concurrency 20]
+                               [--server flask|asgi] [--skip-micro] [--skip-e2e]
+
+Micro-benchmarks time every scorecard extractor on playing.html, match-card
+parsing on matches.html and fetch_matches_for_season against the stub. The
+end-to-end load tests start the API under gunicorn (or uvicorn with
+``--server asgi``) pointed at benchmarks/stub_upstream.py, then drive
+/scorecard/<id> (cache misses and hits), /scorecard/live and /fantasy/points.
+
+Results are written as JSON. With ``--baseline`` every micro median and
+end-to-end p50/throughput is compared with an earlier run, and the exit status
+is 1 if anything regressed by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Season fetches are rate limited for politeness towards Cricbuzz; the stub needs no such care.
+os.environ.setdefault("CRICBUZZ_RATE_LIMIT", "0")
+
+from loadtest import run_load, start_server, stop_server  # noqa: E402
+from stub_upstream import serve_in_background  # noqa: E402
+
+from utils import http_client  # noqa: E402
+from utils.fetcher import fetch_matches_for_season, parse_match_cards  # noqa: E402
+from utils.html_backend import parse_html  # noqa: E402
+from utils.scorecard import (  # noqa: E402
+    get_batting_scorecard, get_bowling_scorecard, get_playing_eleven, get_result_update, get_scores,
+    get_toss, parse_batting_rows, parse_bowling_rows, parse_innings_score, parse_scorecard,
+    parse_scorecard_html,
+)
+
+
+def micro(fn, iterations, repeat=5):
+    """Time ``fn()``; returns per-call statistics in microseconds over ``repeat`` batches."""
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        per_call.append((time.perf_counter() - start) / iterations * 1e6)
+    return {
+        "iterations": iterations * repeat,
+        "median_us": round(statistics.median(per_call), 2),
+        "min_us": round(min(per_call), 2),
+        "max_us": round(max(per_call), 2)
+    }
+
+
+def run_micro(stub_url, iterations):
+    with open(os.path.join(ROOT, "playing.html"), encoding="utf-8") as f:
+        scorecard_html = f.read()
+    with open(os.path.join(ROOT, "matches.html"), encoding="utf-8") as f:
+        matches_html = f.read()
+
+    doc = parse_html(scorecard_html)
+    container = doc.xpath('//*[@id="innings_1"]')[0].root
+    matches_doc = parse_html(matches_html)
+
+    cases = {
+        "parse_html": lambda: parse_html(scorecard_html),
+        "parse_batting_rows": lambda: parse_batting_rows(container),
+        "parse_bowling_rows": lambda: parse_bowling_rows(container),
+        "parse_innings_score": lambda: parse_innings_score(container),
+        "get_scores": lambda: get_scores(doc),
+        "get_batting_scorecard": lambda: get_batting_scorecard('"innings_1"', doc),
+        "get_bowling_scorecard": lambda: get_bowling_scorecard('"innings_1"', doc),
+        "get_result_update": lambda: get_result_update(doc),
+        "get_playing_eleven": lambda: get_playing_eleven(doc),
+        "get_toss": lambda: get_toss(doc),
+        "parse_scorecard": lambda: parse_scorecard(doc),
+        "parse_scorecard_html": lambda: parse_scorecard_html(scorecard_html),
+        "parse_match_cards": lambda: parse_match_cards(matches_doc),
+    }
+    results = {}
+    for name, fn in cases.items():
+        results[name] = micro(fn, iterations)
+        print(f"  {name:24s} {results[name]['median_us']:10.1f} us")
+
+    # Goes over HTTP to the stub, so it includes the stub's latency.
+    base_url = http_client.CRICBUZZ_BASE_URL
+    http_client.CRICBUZZ_BASE_URL = stub_url
+    try:
+        results["fetch_matches_for_season"] = micro(
+            lambda: fetch_matches_for_season("IPL2024", 7607), max(1, iterations // 20))
+    finally:
+        http_client.CRICBUZZ_BASE_URL = base_url
+    print(f"  {'fetch_matches_for_season':24s} {results['fetch_matches_for_season']['median_us']:10.1f} us")
+    return results
+
+
+def run_e2e(args, stub_url):
+    env = dict(os.environ,
+               CRICBUZZ_BASE_URL=stub_url,
+               SCORECARD_ARCHIVE_PATH="",
+               UPSTREAM_RETRIES="0")
+    port = 8931
+    if args.server == "asgi":
+        command = [sys.executable, "-m", "uvicorn", "--workers", str(args.workers), "--log-level", "warning",
+                   "--port", str(port), "asgi:app"]
+    else:
+        command = [sys.executable, "-m", "gunicorn", "-w", str(args.workers), "--threads", str(args.threads),
+                   "-b", f"127.0.0.1:{port}", "app:app"]
+
+    n = args.requests
+    scenarios = {
+        "scorecard_miss": [f"/scorecard/{200000 + i}" for i in range(n)],
+        "scorecard_hit": ["/scorecard/1"] * n,
+        "scorecard_live": ["/scorecard/live"] * n,
+        "fantasy_points": [f"/fantasy/points?match_id={300000 + i}" for i in range(n)],
+    }
+    results = {}
+    process = start_server(command, port, env)
+    try:
+        run_load(f"http://127.0.0.1:{port}", ["/scorecard/1"] * args.concurrency, args.concurrency)  # warm up
+        for name, paths in scenarios.items():
+            results[name] = run_load(f"http://127.0.0.1:{port}", paths, args.concurrency)
+            r = results[name]
+            print(f"  {name:24s} {r['requests_per_s']:8.1f} req/s  p50 {r['p50_ms']:7.1f} ms  "
+                  f"p95 {r['p95_ms']:7.1f} ms  p99 {r['p99_ms']:7.1f} ms  errors {r['errors']}")
+    finally:
+        stop_server(process)
+    return results
+
+
+def compare(current, baseline, tolerance):
+    """Return human-readable regressions of ``current`` against ``baseline``."""
+    regressions = []
+    for name, result in current.get("micro", {}).items():
+        old = baseline.get("micro", {}).get(name)
+        if old and result["median_us"] > old["median_us"] * (1 + tolerance):
+            regressions.append(f"micro {name}: {old['median_us']} -> {result['median_us']} us")
+    for name, result in current.get("e2e", {}).items():
+        old = baseline.get("e2e", {}).get(name)
+        if not old:
+            continue
+        if result["p50_ms"] > old["p50_ms"] * (1 + tolerance):
+            regressions.append(f"e2e {name} p50: {old['p50_ms']} -> {result['p50_ms']} ms")
+        if result["requests_per_s"] < old["requests_per_s"] * (1 - tolerance):
+            regressions.append(f"e2e {name} throughput: {old['requests_per_s']} -> {result['requests_per_s']} req/s")
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results", "latest.json"))
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before flagging (0.2 = 20%%)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=25)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--server", choices=("flask", "asgi"), default="flask")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads per worker")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-e2e", action="store_true")
+    args = parser.parse_args()
+
+    stub = serve_in_background(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000)
+    stub_url = f"http://127.0.0.1:{stub.server_port}"
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": vars(args)
+        }
+    }
+    try:
+        if not args.skip_micro:
+            print("micro-benchmarks (median per call):")
+            results["micro"] = run_micro(stub_url, args.iterations)
+        if not args.skip_e2e:
+            print(f"end-to-end ({args.server}, upstream {args.latency_ms:.0f}+/-{args.jitter_ms:.0f} ms, "
+                  f"{args.requests} requests, concurrency {args.concurrency}):")
+            results["e2e"] = run_e2e(args, stub_url)
+    finally:
+        stub.shutdown()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 import json
-import requests
-from scrapy.http import HtmlResponse
 import time
 import os
 import logging
 import argparse
 from flask import Flask, jsonify, request
+from utils import http_client
+from utils.html_backend import parse_html
 
 # ---------- Logging ----------
 logging.basicConfig(
@@ -33,12 +33,12 @@ def fetch_matches_for_season(season, series_id):
     url = f"https://www.cricbuzz.com/cricket-series/{series_id}/indian-premier-league-{season[-4:]}/matches"
 
     try:
-        cricbuzz_resp = requests.get(url)
+        cricbuzz_resp = http_client.get(url)
         if cricbuzz_resp.status_code != 200:
             logging.warning(f"Failed to fetch {season}. Skipping...")
             return []
 
-        response = HtmlResponse(url=url, body=cricbuzz_resp.text, encoding='utf-8')
+        response = parse_html(cricbuzz_resp.text, url=url)
         match_cards = response.xpath('//*[@id="series-matches"]/div')
 
         match_no = 1
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Tests import the app's packages (utils.*) from the repository root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Tests that import app must not open the on-disk archive or player index of the working tree.
+os.environ.setdefault("SCORECARD_ARCHIVE_PATH", "")
+os.environ.setdefault("PLAYER_INDEX_PATH", "")
@@ -0,0 +1,47 @@
+import os
+
+from utils.archive import ScorecardArchive, open_archive
+from utils.scorecard import parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+
+
+def load_fixture():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_put_then_get_round_trips_scorecard_and_html(tmp_path):
+    html = load_fixture()
+    scorecard = parse_scorecard_html(html)
+    archive = ScorecardArchive(str(tmp_path / "scorecards.db"))
+
+    assert archive.get("101") is None
+    archive.put("101", html, scorecard, season="IPL2025")
+
+    assert "101" in archive and 101 in archive
+    assert archive.get(101).to_dict() == scorecard.to_dict()
+    assert archive.get_html("101") == html
+    assert archive.stats()["hits"] == 1 and archive.stats()["misses"] == 1
+
+
+def test_archive_persists_across_instances_and_filters_by_season(tmp_path):
+    html = load_fixture()
+    scorecard = parse_scorecard_html(html)
+    path = str(tmp_path / "scorecards.db")
+    archive = ScorecardArchive(path)
+    archive.put("101", html, scorecard, season="IPL2024")
+    archive.put("102", html, scorecard, season="IPL2025")
+    archive.put("102", html, scorecard, season="IPL2025")
+
+    reopened = ScorecardArchive(path)
+    assert reopened.count() == 2
+    assert reopened.count("IPL2025") == 1
+    assert reopened.match_ids("IPL2024") == {"101"}
+    rows = list(reopened.iter_scorecards(match_ids=[102]))
+    assert [(match_id, season) for match_id, season, _ in rows] == [("102", "IPL2025")]
+    assert rows[0][2].to_dict() == scorecard.to_dict()
+
+
+def test_empty_path_disables_the_archive():
+    assert open_archive("") is None
@@ -0,0 +1,47 @@
+from utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(clock=clock)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_peek_does_not_count_or_refresh_recency():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+    assert cache.peek("a") == 1
+    assert (cache.hits, cache.misses) == (0, 0)
+    cache.set("c", 3)
+    assert cache.peek("a") is None
+    clock.now = 5
+    assert cache.peek("b", "gone") == "gone"
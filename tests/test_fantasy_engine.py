@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pytest
+
+from utils.fantasy_engine import SeasonStats, roster_resolver
+from utils.fantasy_points import calculate_total_points
+from utils.model import BattingRow, BowlingRow, Innings, Match
+from utils.scorecard import parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+
+
+@pytest.fixture(scope="module")
+def scorecard():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return parse_scorecard_html(f.read())
+
+
+def scalar_points(scorecard):
+    resolve = roster_resolver(scorecard.playing_eleven)
+    teams = [innings.team for innings in scorecard.innings]
+    points = {}
+    for number, innings in enumerate(scorecard.innings):
+        fielding_team = teams[number ^ 1]
+        for row in innings.batting:
+            name = resolve(row.name, innings.team)
+            points[name] = points.get(name, 0) + calculate_total_points(row)
+        for row in innings.bowling:
+            name = resolve(row.name, fielding_team)
+            points[name] = points.get(name, 0) + calculate_total_points(row)
+    return points
+
+
+def test_vectorized_score_matches_calculate_total_points_row_by_row(scorecard):
+    stats = SeasonStats.from_scorecards([("101", "IPL2021", scorecard)])
+    expected = scalar_points(scorecard)
+    vectorized = dict(zip(stats.players, stats.score()))
+    assert vectorized.keys() == expected.keys()
+    for name, points in expected.items():
+        assert vectorized[name] == pytest.approx(points), name
+
+
+def test_score_is_per_match_row(scorecard):
+    stats = SeasonStats.from_scorecards([("101", "IPL2021", scorecard), ("102", "IPL2021", scorecard)])
+    single = SeasonStats.from_scorecards([("101", "IPL2021", scorecard)])
+    assert len(stats) == 2 * len(single)
+    assert stats.score().sum() == pytest.approx(2 * single.score().sum())
+
+
+def duck_match(dismissal):
+    batter = BattingRow("Opener", dismissal, 0, 3, 0, 0, 0.0)
+    bowler = BowlingRow("Seamer", 12, 0, 20, 0, 10.0)
+    return Match([Innings([batter], [], "CSK"), Innings([], [bowler], "MI")], {}, {}, {})
+
+
+@pytest.mark.parametrize("dismissal, duck", [("c Dhoni b Bumrah", True), ("not out", False), ("batting", False)])
+def test_duck_penalty_only_for_dismissed_batters(dismissal, duck):
+    match = duck_match(dismissal)
+    row = match.innings[0].batting[0]
+    assert calculate_total_points(row) == (-2 if duck else 0)
+
+    stats = SeasonStats.from_scorecards([("101", "IPL2025", match)])
+    points = dict(zip(stats.players, stats.score()))
+    assert points["Opener"] == (-2 if duck else 0)
+    assert np.all(stats.columns["dismissed"] == [int(duck), 0])
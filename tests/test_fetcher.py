@@ -0,0 +1,66 @@
+import json
+import os
+import stat
+
+from utils import fetcher
+from utils.fetcher import diff_matches, season_can_change, write_json_atomic
+
+
+def test_diff_matches_counts_changes_and_keeps_unchanged_objects():
+    kept = {"match_id": 1, "match_result": "CSK won by 5 runs"}
+    old = [kept, {"match_id": 2, "match_result": "NA"}, {"match_id": 3, "match_result": "NA"}]
+    new = [
+        {"match_id": 1, "match_result": "CSK won by 5 runs"},
+        {"match_id": 2, "match_result": "MI won by 2 wkts"},
+        {"match_id": 4, "match_result": "NA"},
+    ]
+    merged, changes = diff_matches(old, new)
+    assert changes == {"added": 1, "updated": 1, "removed": 1}
+    assert [m["match_id"] for m in merged] == [1, 2, 4]
+    assert merged[0] is kept
+    assert merged[1] is new[1]
+
+
+def test_diff_matches_without_changes():
+    matches = [{"match_id": 1, "match_result": "NA"}]
+    merged, changes = diff_matches(matches, [dict(m) for m in matches])
+    assert merged[0] is matches[0]
+    assert changes == {"added": 0, "updated": 0, "removed": 0}
+
+
+def test_write_json_atomic_keeps_file_mode(tmp_path):
+    path = tmp_path / "match_ids.json"
+    path.write_text("{}")
+    os.chmod(path, 0o644)
+    write_json_atomic(str(path), {"IPL2025": []})
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert path.read_text().strip().startswith("{")
+
+
+def test_season_with_unplayed_fixtures_can_change():
+    with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "match_ids.json")) as f:
+        stored = json.load(f)
+    latest = max(stored)
+    unplayed = [m for m in stored[latest] if m["match_result"].startswith("Match starts at")]
+    assert unplayed
+    completed = [m for m in stored["IPL2008"] if " won" in m["match_result"]]
+
+    assert season_can_change("IPL2024", completed + unplayed[:1], latest)
+    assert not season_can_change("IPL2008", completed, latest)
+    assert not season_can_change("IPL2008", completed + [{"match_result": "No result"}], latest)
+    assert season_can_change(latest, completed, latest)
+    assert season_can_change("IPL2008", [], latest)
+
+
+def test_full_refresh_keeps_stored_seasons_that_fail_to_fetch(tmp_path, monkeypatch):
+    stored = {"IPL2024": [{"match_id": 1, "match_result": "CSK won by 5 runs"}], "IPL2025": []}
+    path = tmp_path / "match_ids.json"
+    path.write_text(json.dumps(stored))
+    monkeypatch.setattr(fetcher, "MATCH_IDS_FILE", str(path))
+    monkeypatch.setattr(fetcher, "load_ipl_series", lambda: {"IPL2024": 1, "IPL2025": 2})
+    fresh = [{"match_id": 2, "match_result": "Match starts at Apr 01, 14:00 GMT"}]
+    monkeypatch.setattr(fetcher, "fetch_matches_for_season",
+                        lambda season, series_id: fresh if season == "IPL2025" else [])
+
+    fetcher.fetch_all_ipl_matches("all")
+    assert json.loads(path.read_text()) == {"IPL2024": stored["IPL2024"], "IPL2025": fresh}
@@ -0,0 +1,60 @@
+import gzip
+import os
+
+import pytest
+
+import app as app_module
+from utils.scorecard import parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+MATCH_ID = "990001"
+
+
+@pytest.fixture
+def client():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        app_module.scorecard_cache.set(MATCH_ID, parse_scorecard_html(f.read()))
+    yield app_module.app.test_client()
+    app_module.scorecard_cache.pop(MATCH_ID)
+
+
+def test_completed_scorecard_has_etag_and_long_cache_control(client):
+    response = client.get(f"/scorecard/{MATCH_ID}")
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+    assert response.headers["Cache-Control"] == f"public, max-age={app_module.COMPLETED_SCORECARD_MAX_AGE}"
+    assert "Content-Encoding" not in response.headers
+
+
+def test_matching_if_none_match_returns_304(client):
+    etag = client.get(f"/scorecard/{MATCH_ID}").headers["ETag"]
+    response = client.get(f"/scorecard/{MATCH_ID}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+    assert client.get(f"/scorecard/{MATCH_ID}", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_gzip_body_has_its_own_etag(client):
+    plain = client.get(f"/scorecard/{MATCH_ID}")
+    compressed = client.get(f"/scorecard/{MATCH_ID}", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert compressed.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+    assert gzip.decompress(compressed.data) == plain.data
+
+
+def test_identity_etag_revalidates_the_gzip_representation(client):
+    plain_etag = client.get(f"/scorecard/{MATCH_ID}").headers["ETag"]
+    gzip_etag = client.get(f"/scorecard/{MATCH_ID}", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = client.get(f"/scorecard/{MATCH_ID}", headers={"If-None-Match": plain_etag, "Accept-Encoding": "gzip"})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == gzip_etag
+
+
+def test_match_list_revalidates_with_304(client):
+    response = client.get("/get_all_matches")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert client.get("/get_all_matches", headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,87 @@
+import pytest
+import requests
+
+from utils import http_client
+from utils.http_client import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(http_client.time, "monotonic", clock)
+    return clock
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(threshold=3, cooldown=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    # The trial restarts the cooldown, so concurrent callers still fail fast.
+    assert not breaker.allow()
+
+
+def test_failed_trial_reopens_and_successful_trial_closes(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_get_fails_fast_while_the_circuit_is_open(clock, monkeypatch):
+    calls = []
+
+    def refuse(url, timeout=None, headers=None):
+        calls.append(url)
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(http_client.session, "get", refuse)
+    monkeypatch.setattr(http_client, "_breakers", {})
+    monkeypatch.setattr(http_client, "_stats", {})
+    monkeypatch.setattr(http_client, "backoff_delay", lambda attempt: 0)
+    breaker, stats = http_client.host_state("upstream.test")
+    breaker.threshold = 2
+
+    with pytest.raises(requests.ConnectionError):
+        http_client.get("http://upstream.test/live", retries=1)
+    assert len(calls) == 2
+    with pytest.raises(CircuitOpenError):
+        http_client.get("http://upstream.test/live", retries=1)
+    assert len(calls) == 2
+    assert stats.short_circuited == 1
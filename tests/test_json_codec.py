@@ -0,0 +1,62 @@
+import gzip
+import json
+
+import pytest
+
+from utils import json_codec
+from utils.json_codec import Payload, accepted_codings, dumps, loads
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_codec, "JSON_BACKEND", request.param)
+    return request.param
+
+
+class Row:
+    def to_dict(self):
+        return {"name": "Narine", "runs": "4"}
+
+
+def test_dumps_matches_jsonify_form(backend):
+    obj = {"b": [1, 2.5, None], "a": {"z": "x", "y": True}}
+    assert dumps(obj) == json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    assert loads(dumps({"name": "Varun Chakravarthy é"})) == {"name": "Varun Chakravarthy é"}
+
+
+def test_dumps_encodes_models_through_to_dict(backend):
+    assert loads(dumps({"rows": [Row()]})) == {"rows": [{"name": "Narine", "runs": "4"}]}
+
+
+def test_dumps_falls_back_for_big_integers(backend):
+    assert loads(dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+def test_payload_etag_is_content_hash_and_body_has_newline():
+    first, second = Payload.from_obj({"a": 1}), Payload.from_obj({"a": 1})
+    assert first.body.endswith(b"\n")
+    assert first.etag == second.etag
+    assert Payload.from_obj({"a": 2}).etag != first.etag
+    assert Payload(b"{}\n", etag="fixed").etag_for("gzip") == "fixed-gzip"
+
+
+def test_payload_compresses_once_and_only_large_bodies(monkeypatch):
+    payload = Payload.from_obj({"rows": list(range(2000))})
+    body, coding = payload.encoded("gzip, deflate")
+    assert coding == "gzip"
+    assert gzip.decompress(body) == payload.body
+    assert payload.encoded("gzip")[0] is body
+
+    assert payload.encoded(None) == (payload.body, None)
+    assert payload.encoded("gzip;q=0") == (payload.body, None)
+    small = Payload.from_obj({"a": 1})
+    assert small.encoded("gzip") == (small.body, None)
+
+
+def test_accepted_codings_prefers_brotli_when_available():
+    expected = ["br", "gzip"] if json_codec.brotli is not None else ["gzip"]
+    assert accepted_codings("gzip, br") == expected
+    assert accepted_codings("*") == expected
+    assert accepted_codings("identity") == []
@@ -0,0 +1,103 @@
+import copy
+import json
+
+import pytest
+
+from utils import jsonpatch
+from utils.deltas import DeltaLog, DeltaTracker
+from utils.live_poller import LivePoller
+
+
+@pytest.mark.parametrize("old, new", [
+    ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 2, 3, 4], "c": {"d": None}}),
+    ({"innings": [{"runs": 10, "batting": [["A", "4"]]}]}, {"innings": [{"runs": 14, "batting": [["A", "8"]]}]}),
+    ({"list": [1, 2, 3, 4]}, {"list": [1]}),
+    ({"a/b": 1, "c~d": 2}, {"a/b": 3}),
+    ({"a": 1}, [1, 2]),
+    ({}, {}),
+])
+def test_diff_apply_round_trip(old, new):
+    patch = jsonpatch.diff(old, new)
+    assert jsonpatch.apply(copy.deepcopy(old), patch) == new
+    assert (patch == []) == (old == new)
+
+
+def test_apply_rejects_unsupported_operations():
+    with pytest.raises(ValueError):
+        jsonpatch.apply({"a": 1}, [{"op": "move", "path": "/a", "from": "/b"}])
+
+
+def test_since_returns_ops_up_to_the_current_seq():
+    tracker = DeltaTracker()
+    first = tracker.delta("1", {"runs": 1})
+    assert first["type"] == "snapshot"
+    tracker.record("1", {"runs": 2})
+    delta = tracker.delta("1", {"runs": 3}, since=first["seq"])
+    assert delta["type"] == "patch"
+    assert jsonpatch.apply({"runs": 1}, delta["patch"]) == {"runs": 3}
+    assert tracker.delta("1", {"runs": 3}, since=delta["seq"])["patch"] == []
+
+
+def test_since_evicted_from_history_needs_a_snapshot():
+    counter = iter(f"e-{n}" for n in range(1, 100))
+    log = DeltaLog(counter, history=2, epoch="e")
+    seqs = [log.record({"runs": runs}) for runs in range(5)]
+    assert log.since(seqs[0]) is None
+    assert log.since(seqs[1]) is None
+    seq, ops = log.since(seqs[2])
+    assert seq == seqs[-1]
+    assert jsonpatch.apply({"runs": 2}, ops) == {"runs": 4}
+
+
+def test_seq_from_another_process_needs_a_snapshot():
+    worker_a, worker_b = DeltaTracker(), DeltaTracker()
+    seq = worker_a.delta("1", {"runs": 1})["seq"]
+    worker_b.delta("1", {"runs": 1})
+    assert worker_b.delta("1", {"runs": 2}, since=seq)["type"] == "snapshot"
+    assert worker_a.delta("1", {"runs": 2}, since=seq)["type"] == "patch"
+
+
+def poller_with(scorecards):
+    feed = iter(scorecards)
+    return LivePoller(lambda: "101", lambda match_id: next(feed))
+
+
+def event_data(event):
+    return json.loads(event.split("data: ", 1)[1])
+
+
+def test_patch_is_computed_once_per_version_and_shared(monkeypatch):
+    poller = poller_with([{"runs": 10}, {"runs": 14}])
+    poller.poll_once()
+    first, version = poller.events_since(None, patches=True)
+
+    calls = []
+    diff = jsonpatch.diff
+    monkeypatch.setattr(jsonpatch, "diff", lambda old, new, path="": calls.append(path) or diff(old, new, path))
+    poller.poll_once()
+    subscribers = [poller.events_since(version, patches=True) for _ in range(3)]
+
+    assert calls.count("") == 1
+    assert all(events[0] is subscribers[0][0][0] for events, _ in subscribers)
+    delta = event_data(subscribers[0][0][0])
+    assert jsonpatch.apply(event_data(first[0])["scorecard"], delta["patch"]) == {"runs": 14}
+    assert delta["since"] == poller.event_id(version)
+
+
+def test_lagging_subscriber_gets_every_missed_patch():
+    poller = poller_with([{"runs": 10}, {"runs": 14}, {"runs": 20}])
+    poller.poll_once()
+    first, version = poller.events_since(None, patches=True)
+    poller.poll_once()
+    poller.poll_once()
+
+    events, latest = poller.events_since(version, patches=True)
+    assert latest == version + 2
+    document = event_data(first[0])["scorecard"]
+    for event in events:
+        document = jsonpatch.apply(document, event_data(event)["patch"])
+    assert document == {"runs": 20}
+
+    full, _ = poller.events_since(version, patches=False)
+    assert event_data(full[0])["scorecard"] == {"runs": 20}
+    assert poller.events_since(None)[0][0] is full[0]
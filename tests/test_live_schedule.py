@@ -0,0 +1,175 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from utils import live_schedule
+from utils.live_schedule import (
+    IN_WINDOW, OFF_WINDOW, LiveMatchFinder, LiveSchedule, Prewarmer, parse_slot, parse_start,
+)
+
+START = datetime(2025, 4, 1, 14, 0, tzinfo=timezone.utc).timestamp()
+
+
+class FakeMatchIndex:
+    def __init__(self, data):
+        self.snapshot = SimpleNamespace(version=1, data=data)
+
+    def current(self):
+        return self.snapshot
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock(START - 5 * 3600)
+
+
+@pytest.fixture
+def schedule(clock):
+    data = {"IPL2025": [
+        {"match_id": 101, "match_result": "Match starts at Apr 01, 14:00 GMT", "match_time": "07:30 PM"},
+        {"match_id": 100, "match_result": "Gujarat Titans won by 5 runs", "match_time": "07:30 PM"},
+    ]}
+    return LiveSchedule(FakeMatchIndex(data), clock=clock)
+
+
+class Upstream:
+    def __init__(self, match_id=-1):
+        self.match_id = match_id
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.match_id
+
+
+def test_parse_start_and_slot():
+    assert parse_start("Match starts at Apr 01, 14:00 GMT", 2025) == START
+    assert parse_start("Match abandoned", 2025) is None
+    assert parse_slot("07:30 PM") == 14 * 60
+    assert parse_slot("NA") is None
+
+
+def test_window(schedule):
+    assert schedule.window(START - 3600)[0] == OFF_WINDOW
+    assert schedule.window(START - 600) == (IN_WINDOW, START + live_schedule.LIVE_MATCH_DURATION)
+    assert schedule.window(START + live_schedule.LIVE_MATCH_DURATION + 1)[0] == OFF_WINDOW
+
+
+def test_off_window_lookup_skips_upstream(schedule, clock):
+    upstream = Upstream("101")
+    finder = LiveMatchFinder(upstream, schedule, clock=clock)
+    assert finder.lookup() == (-1, True)
+    assert finder.get() == -1
+    assert upstream.calls == 0
+    assert finder.skipped == 2
+
+
+def test_in_window_lookup_is_cached(schedule, clock):
+    clock.now = START + 60
+    upstream = Upstream("101")
+    finder = LiveMatchFinder(upstream, schedule, clock=clock)
+    assert finder.lookup() == (None, False)
+    assert finder.get() == "101"
+    clock.now += live_schedule.LIVE_MATCH_ID_MAX_AGE - 1
+    assert finder.lookup() == ("101", True)
+    clock.now += 2
+    assert finder.lookup() == ("101", False)
+    clock.now += live_schedule.LIVE_MATCH_ID_MAX_AGE
+    assert finder.lookup() == (None, False)
+    assert upstream.calls == 1
+
+
+def test_no_live_match_in_window_is_rechecked_after_ttl(schedule, clock):
+    clock.now = START - 600
+    upstream = Upstream(-1)
+    finder = LiveMatchFinder(upstream, schedule, clock=clock)
+    assert finder.get() == -1
+    assert finder.lookup() == (-1, True)
+    clock.now += live_schedule.LIVE_MATCH_ID_TTL
+    assert finder.lookup() == (-1, False)
+
+
+def test_finished_match_quiets_the_rest_of_the_window(schedule, clock):
+    clock.now = START + 60
+    finished = set()
+    upstream = Upstream("101")
+    finder = LiveMatchFinder(upstream, schedule, is_finished=lambda match_id: match_id in finished, clock=clock)
+    assert finder.get() == "101"
+    finished.add("101")
+    clock.now = START + 4 * 3600
+    assert finder.lookup() == (-1, True)
+    assert finder.get() == -1
+    assert upstream.calls == 1
+
+
+def test_past_season_falls_back_to_ttl(clock):
+    clock.now = datetime(2026, 4, 1, tzinfo=timezone.utc).timestamp()
+    schedule = LiveSchedule(FakeMatchIndex({"IPL2025": []}), clock=clock)
+    upstream = Upstream(-1)
+    finder = LiveMatchFinder(upstream, schedule, clock=clock)
+    assert finder.lookup() == (None, False)
+    assert finder.get() == -1 and upstream.calls == 1
+
+
+def test_double_header_evening_match_is_found_after_the_afternoon_one_finishes(clock):
+    afternoon = datetime(2025, 4, 5, 10, 0, tzinfo=timezone.utc).timestamp()
+    data = {"IPL2025": [
+        {"match_id": 201, "match_result": "Match starts at Apr 05, 10:00 GMT", "match_time": "03:30 PM"},
+        {"match_id": 202, "match_result": "Match starts at Apr 05, 14:00 GMT", "match_time": "07:30 PM"},
+    ]}
+    clock.now = afternoon + 600
+    schedule = LiveSchedule(FakeMatchIndex(data), clock=clock)
+    finished = set()
+    upstream = Upstream("201")
+    finder = LiveMatchFinder(upstream, schedule, is_finished=lambda match_id: match_id in finished, clock=clock)
+    assert finder.get() == "201"
+
+    # The afternoon match ends before the evening window opens: quiet only until it does.
+    finished.add("201")
+    upstream.match_id = -1
+    clock.now = afternoon + 3.6 * 3600
+    assert finder.get() == -1
+    assert upstream.calls == 1
+
+    upstream.match_id = "202"
+    for hours in (4.1, 5, 7, 8.9):
+        clock.now = afternoon + hours * 3600
+        assert finder.get() == "202"
+    assert upstream.calls >= 2
+
+
+def test_finished_inside_overlapping_windows_is_not_quiet(clock):
+    data = {"IPL2025": [
+        {"match_id": 201, "match_result": "Match starts at Apr 05, 10:00 GMT", "match_time": "03:30 PM"},
+        {"match_id": 202, "match_result": "Match starts at Apr 05, 14:00 GMT", "match_time": "07:30 PM"},
+    ]}
+    schedule = LiveSchedule(FakeMatchIndex(data), clock=clock)
+    evening = datetime(2025, 4, 5, 14, 0, tzinfo=timezone.utc).timestamp()
+    assert schedule.quiet_until(evening - 60) == 0.0
+    assert schedule.quiet_until(evening - 3600) == evening - live_schedule.LIVE_WINDOW_BEFORE
+
+
+def test_due_for_prewarm_returns_each_fixture_once(schedule, clock):
+    clock.now = START - 120
+    assert schedule.due_for_prewarm(lead=300) == [("101", START)]
+    assert schedule.due_for_prewarm(lead=300) == []
+
+
+def test_prewarmer_warms_due_fixtures_and_sleeps_until_the_next(schedule, clock):
+    warmed = []
+    prewarmer = Prewarmer(schedule, lambda match_id, start: warmed.append((match_id, start)), lead=300, max_sleep=86400)
+    clock.now = START - 3600
+    assert prewarmer.run_once() == 3600 - 300
+    assert warmed == []
+    clock.now = START - 200
+    prewarmer.run_once()
+    assert warmed == [("101", START)]
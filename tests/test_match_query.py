@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+import app as app_module
+from app import _decode_cursor, _encode_cursor
+from utils.match_index import MatchIndex
+
+MATCH_IDS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "match_ids.json")
+
+
+@pytest.fixture(scope="module")
+def index():
+    index = MatchIndex(MATCH_IDS)
+    index.reload()
+    return index
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def test_cursor_round_trip():
+    etag = "0123456789abcdef"
+    cursor = _encode_cursor(etag, 137)
+    assert "=" not in cursor
+    assert _decode_cursor(cursor, etag) == 137
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm9jb2xvbg", _encode_cursor("0123456789ab", "x")])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(cursor, "0123456789abcdef")
+
+
+def test_cursor_from_an_older_match_list_is_rejected():
+    with pytest.raises(ValueError, match="older match list"):
+        _decode_cursor(_encode_cursor("aaaaaaaaaaaa", 5), "bbbbbbbbbbbb")
+
+
+def test_bad_cursor_returns_400(client):
+    response = client.get("/get_all_matches?season=IPL2024&cursor=garbage!")
+    assert response.status_code == 400
+    assert "cursor" in response.get_json()["error"].lower()
+
+
+def test_pages_cover_the_season_once(client, index):
+    expected = [str(match["match_id"]) for match in index.current().data["IPL2024"]]
+    seen, cursor = [], None
+    while True:
+        url = "/get_all_matches?season=IPL2024&limit=20&fields=match_id"
+        page = client.get(url + (f"&cursor={cursor}" if cursor else "")).get_json()
+        assert page["total"] == len(expected)
+        seen += [str(match["match_id"]) for match in page["matches"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+
+def test_match_and_team_lookups(index):
+    season, match = index.current().rows[0]
+    assert index.match(match["match_id"]) is match
+    assert index.match("missing") is None
+    assert index.season_of(match["match_id"]) == season
+    team = match["match_name"].split(" vs ")[0]
+    assert match in index.matches_for_team(team.lower())
+    assert all(team.upper() in m["match_name"].upper() for m in index.matches_for_team(team))
+    assert match in index.matches_for_venue(match["match_venue"])
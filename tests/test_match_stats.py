@@ -0,0 +1,55 @@
+from utils.match_stats import parse_result
+
+
+def match(name, result):
+    return {"match_id": 1, "match_name": name, "match_result": result, "match_venue": "NA"}
+
+
+def test_won_chasing():
+    parsed = parse_result(match("MUMBAI INDIANS vs CHENNAI SUPER KINGS, 1st Match",
+                                "Chennai Super Kings won by 6 wkts"))
+    assert parsed["outcome"] == "won"
+    assert parsed["winner"] == "CHENNAI SUPER KINGS"
+    assert parsed["loser"] == "MUMBAI INDIANS"
+    assert parsed["won_batting_first"] is False
+
+
+def test_tie_decided_by_eliminator():
+    parsed = parse_result(match("KOLKATA KNIGHT RIDERS vs RAJASTHAN ROYALS, 10th match",
+                                "Match tied (Rajasthan Royals won the one-over eliminator)"))
+    assert parsed["outcome"] == "tied"
+    assert parsed["winner"] == "RAJASTHAN ROYALS"
+    assert parsed["loser"] == "KOLKATA KNIGHT RIDERS"
+    assert parsed["won_batting_first"] is None
+
+
+def test_tie_decided_by_super_over():
+    parsed = parse_result(match("DELHI CAPITALS vs KINGS XI PUNJAB, 2nd Match",
+                                "Match tied (Delhi Capitals won the Super Over)"))
+    assert (parsed["outcome"], parsed["winner"]) == ("tied", "DELHI CAPITALS")
+
+
+def test_no_result():
+    parsed = parse_result(match("ROYAL CHALLENGERS BENGALURU vs CHENNAI SUPER KINGS, 34th Match",
+                                "No result (abandoned with a toss)"))
+    assert parsed["outcome"] == "no_result"
+    assert parsed["winner"] is None and parsed["loser"] is None
+
+
+def test_dls_result_uses_the_margin():
+    parsed = parse_result(match("SUNRISERS HYDERABAD vs RISING PUNE SUPERGIANT, 22nd Match",
+                                "Rising Pune Supergiants won by 34 runs (DLS method)"))
+    assert parsed["winner"] == "RISING PUNE SUPERGIANT"
+    assert parsed["won_batting_first"] is True
+
+
+def test_bangalore_resolves_to_bengaluru():
+    parsed = parse_result(match("MUMBAI INDIANS vs ROYAL CHALLENGERS BENGALURU, 5th match",
+                                "Royal Challengers Bangalore won by 5 wickets (with 2 balls remaining)"))
+    assert parsed["winner"] == "ROYAL CHALLENGERS BENGALURU"
+    assert parsed["won_batting_first"] is False
+
+
+def test_unplayed_match_is_skipped():
+    assert parse_result(match("GUJARAT TITANS vs PUNJAB KINGS, 5th Match", "Match starts at Apr 01, 14:00 GMT")) is None
+    assert parse_result(match("NA", "Gujarat Titans won by 5 runs")) is None
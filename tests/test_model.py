@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from app import compute_fantasy_points
+from utils import json_codec
+from utils.fantasy_engine import SeasonStats
+from utils.model import Match
+from utils.scorecard import parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+
+
+@pytest.fixture(scope="module")
+def scorecard():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return parse_scorecard_html(f.read())
+
+
+def test_to_dict_from_dict_round_trip(scorecard):
+    document = scorecard.to_dict()
+    restored = Match.from_dict(document)
+    assert restored.to_dict() == document
+    assert restored == scorecard
+
+
+def test_round_trip_through_json(scorecard):
+    restored = Match.from_dict(json_codec.loads(json_codec.dumps(scorecard)))
+    assert restored.to_dict() == scorecard.to_dict()
+
+
+def test_json_shape_is_unchanged(scorecard):
+    document = scorecard.to_dict()
+    assert set(document) == {"Innings1", "Innings2", "Result", "Playing_Eleven", "Toss_Result"}
+    batting, bowling, score = document["Innings1"]
+    assert set(batting["Batsman"][0]) == {"name", "dismissal", "runs", "balls", "fours", "sixes", "sr"}
+    assert set(bowling["Bowlers"][0]) == {"name", "overs", "maidens", "runs", "wicket", "economy"}
+    assert isinstance(batting["Batsman"][0]["runs"], str)
+    assert isinstance(score["runs"], int)
+
+
+def test_match_fantasy_points_use_season_player_names(scorecard):
+    points = compute_fantasy_points(scorecard)
+    stats = SeasonStats.from_scorecards([("101", "IPL2021", scorecard)])
+    assert points.keys() == set(stats.players)
+    for name, total in zip(stats.players, stats.score()):
+        assert points[name] == pytest.approx(total)
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from utils import json_codec
+from utils.player_index import UNKNOWN_SEASON, PlayerIndex
+from utils.scorecard import parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+
+
+@pytest.fixture(scope="module")
+def scorecard():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return parse_scorecard_html(f.read())
+
+
+def any_player(index):
+    return next(iter(index._players.values())).name
+
+
+def test_match_without_a_season_is_filed_as_unknown(scorecard):
+    index = PlayerIndex()
+    assert index.add_match("101", "IPL2021", scorecard)
+    assert index.add_match("102", None, scorecard)
+    assert not index.add_match("102", None, scorecard)
+
+    career = index.career(any_player(index))
+    assert set(career["seasons"]) == {"IPL2021", UNKNOWN_SEASON}
+    assert career["seasons"][UNKNOWN_SEASON]["matches"] == 1
+    assert json_codec.loads(json_codec.dumps(career))["seasons"].keys() == {"IPL2021", UNKNOWN_SEASON}
+    assert index.season(any_player(index), UNKNOWN_SEASON)["lines"][0]["match_id"] == "102"
+
+
+def test_save_and_load_keep_totals(scorecard, tmp_path):
+    index = PlayerIndex()
+    index.add_match("101", "IPL2021", scorecard)
+    index.add_match("102", None, scorecard)
+    path = str(tmp_path / "player_index.json")
+    index.save(path)
+
+    loaded = PlayerIndex.load(path)
+    assert loaded.stats() == index.stats()
+    name = any_player(index)
+    assert loaded.career(name) == index.career(name)
+
+
+def test_index_in_an_older_format_is_ignored(tmp_path):
+    path = tmp_path / "player_index.json"
+    path.write_bytes(json_codec.dumps({"format": 1, "matches": {"101": None}, "players": {}}))
+    assert PlayerIndex.load(str(path)).stats() == {"players": 0, "matches": 0}
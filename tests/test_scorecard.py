@@ -0,0 +1,28 @@
+import os
+
+from benchmarks.bench_parser import check_equivalent, legacy_parse
+from utils.html_backend import parse_html
+from utils.scorecard import is_match_completed, parse_scorecard, parse_scorecard_html
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "playing.html")
+
+
+def load_fixture():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_single_pass_parser_matches_legacy_extractors():
+    response = parse_html(load_fixture(), url="https://www.cricbuzz.com/")
+    check_equivalent(legacy_parse(response), parse_scorecard(response))
+
+
+def test_parser_reads_rows_past_the_legacy_limits():
+    response = parse_html(load_fixture(), url="https://www.cricbuzz.com/")
+    legacy, current = legacy_parse(response), parse_scorecard(response)
+    rows = lambda card: sum(len(card[i][0]["Batsman"]) + len(card[i][1]["Bowlers"]) for i in ("Innings1", "Innings2"))  # noqa: E731
+    assert rows(current) >= rows(legacy)
+
+
+def test_bundled_scorecard_is_completed():
+    assert is_match_completed(parse_scorecard_html(load_fixture()))
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from utils.shared_cache import RedisSharedCache, SQLiteSharedCache
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def cache(request, tmp_path):
+    if request.param == "sqlite":
+        backend = SQLiteSharedCache(str(tmp_path / "shared.db"))
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        backend = RedisSharedCache(fakeredis.FakeRedis())
+    yield backend
+    backend.close()
+
+
+def test_get_set_with_ttl(cache):
+    cache.set("k", b"value", ttl=30)
+    value, ttl = cache.get_with_ttl("k")
+    assert value == b"value"
+    assert 0 < ttl <= 30
+    cache.set("forever", b"x")
+    assert cache.get_with_ttl("forever") == (b"x", None)
+    assert cache.get("missing") is None
+
+
+def test_refresh_once_uncontended_refreshes(cache):
+    result, peer = cache.refresh_once("k", lambda: "fresh")
+    assert (result, peer) == ("fresh", None)
+    assert cache.peer_refreshes == 0
+
+
+def test_claim_refresh_hands_back_a_peer_result(cache):
+    lock, peer = cache.claim_refresh("k")
+    assert lock is not None and peer is None
+    calls = []
+    results = []
+
+    def other_worker():
+        results.append(cache.refresh_once("k", lambda: calls.append(1), wait=5))
+
+    thread = threading.Thread(target=other_worker)
+    thread.start()
+    time.sleep(0.2)
+    cache.set("k", b"from peer", ttl=30)
+    cache.release_refresh(lock)
+    thread.join(5)
+
+    assert calls == []
+    (result, (value, ttl)), = results
+    assert result is None and value == b"from peer"
+    assert cache.lock_waits == 1 and cache.peer_refreshes == 1
+
+
+def test_refresh_lock_is_released(cache):
+    cache.refresh_once("k", lambda: None)
+    lock, peer = cache.claim_refresh("k", wait=0)
+    assert lock is not None and peer is None
+    cache.release_refresh(lock)
+
+
+def test_min_ttl_reuses_a_recently_stored_value(cache):
+    cache.set("k", b"polled", ttl=15)
+    result, peer = cache.refresh_once("k", lambda: "scraped", min_ttl=5)
+    assert result is None and peer[0] == b"polled"
+    result, peer = cache.refresh_once("k", lambda: "scraped", min_ttl=20)
+    assert (result, peer) == ("scraped", None)
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "scorecard"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("123", fetch))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["scorecard"] * 8
+    assert flight.stats() == {"executed": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_waiters_receive_the_leaders_exception():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("upstream down")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("live", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while flight.coalesced < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert errors == ["upstream down"] * 2
+    assert flight.in_flight() == 0
+
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("a", lambda: 2) == 2
+    assert flight.executed == 2
+
+
+def test_async_callers_share_one_coroutine():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "scorecard"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("123", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["scorecard"] * 5
+    assert calls == [1]
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_async_waiters_receive_the_leaders_exception():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("live", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [ValueError] * 3
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("live", fail))
@@ -0,0 +1,232 @@
+"""
+Persistent on-disk archive of completed-match scorecards.
+
+Completed scorecards never change, so once scraped they are stored in SQLite
+(WAL mode, safe to share across gunicorn worker processes) together with the
+zlib-compressed raw HTML they were parsed from. Warm reads never touch the network.
+
+Backfill from the command line:
+    python -m utils.archive backfill --season IPL2024
+    python -m utils.archive backfill --season all --workers 4
+    python -m utils.archive stats
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils import http_client, json_codec
+from utils.fetcher import cricbuzz_rate_limiter, load_match_ids, resolve_seasons
+from utils.model import Match
+from utils.scorecard import SCORECARD_URL, is_match_completed, parse_scorecard_html
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PATH = os.environ.get("SCORECARD_ARCHIVE_PATH", "scorecards.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scorecards (
+    match_id   TEXT PRIMARY KEY,
+    season     TEXT,
+    html       BLOB NOT NULL,
+    scorecard  TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scorecards_season ON scorecards (season);
+"""
+
+
+class ScorecardArchive:
+    """
+    SQLite-backed store of raw HTML and parsed scorecards keyed by match_id.
+
+    Args:
+        path (str): Database file path.
+    """
+
+    def __init__(self, path=ARCHIVE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, match_id):
+        """Return the archived parsed scorecard, or None."""
+        row = self._connection().execute(
+            "SELECT scorecard FROM scorecards WHERE match_id = ?", (str(match_id),)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Match.from_dict(json_codec.loads(row[0]))
+
+    def get_html(self, match_id):
+        """Return the archived raw scorecard HTML, or None."""
+        row = self._connection().execute(
+            "SELECT html FROM scorecards WHERE match_id = ?", (str(match_id),)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def put(self, match_id, html, scorecard, season=None):
+        """Store (or replace) the raw HTML and parsed scorecard of a completed match."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO scorecards (match_id, season, html, scorecard, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (str(match_id), season, zlib.compress(html.encode("utf-8"), 6),
+                 json_codec.dumps(scorecard).decode("utf-8"), time.time()))
+        self.writes += 1
+
+    def __contains__(self, match_id):
+        return self._connection().execute(
+            "SELECT 1 FROM scorecards WHERE match_id = ?", (str(match_id),)).fetchone() is not None
+
+    def count(self, season=None):
+        if season is None:
+            return self._connection().execute("SELECT COUNT(*) FROM scorecards").fetchone()[0]
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM scorecards WHERE season = ?", (season,)).fetchone()[0]
+
+    def match_ids(self, season=None):
+        if season is None:
+            rows = self._connection().execute("SELECT match_id FROM scorecards")
+        else:
+            rows = self._connection().execute("SELECT match_id FROM scorecards WHERE season = ?", (season,))
+        return {row[0] for row in rows}
+
+    def iter_scorecards(self, season=None, match_ids=None):
+        """
+        Yield (match_id, season, scorecard) for every archived match.
+
+        Args:
+            season (str): Only matches of this season.
+            match_ids (iterable): Only these matches.
+        """
+        query = "SELECT match_id, season, scorecard FROM scorecards WHERE 1 = 1"
+        params = ()
+        if season is not None:
+            query += " AND season = ?"
+            params = (season,)
+        if match_ids is None:
+            batches = [(query, params)]
+        else:
+            # Chunked to stay under SQLite's limit on bound parameters.
+            match_ids = [str(match_id) for match_id in match_ids]
+            batches = [
+                (f"{query} AND match_id IN ({', '.join('?' * len(chunk))})", params + tuple(chunk))
+                for chunk in (match_ids[i:i + 500] for i in range(0, len(match_ids), 500))
+            ]
+        for batch_query, batch_params in batches:
+            for match_id, match_season, scorecard in self._connection().execute(batch_query, batch_params):
+                yield match_id, match_season, Match.from_dict(json_codec.loads(scorecard))
+
+    def stats(self):
+        count, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(html)), 0) FROM scorecards").fetchone()
+        return {
+            "path": self.path,
+            "matches": count,
+            "compressed_html_bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes
+        }
+
+
+def open_archive(path=ARCHIVE_PATH):
+    """Open the archive, or return None if SCORECARD_ARCHIVE_PATH is set to an empty string."""
+    if not path:
+        return None
+    try:
+        return ScorecardArchive(path)
+    except sqlite3.Error as e:
+        logger.error(f"Scorecard archive disabled, cannot open {path}: {e}")
+        return None
+
+
+# --------------- Backfill ---------------
+
+def archive_match(archive, match_id, season=None):
+    """
+    Scrape one scorecard and archive it if the match is completed.
+
+    Returns:
+        str: 'archived', 'skipped' (already archived), 'incomplete' or 'failed'.
+    """
+    if match_id in archive:
+        return "skipped"
+    url = SCORECARD_URL + str(match_id)
+    try:
+        cricbuzz_resp = http_client.get(url, rate_limiter=cricbuzz_rate_limiter)
+    except Exception as e:
+        logger.warning(f"Failed to fetch scorecard {match_id}: {e}")
+        return "failed"
+    if cricbuzz_resp.status_code != 200:
+        return "failed"
+    scorecard = parse_scorecard_html(cricbuzz_resp.text, url=url)
+    if not is_match_completed(scorecard):
+        return "incomplete"
+    archive.put(match_id, cricbuzz_resp.text, scorecard, season=season)
+    return "archived"
+
+
+def backfill(archive, season="all", workers=4):
+    """
+    Archive every completed match of one or all seasons listed in match_ids.json.
+
+    Returns:
+        dict: Outcome counts ('archived', 'skipped', 'incomplete', 'failed').
+    """
+    stored = load_match_ids()
+    seasons = [key for key in resolve_seasons(season) if key in stored]
+    jobs = [(match["match_id"], key) for key in seasons for match in stored[key]]
+    outcomes = {"archived": 0, "skipped": 0, "incomplete": 0, "failed": 0}
+
+    logger.info(f"Backfilling {len(jobs)} matches from {len(seasons)} season(s)")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(archive_match, archive, match_id, key) for match_id, key in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            outcomes[future.result()] += 1
+            if done % 50 == 0:
+                logger.info(f"Backfill progress: {done}/{len(jobs)} {outcomes}")
+    logger.info(f"Backfill finished: {outcomes}")
+    return outcomes
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Scorecard archive maintenance")
+    parser.add_argument("--path", default=ARCHIVE_PATH, help="SQLite archive path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    backfill_cmd = commands.add_parser("backfill", help="Archive completed matches from match_ids.json")
+    backfill_cmd.add_argument("--season", default="all", help="'all', '2024' or 'IPL2024'")
+    backfill_cmd.add_argument("--workers", type=int, default=4)
+    commands.add_parser("stats", help="Show archive size")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    archive = ScorecardArchive(args.path)
+    if args.command == "backfill":
+        print(json.dumps(backfill(archive, args.season, args.workers), indent=2))
+    else:
+        print(json.dumps(archive.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    cli()
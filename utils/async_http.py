@@ -0,0 +1,96 @@
+"""
+Non-blocking counterpart of ``utils.http_client`` for the ASGI app.
+
+Uses one pooled ``httpx.AsyncClient`` with the same timeouts, retry/backoff
+policy, per-host circuit breakers and latency stats as the synchronous layer,
+so ``/debug/stats`` reports both serving paths together.
+"""
+
+import asyncio
+import logging
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils import http_client
+from utils.http_client import RETRY_STATUSES, CircuitOpenError, backoff_delay, host_state
+from utils.metrics import observe_upstream
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_client():
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(http_client.READ_TIMEOUT, connect=http_client.CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=http_client.POOL_SIZE,
+                                max_keepalive_connections=http_client.POOL_SIZE),
+            headers={"User-Agent": http_client.USER_AGENT},
+            follow_redirects=True
+        )
+    return _client
+
+
+async def aclose():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get(url, retries=None, headers=None):
+    """
+    GET a URL without blocking the event loop.
+
+    Args:
+        url (str): URL to fetch.
+        retries (int): Extra attempts after the first; defaults to UPSTREAM_RETRIES.
+        headers (dict): Optional extra request headers.
+
+    Returns:
+        httpx.Response: The upstream response (the last one if every attempt was retryable).
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open.
+        httpx.TransportError: If every attempt failed at the transport level.
+    """
+    retries = http_client.MAX_RETRIES if retries is None else retries
+    host = urlsplit(url).netloc
+    breaker, stats = host_state(host)
+    client = get_client()
+
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            stats.short_circuited += 1
+            raise CircuitOpenError(f"Circuit open for {host}")
+        if attempt:
+            stats.retries += 1
+            await asyncio.sleep(backoff_delay(attempt - 1))
+
+        start = time.perf_counter()
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            stats.observe(time.perf_counter() - start, error=True)
+            observe_upstream(host, time.perf_counter() - start, "error")
+            breaker.record_failure()
+            logger.warning(f"Upstream error for {url} (attempt {attempt + 1}/{retries + 1}): {e}")
+            if attempt == retries:
+                raise
+            continue
+
+        elapsed = time.perf_counter() - start
+        stats.observe(elapsed, status=response.status_code, error=response.status_code >= 500)
+        observe_upstream(host, elapsed, response.status_code)
+        if response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+            if attempt < retries:
+                continue
+        else:
+            breaker.record_success()
+        return response
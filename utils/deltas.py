@@ -0,0 +1,139 @@
+"""
+Per-match history of scorecard changes as sequenced JSON Patches.
+
+Every time a scorecard is recorded, the tracker diffs it against the previous
+snapshot of the same match and, if anything changed, appends the patch under
+a new sequence number. A client that last saw sequence ``n`` asks for
+``since=n`` and receives only the operations after it; a client that is too
+far behind (or tracking another match) gets a full snapshot to resync from.
+
+Sequence numbers come from one counter shared by every match, so a number
+issued for one match is never valid for another. They are prefixed with a
+random per-process epoch ('3f9c1a2b-42'): with several workers, a ``since``
+issued by another worker (or before a restart) names a snapshot this process
+never had, so the client gets a full snapshot instead of a patch against the
+wrong base.
+"""
+
+import itertools
+import secrets
+import threading
+from collections import deque
+
+from utils import jsonpatch
+from utils.cache import TTLCache
+from utils.model import as_document
+
+DELTA_HISTORY = 50
+
+
+def new_epoch():
+    """Random prefix that keeps one process's sequence numbers apart from every other's."""
+    return secrets.token_hex(4)
+
+
+class DeltaLog:
+    """
+    Latest snapshot of one match plus its recent patches.
+
+    Args:
+        counter: Shared iterator of sequence numbers.
+        history (int): Patches kept for catching up.
+        epoch (str): Prefix of the sequence numbers ``counter`` issues.
+    """
+
+    def __init__(self, counter, history=DELTA_HISTORY, epoch=""):
+        self._counter = counter
+        self.epoch = epoch
+        self.seq = None
+        self.document = None
+        self._patches = deque(maxlen=history)  # (from_seq, to_seq, ops)
+        self._lock = threading.Lock()
+
+    def record(self, document):
+        """Store a new snapshot; returns the current sequence number."""
+        with self._lock:
+            if self.seq is None:
+                self.seq = next(self._counter)
+                self.document = document
+            elif document != self.document:
+                ops = jsonpatch.diff(self.document, document)
+                new_seq = next(self._counter)
+                self._patches.append((self.seq, new_seq, ops))
+                self.seq = new_seq
+                self.document = document
+            return self.seq
+
+    def since(self, seq):
+        """
+        Operations that bring a client at ``seq`` up to date.
+
+        Returns:
+            tuple: (current seq, patch ops), or None if ``seq`` is unknown,
+            from another process, or older than the retained history, meaning
+            the client must resync.
+        """
+        if not isinstance(seq, str) or not seq.startswith(f"{self.epoch}-"):
+            return None
+        with self._lock:
+            if seq == self.seq:
+                return self.seq, []
+            ops = None
+            for from_seq, _, patch in self._patches:
+                if ops is None and from_seq == seq:
+                    ops = []
+                if ops is not None:
+                    ops.extend(patch)
+            return None if ops is None else (self.seq, ops)
+
+    def snapshot(self):
+        with self._lock:
+            return self.seq, self.document
+
+
+class DeltaTracker:
+    """
+    DeltaLogs for the most recently updated matches.
+
+    Args:
+        maxsize (int): Matches tracked before the least recently used is dropped.
+        history (int): Patches kept per match.
+    """
+
+    def __init__(self, maxsize=64, history=DELTA_HISTORY):
+        self.history = history
+        self._logs = TTLCache(maxsize=maxsize)
+        self.epoch = new_epoch()
+        self._counter = (f"{self.epoch}-{n}" for n in itertools.count(1))
+        self._lock = threading.Lock()
+
+    def record(self, match_id, scorecard):
+        """Record a scorecard for a match and return its DeltaLog."""
+        match_id = str(match_id)
+        with self._lock:
+            log = self._logs.get(match_id)
+            if log is None:
+                log = DeltaLog(self._counter, self.history, self.epoch)
+                self._logs.set(match_id, log)
+        log.record(as_document(scorecard))
+        return log
+
+    def delta(self, match_id, scorecard, since=None):
+        """
+        Record the latest scorecard and build the response for a client at ``since``.
+
+        Returns:
+            dict: ``{"type": "patch", "seq", "since", "patch"}`` when the client
+            can catch up, otherwise ``{"type": "snapshot", "seq", "scorecard"}``.
+        """
+        log = self.record(match_id, scorecard)
+        if since is not None:
+            caught_up = log.since(since)
+            if caught_up is not None:
+                seq, ops = caught_up
+                return {"match_id": str(match_id), "type": "patch", "seq": seq, "since": since, "patch": ops}
+        seq, document = log.snapshot()
+        return {"match_id": str(match_id), "type": "snapshot", "seq": seq, "scorecard": document}
+
+    def __len__(self):
+        return len(self._logs)
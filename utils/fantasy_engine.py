@@ -0,0 +1,232 @@
+"""
+Vectorized season-wide fantasy points engine.
+
+Scorecards are flattened into one row per (match, player) with one numpy
+column per stat, so a scoring table is applied to every player of every
+match in a single pass instead of one calculate_total_points() call per player.
+"""
+
+import numpy as np
+
+from utils.fantasy_points import DEFAULT_SCORING
+
+COLUMNS = (
+    'runs', 'fours', 'sixes', 'balls_faced', 'wickets', 'lbw_bowled', 'balls_bowled',
+    'runs_conceded', 'maidens', 'catches', 'stumpings', 'run_outs_direct', 'run_outs_others', 'dismissed'
+)
+
+
+def clean_player_name(name):
+    """Collapse whitespace and drop role markers such as '(c)' and '(wk)'."""
+    name = " ".join(name.split())
+    for marker in ("(c & wk)", "(c)", "(wk)"):
+        name = name.replace(marker, "")
+    return " ".join(name.split())
+
+
+def roster_resolver(playing_eleven):
+    """
+    Map scorecard row names to the full names of a team's playing XI.
+
+    Cricbuzz often prints only part of a name in batting and bowling rows
+    ('Narine', 'Rahul'), which would split one player into several. A row
+    name becomes the team's XI member whose name contains all of its words,
+    if exactly one does. Both the season engine and the player index resolve
+    names this way, so they agree on every player's totals.
+
+    Returns:
+        callable: (row name, team) to the player's name.
+    """
+    rosters = {team: [clean_player_name(name) for name in names] for team, names in (playing_eleven or {}).items()}
+
+    def resolve(name, team):
+        name = clean_player_name(name)
+        roster = rosters.get(team)
+        if not roster or name in roster:
+            return name
+        words = set(name.lower().split())
+        matches = [full for full in roster if words <= set(full.lower().split())]
+        return matches[0] if len(matches) == 1 else name
+
+    return resolve
+
+
+def _bands(values, bands):
+    if not bands:
+        return np.zeros_like(values)
+    conditions = [(values >= lower) & (values < upper) for lower, upper, _ in bands]
+    return np.select(conditions, [points for _, _, points in bands], default=0)
+
+
+def score_columns(columns, table=None):
+    """
+    Apply a scoring table to stat columns.
+
+    Args:
+        columns (dict): Column name to 1-D numpy array, see COLUMNS.
+        table (dict): Scoring table; defaults to DEFAULT_SCORING.
+
+    Returns:
+        numpy.ndarray: Fantasy points per row.
+    """
+    table = table or DEFAULT_SCORING
+    points = np.zeros(len(columns['runs']), dtype=np.float64)
+
+    for stat, weight in table.get("per_unit", {}).items():
+        if stat in columns:
+            points += weight * columns[stat]
+
+    for stat, milestones in table.get("milestones", {}).items():
+        bonus = np.zeros_like(points)
+        for minimum, milestone_points in milestones:
+            bonus = np.where(columns[stat] >= minimum, milestone_points, bonus)
+        points += bonus
+
+    runs, balls_faced = columns['runs'], columns['balls_faced']
+    points += np.where((balls_faced > 0) & (runs == 0) & (columns['dismissed'] > 0), table.get("duck", 0), 0)
+
+    sr_eligible = balls_faced >= table.get("strike_rate_min_balls", np.inf)
+    strike_rate = runs * 100.0 / np.maximum(balls_faced, 1)
+    points += np.where(sr_eligible, _bands(strike_rate, table.get("strike_rate")), 0)
+
+    balls_bowled = columns['balls_bowled']
+    economy_eligible = (balls_bowled > 0) & (balls_bowled >= table.get("economy_min_overs", np.inf) * 6)
+    economy = columns['runs_conceded'] * 6.0 / np.maximum(balls_bowled, 1)
+    points += np.where(economy_eligible, _bands(economy, table.get("economy")), 0)
+
+    return points
+
+
+class SeasonStats:
+    """
+    Columnar player-match stats for many scorecards.
+
+    Attributes:
+        players (numpy.ndarray): Player name per row.
+        match_ids (numpy.ndarray): Match ID per row.
+        seasons (numpy.ndarray): Season key per row.
+        columns (dict): Stat name to numpy array, see COLUMNS.
+    """
+
+    def __init__(self, players, match_ids, seasons, columns):
+        self.players = np.asarray(players, dtype=object)
+        self.match_ids = np.asarray(match_ids, dtype=object)
+        self.seasons = np.asarray(seasons, dtype=object)
+        self.columns = columns
+        self.match_count = len(set(match_ids))
+        # Integer player codes, computed once so aggregations are plain bincounts.
+        self.player_names, self.player_codes = np.unique(self.players, return_inverse=True)
+        self._code_of = {name: code for code, name in enumerate(self.player_names)}
+
+    def __len__(self):
+        return len(self.players)
+
+    @classmethod
+    def from_scorecards(cls, scorecards):
+        """
+        Build columns from an iterable of (match_id, season, Match).
+
+        A player who both batted and bowled in a match gets a single row; row
+        names are resolved against the playing XI (see roster_resolver).
+        """
+        rows = {}
+        for match_id, season, scorecard in scorecards:
+            resolve = roster_resolver(scorecard.playing_eleven)
+            teams = [innings.team for innings in scorecard.innings]
+            for number, innings in enumerate(scorecard.innings):
+                # Bowlers play for the team batting in the other innings of the pair.
+                fielding_team = teams[number ^ 1] if (number ^ 1) < len(teams) else None
+                for batter in innings.batting:
+                    row = rows.setdefault((match_id, resolve(batter.name, innings.team)), [season, [0] * len(COLUMNS)])
+                    stats = row[1]
+                    stats[0] += batter.runs
+                    stats[1] += batter.fours
+                    stats[2] += batter.sixes
+                    stats[3] += batter.balls
+                    stats[13] += batter.dismissed
+                for bowler in innings.bowling:
+                    row = rows.setdefault((match_id, resolve(bowler.name, fielding_team)),
+                                          [season, [0] * len(COLUMNS)])
+                    stats = row[1]
+                    stats[4] += bowler.wickets
+                    stats[6] += bowler.balls_bowled
+                    stats[7] += bowler.runs
+                    stats[8] += bowler.maidens
+
+        keys = list(rows)
+        matrix = np.array([rows[key][1] for key in keys], dtype=np.float64).reshape(len(keys), len(COLUMNS))
+        columns = {name: matrix[:, i] for i, name in enumerate(COLUMNS)}
+        return cls([key[1] for key in keys], [key[0] for key in keys],
+                   [rows[key][0] for key in keys], columns)
+
+    @classmethod
+    def concat(cls, parts):
+        """Combine the rows of several SeasonStats into one."""
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.from_scorecards([])
+        if len(parts) == 1:
+            return parts[0]
+        columns = {name: np.concatenate([part.columns[name] for part in parts]) for name in COLUMNS}
+        return cls(np.concatenate([part.players for part in parts]),
+                   np.concatenate([part.match_ids for part in parts]),
+                   np.concatenate([part.seasons for part in parts]), columns)
+
+    def extend(self, scorecards):
+        """A new SeasonStats with the rows of more (match_id, season, Match) tuples added."""
+        return SeasonStats.concat([self, SeasonStats.from_scorecards(scorecards)])
+
+    def score(self, table=None):
+        return score_columns(self.columns, table)
+
+    def leaderboard(self, table=None, limit=20):
+        """
+        Rank players by total fantasy points across every scored match.
+
+        Returns:
+            list: Dicts with player, points, matches and average, best first.
+        """
+        if not len(self):
+            return []
+        points = self.score(table)
+        totals = np.bincount(self.player_codes, weights=points)
+        matches = np.bincount(self.player_codes)
+        order = np.argsort(-totals, kind="stable")[:limit]
+        return [
+            {
+                "player": self.player_names[i],
+                "points": round(float(totals[i]), 2),
+                "matches": int(matches[i]),
+                "average": round(float(totals[i] / matches[i]), 2)
+            }
+            for i in order
+        ]
+
+    def player_summary(self, name, table=None):
+        """
+        Aggregate one player's stats and fantasy points.
+
+        Returns:
+            dict: Totals and per-match points, or None if the player has no rows.
+        """
+        code = self._code_of.get(clean_player_name(name))
+        if code is None:
+            return None
+        mask = self.player_codes == code
+        points = self.score(table)[mask]
+        totals = {column: int(values[mask].sum()) for column, values in self.columns.items()}
+        balls_bowled = totals['balls_bowled']
+        return {
+            "player": clean_player_name(name),
+            "matches": int(mask.sum()),
+            "points": round(float(points.sum()), 2),
+            "average_points": round(float(points.mean()), 2),
+            "best_points": round(float(points.max()), 2),
+            "totals": totals,
+            "strike_rate": round(totals['runs'] * 100 / totals['balls_faced'], 2) if totals['balls_faced'] else None,
+            "economy": round(totals['runs_conceded'] * 6 / balls_bowled, 2) if balls_bowled else None,
+            "per_match": [
+                {"match_id": match_id, "season": season, "points": round(float(p), 2)}
+                for match_id, season, p in zip(self.match_ids[mask], self.seasons[mask], points)
+            ]
+        }
@@ -0,0 +1,113 @@
+"""
+Fantasy points scoring.
+
+A scoring table is a plain dict, so alternative rule sets can be registered
+with ``register_scoring_table`` and selected by name:
+
+- ``per_unit``: points per unit of a stat (runs, wickets, catches, ...).
+- ``milestones``: stat -> [(minimum, points), ...]; only the highest reached
+  milestone counts (a century does not also earn the half-century bonus).
+- ``duck``: points when a batter is dismissed for 0 after facing at least one ball.
+- ``economy``: bands of (lower, upper, points) on runs per over, applied
+  once ``economy_min_overs`` have been bowled.
+- ``strike_rate``: bands of (lower, upper, points) on runs per 100 balls,
+  applied once ``strike_rate_min_balls`` have been faced.
+"""
+
+from utils.model import overs_to_balls
+
+STAT_FIELDS = (
+    'runs', 'fours', 'sixes', 'balls_faced', 'dismissed', 'wickets', 'lbw_bowled', 'overs_bowled',
+    'runs_conceded', 'maidens', 'catches', 'stumpings', 'run_outs_direct', 'run_outs_others'
+)
+
+DEFAULT_SCORING = {
+    "per_unit": {
+        "runs": 1,
+        "fours": 1,
+        "sixes": 2,
+        "wickets": 25,
+        "lbw_bowled": 8,
+        "maidens": 12,
+        "catches": 8,
+        "stumpings": 12,
+        "run_outs_direct": 12,
+        "run_outs_others": 6
+    },
+    "milestones": {
+        "runs": [(30, 4), (50, 8), (100, 16)],
+        "wickets": [(3, 4), (4, 8), (5, 16)]
+    },
+    "duck": -2,
+    "economy_min_overs": 2,
+    "economy": [
+        (0, 5, 6), (5, 6, 4), (6, 7, 2),
+        (10, 11, -2), (11, 12, -4), (12, float("inf"), -6)
+    ],
+    "strike_rate_min_balls": 10,
+    "strike_rate": [
+        (170, float("inf"), 6), (150, 170, 4), (130, 150, 2),
+        (60, 70, -2), (50, 60, -4), (0, 50, -6)
+    ]
+}
+
+SCORING_TABLES = {"default": DEFAULT_SCORING}
+
+
+def register_scoring_table(name, table):
+    """Register a scoring table so it can be selected by name."""
+    SCORING_TABLES[name] = table
+
+
+def get_scoring_table(name="default"):
+    """
+    Raises:
+        ValueError: If no table is registered under ``name``.
+    """
+    if name not in SCORING_TABLES:
+        raise ValueError(f"Unknown scoring table: {name}. Valid options: {list(SCORING_TABLES)}")
+    return SCORING_TABLES[name]
+
+
+def _band_points(value, bands):
+    for lower, upper, points in bands:
+        if lower <= value < upper:
+            return points
+    return 0
+
+
+def calculate_total_points(stats, table=None):
+    """
+    Calculate fantasy points for one player's match stats.
+
+    Args:
+        stats: Stat name to value, see STAT_FIELDS: a dict, or a
+            utils.model BattingRow/BowlingRow, which answer ``get`` the same way.
+        table (dict): Scoring table; defaults to DEFAULT_SCORING.
+
+    Returns:
+        float: Total fantasy points.
+    """
+    table = table or DEFAULT_SCORING
+    points = 0
+    for stat, weight in table.get("per_unit", {}).items():
+        points += weight * stats.get(stat, 0)
+
+    for stat, milestones in table.get("milestones", {}).items():
+        bonus = 0
+        for minimum, milestone_points in milestones:
+            if stats.get(stat, 0) >= minimum:
+                bonus = milestone_points
+        points += bonus
+
+    runs, balls_faced = stats.get('runs', 0), stats.get('balls_faced', 0)
+    if balls_faced > 0 and runs == 0 and stats.get('dismissed', 0):
+        points += table.get("duck", 0)
+    if balls_faced >= table.get("strike_rate_min_balls", float("inf")):
+        points += _band_points(runs * 100 / balls_faced, table.get("strike_rate", ()))
+
+    balls_bowled = stats.get('balls_bowled') or overs_to_balls(stats.get('overs_bowled', 0))
+    if balls_bowled and balls_bowled >= table.get("economy_min_overs", float("inf")) * 6:
+        points += _band_points(stats.get('runs_conceded', 0) * 6 / balls_bowled, table.get("economy", ()))
+
+    return points
@@ -1,56 +1,80 @@
 import json
-import requests
-from scrapy.http import HtmlResponse
+import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils import http_client
+from utils.html_backend import parse_html
+from utils.match_index import match_status
 import time
 import logging
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Seasons fetched in parallel, and the polite request rate shared by all of them.
+REFRESH_CONCURRENCY = int(os.environ.get("REFRESH_CONCURRENCY", 4))
+CRICBUZZ_RATE_LIMIT = float(os.environ.get("CRICBUZZ_RATE_LIMIT", 2))
+cricbuzz_rate_limiter = http_client.RateLimiter(CRICBUZZ_RATE_LIMIT)
+
+MATCH_IDS_FILE = "match_ids.json"
+# ETag / Last-Modified validators per season, used for conditional refreshes.
+REFRESH_STATE_FILE = "refresh_state.json"
+
 
 def load_ipl_series():
     with open("ipl_series.json", "r") as f:
         return json.load(f)
 
 
+def season_url(season, series_id):
+    return f"{http_client.CRICBUZZ_BASE_URL}/cricket-series/{series_id}/indian-premier-league-{season[-4:]}/matches"
+
+
+def parse_match_cards(response):
+    match_list = []
+    match_cards = response.xpath('//*[@id="series-matches"]/div')
+
+    match_no = 1
+    for card in match_cards:
+        try:
+            match_venue = card.xpath('.//div[3]/div[1]/div/text()').extract_first()
+            match_result = card.xpath('.//div[3]/div[1]/a[2]/text()').extract_first() or "NA"
+            match_time = card.xpath('.//div[3]/div[2]/div/span[2]/text()').extract_first() or "NA"
+            match_name = card.xpath('.//div[3]/div[1]/a/span/text()').extract_first()
+            match_href = card.xpath('.//div[3]/div[1]/a/@href').extract_first()
+
+            if match_href and "cricket-scores" in match_href:
+                match_id = match_href.split('cricket-scores/')[1].split('/')[0]
+                match_data = {
+                    "match_venue": match_venue.strip() if match_venue else "NA",
+                    "match_result": match_result.strip(),
+                    "match_time": match_time.strip(),
+                    "match_name": match_name.strip() if match_name else "NA",
+                    "match_id": match_id,
+                    "match_no": match_no,
+                    "match_date": "NA"
+                }
+                match_list.append(match_data)
+                match_no += 1
+        except Exception as e:
+            logging.warning(f"⚠️ Error parsing match card: {e}")
+            continue
+    return match_list
+
+
 def fetch_matches_for_season(season, series_id):
     logging.info(f"🔄 Fetching {season} data...")
     match_list = []
-    url = f"https://www.cricbuzz.com/cricket-series/{series_id}/indian-premier-league-{season[-4:]}/matches"
+    url = season_url(season, series_id)
 
     try:
-        cricbuzz_resp = requests.get(url)
+        cricbuzz_resp = http_client.get(url, rate_limiter=cricbuzz_rate_limiter)
         if cricbuzz_resp.status_code != 200:
             logging.warning(f"❌ Failed to fetch {season}. Skipping...")
             return []
 
-        response = HtmlResponse(url=url, body=cricbuzz_resp.text, encoding='utf-8')
-        match_cards = response.xpath('//*[@id="series-matches"]/div')
-
-        match_no = 1
-        for card in match_cards:
-            try:
-                match_venue = card.xpath('.//div[3]/div[1]/div/text()').extract_first()
-                match_result = card.xpath('.//div[3]/div[1]/a[2]/text()').extract_first() or "NA"
-                match_time = card.xpath('.//div[3]/div[2]/div/span[2]/text()').extract_first() or "NA"
-                match_name = card.xpath('.//div[3]/div[1]/a/span/text()').extract_first()
-                match_href = card.xpath('.//div[3]/div[1]/a/@href').extract_first()
-
-                if match_href and "cricket-scores" in match_href:
-                    match_id = match_href.split('cricket-scores/')[1].split('/')[0]
-                    match_data = {
-                        "match_venue": match_venue.strip() if match_venue else "NA",
-                        "match_result": match_result.strip(),
-                        "match_time": match_time.strip(),
-                        "match_name": match_name.strip() if match_name else "NA",
-                        "match_id": match_id,
-                        "match_no": match_no,
-                        "match_date": "NA"
-                    }
-                    match_list.append(match_data)
-                    match_no += 1
-            except Exception as e:
-                logging.warning(f"⚠️ Error parsing match card: {e}")
-                continue
+        response = parse_html(cricbuzz_resp.text, url=url)
+        match_list = parse_match_cards(response)
         logging.info(f"✅ {season}: {len(match_list)} matches fetched")
     except Exception as e:
         logging.error(f"❗ Error fetching {season}: {e}")
@@ -58,30 +82,257 @@ def fetch_matches_for_season(season, series_id):
     return match_list
 
 
-def fetch_all_ipl_matches(season='all', save_to_file=True):
-    refreshed_data = {}
-    ipl_series = load_ipl_series()
+def fetch_season_if_changed(season, series_id, validators=None):
+    """
+    Conditionally fetch a season's match list.
+
+    Sends If-None-Match / If-Modified-Since from the previous response's
+    validators so an unchanged page costs a 304 instead of a download and parse.
+
+    Args:
+        season (str): Season key, e.g. 'IPL2025'.
+        series_id (int): Cricbuzz series ID.
+        validators (dict): Previous {"etag", "last_modified"} for this season.
+
+    Returns:
+        tuple: (status, matches, validators) where status is 'fetched',
+            'not_modified' or 'failed' and matches is None unless fetched.
+    """
+    validators = validators or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    url = season_url(season, series_id)
+    try:
+        cricbuzz_resp = http_client.get(url, headers=headers or None, rate_limiter=cricbuzz_rate_limiter)
+    except Exception as e:
+        logging.error(f"❗ Error fetching {season}: {e}")
+        return "failed", None, validators
+
+    if cricbuzz_resp.status_code == 304:
+        logging.info(f"⏸️ {season}: not modified")
+        return "not_modified", None, validators
+    if cricbuzz_resp.status_code != 200:
+        logging.warning(f"❌ Failed to fetch {season} (HTTP {cricbuzz_resp.status_code}).")
+        return "failed", None, validators
+
+    response = parse_html(cricbuzz_resp.text, url=url)
+    matches = parse_match_cards(response)
+    logging.info(f"✅ {season}: {len(matches)} matches fetched")
+    new_validators = {
+        "etag": cricbuzz_resp.headers.get("ETag"),
+        "last_modified": cricbuzz_resp.headers.get("Last-Modified")
+    }
+    return "fetched", matches, new_validators
 
-    # Normalize season key
+
+def resolve_seasons(season, ipl_series=None):
+    """
+    Map a season argument ('all', '2025' or 'IPL2025') to season keys and series IDs.
+
+    Raises:
+        ValueError: If the season is not in ipl_series.json.
+    """
+    ipl_series = ipl_series if ipl_series is not None else load_ipl_series()
     if season.lower() == 'all':
-        for season_key, series_id in ipl_series.items():
-            matches = fetch_matches_for_season(season_key, series_id)
-            refreshed_data[season_key] = matches
-            time.sleep(1)
-    else:
-        # Accept both IPL2025 or 2025
-        season_key = season.upper() if season.upper().startswith("IPL") else f"IPL{season}"
-        if season_key in ipl_series:
-            series_id = ipl_series[season_key]
-            matches = fetch_matches_for_season(season_key, series_id)
-            refreshed_data[season_key] = matches
-        else:
-            valid_keys = list(ipl_series.keys())
-            raise ValueError(f"Invalid season: {season}. Valid options: {valid_keys}")
+        return dict(ipl_series)
+
+    # Accept both IPL2025 or 2025
+    season_key = season.upper() if season.upper().startswith("IPL") else f"IPL{season}"
+    if season_key not in ipl_series:
+        valid_keys = list(ipl_series.keys())
+        raise ValueError(f"Invalid season: {season}. Valid options: {valid_keys}")
+    return {season_key: ipl_series[season_key]}
+
+
+def _timed_fetch(season_key, series_id):
+    start = time.perf_counter()
+    matches = fetch_matches_for_season(season_key, series_id)
+    return matches, time.perf_counter() - start
+
+
+def fetch_all_ipl_matches(season='all', save_to_file=True, max_workers=None, timings=None):
+    """
+    Fetch match lists for one or all seasons, several seasons at a time.
+
+    Seasons are fetched on a thread pool of ``max_workers`` (REFRESH_CONCURRENCY
+    by default) while every request shares one per-host rate limiter.
+
+    Args:
+        season (str): 'all', '2025' or 'IPL2025'.
+        save_to_file (bool): Write the result to match_ids.json.
+        max_workers (int): Seasons fetched concurrently.
+        timings (dict): Optional dict filled with per-season
+            ``{"seconds": float, "matches": int}`` as each season completes.
+
+    Returns:
+        dict: Season key to list of matches, in ipl_series.json order.
+    """
+    seasons = resolve_seasons(season)
+    max_workers = max(1, min(max_workers or REFRESH_CONCURRENCY, len(seasons)))
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="season-refresh") as executor:
+        futures = {executor.submit(_timed_fetch, season_key, series_id): season_key
+                   for season_key, series_id in seasons.items()}
+        fetched = {}
+        for future in as_completed(futures):
+            season_key = futures[future]
+            matches, seconds = future.result()
+            fetched[season_key] = matches
+            if timings is not None:
+                timings[season_key] = {"seconds": round(seconds, 3), "matches": len(matches)}
+    refreshed_data = {season_key: fetched[season_key] for season_key in seasons}
 
     if save_to_file:
-        with open("match_ids.json", "w") as f:
-            json.dump(refreshed_data, f, indent=2)
+        # Merge into the existing file so a single-season refresh keeps every other season.
+        # A failed fetch comes back empty and must not replace a season that is on disk.
+        stored = load_match_ids()
+        for season_key, matches in refreshed_data.items():
+            if matches:
+                stored[season_key] = matches
+            elif stored.get(season_key):
+                logging.warning(f"⚠️ {season_key}: no matches fetched, keeping the stored list")
+        write_json_atomic(MATCH_IDS_FILE, stored)
         logging.info("📄 match_ids.json updated successfully.")
 
     return refreshed_data
+
+
+# --------------- Incremental refresh ---------------
+
+def write_json_atomic(path, data):
+    """
+    Write JSON via a temp file in the same directory and os.replace().
+
+    Readers see either the old file or the complete new one, never a partial write.
+    The file keeps its permissions (mkstemp creates the temp file owner-only);
+    a new file gets the usual 0666 minus the umask.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _file_mode(path):
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_match_ids(path=None):
+    try:
+        with open(path or MATCH_IDS_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def season_can_change(season, matches, latest_season):
+    """A season can still change if it is the latest one or has matches that are not played yet."""
+    return season == latest_season or not matches or any(
+        match_status(m.get("match_result")) == "scheduled" for m in matches)
+
+
+def diff_matches(old_matches, new_matches):
+    """
+    Merge a freshly fetched match list over the stored one.
+
+    Unchanged records keep their existing objects; only added or modified
+    records are taken from the new list.
+
+    Returns:
+        tuple: (merged list, {"added": n, "updated": n, "removed": n}).
+    """
+    old_by_id = {m["match_id"]: m for m in old_matches}
+    new_ids = {m["match_id"] for m in new_matches}
+    merged, added, updated = [], 0, 0
+    for match in new_matches:
+        old = old_by_id.get(match["match_id"])
+        if old is None:
+            added += 1
+            merged.append(match)
+        elif old != match:
+            updated += 1
+            merged.append(match)
+        else:
+            merged.append(old)
+    removed = sum(1 for match_id in old_by_id if match_id not in new_ids)
+    return merged, {"added": added, "updated": updated, "removed": removed}
+
+
+def refresh_ipl_matches(season=None, max_workers=None, timings=None):
+    """
+    Incrementally refresh match_ids.json.
+
+    Only seasons that can still change are re-fetched (or just ``season`` if
+    given), using conditional requests. Changed records are merged into the
+    stored data, which is rewritten atomically only if something changed.
+
+    Args:
+        season (str): Optional single season to refresh ('2025' or 'IPL2025').
+        max_workers (int): Seasons fetched concurrently.
+        timings (dict): Optional dict filled with the per-season summary as seasons complete.
+
+    Returns:
+        dict: Season key to {"status": "changed"|"unchanged"|"not_modified"|"failed",
+            "added", "updated", "removed", "seconds"}.
+    """
+    ipl_series = load_ipl_series()
+    stored = load_match_ids()
+    state = load_match_ids(REFRESH_STATE_FILE)
+
+    if season:
+        seasons = resolve_seasons(season, ipl_series)
+    else:
+        latest = max(ipl_series) if ipl_series else None
+        seasons = {key: series_id for key, series_id in ipl_series.items()
+                   if season_can_change(key, stored.get(key, []), latest)}
+
+    def refresh_one(season_key, series_id):
+        start = time.perf_counter()
+        status, matches, validators = fetch_season_if_changed(season_key, series_id, state.get(season_key))
+        return status, matches, validators, time.perf_counter() - start
+
+    summary = timings if timings is not None else {}
+    changed = False
+    max_workers = max(1, min(max_workers or REFRESH_CONCURRENCY, len(seasons) or 1))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="season-refresh") as executor:
+        futures = {executor.submit(refresh_one, key, series_id): key for key, series_id in seasons.items()}
+        for future in as_completed(futures):
+            season_key = futures[future]
+            status, matches, validators, seconds = future.result()
+            counts = {"added": 0, "updated": 0, "removed": 0}
+            if status == "fetched":
+                merged, counts = diff_matches(stored.get(season_key, []), matches)
+                if any(counts.values()) or season_key not in stored:
+                    stored[season_key] = merged
+                    status, changed = "changed", True
+                else:
+                    status = "unchanged"
+                state[season_key] = validators
+            summary[season_key] = dict(counts, status=status, seconds=round(seconds, 3))
+
+    if changed:
+        # Keep seasons in ipl_series.json order.
+        ordered = {key: stored[key] for key in ipl_series if key in stored}
+        ordered.update({key: value for key, value in stored.items() if key not in ordered})
+        write_json_atomic(MATCH_IDS_FILE, ordered)
+        logging.info("📄 match_ids.json updated incrementally.")
+    write_json_atomic(REFRESH_STATE_FILE, state)
+
+    return summary
@@ -0,0 +1,133 @@
+"""
+Pluggable HTML parser backends.
+
+Every scraper in this project only needs XPath over an HTML string. The
+default ``lxml`` backend provides that directly on lxml with a small
+Scrapy-compatible selector API (``xpath``, ``extract``, ``extract_first``,
+``.root``), so serving never imports Scrapy/Twisted. The ``scrapy`` backend
+builds a ``scrapy.http.HtmlResponse`` and is imported lazily, only when selected;
+without Scrapy installed it falls back to lxml.
+
+Select a backend with HTML_PARSER_BACKEND, or register another one with
+``register_backend``.
+"""
+
+import logging
+import os
+
+from lxml import etree, html as lxml_html
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER_BACKEND = os.environ.get("HTML_PARSER_BACKEND", "lxml")
+
+# Same parser settings Scrapy uses (through parsel), so both backends build identical trees.
+_parser = lxml_html.HTMLParser(recover=True, encoding="utf-8")
+
+
+class Selector:
+    """One XPath result: an element (``root`` is the lxml element) or a text/attribute string."""
+
+    __slots__ = ("root",)
+
+    def __init__(self, root):
+        self.root = root
+
+    def xpath(self, query):
+        if isinstance(self.root, str):
+            return SelectorList()
+        return SelectorList(_wrap(result) for result in self.root.xpath(query))
+
+    def extract(self):
+        if isinstance(self.root, str):
+            return self.root
+        return etree.tostring(self.root, encoding="unicode", method="html", with_tail=False)
+
+    get = extract
+
+    def __repr__(self):
+        return f"<Selector root={self.root!r}>"
+
+
+class SelectorList(list):
+    """List of Selectors with the bulk helpers Scrapy's SelectorList offers."""
+
+    def xpath(self, query):
+        return SelectorList(item for selector in self for item in selector.xpath(query))
+
+    def extract(self):
+        return [selector.extract() for selector in self]
+
+    getall = extract
+
+    def extract_first(self, default=None):
+        return self[0].extract() if self else default
+
+    get = extract_first
+
+
+def _wrap(result):
+    if isinstance(result, str):
+        return Selector(str(result))
+    return Selector(result)
+
+
+class LxmlDocument(Selector):
+    """
+    Parsed HTML document.
+
+    Args:
+        text (str): HTML body.
+        url (str): Source URL, kept for error messages and relative links.
+    """
+
+    __slots__ = ("url",)
+
+    def __init__(self, text, url=None):
+        body = text.strip().replace("\x00", "").encode("utf-8") or b"<html/>"
+        root = etree.fromstring(body, parser=_parser, base_url=url)
+        if root is None:
+            root = etree.fromstring(b"<html/>", parser=_parser, base_url=url)
+        super().__init__(root)
+        self.url = url
+
+
+def _scrapy_document(text, url=None):
+    try:
+        from scrapy.http import HtmlResponse
+    except ImportError:
+        # Both backends build the same tree, so a missing Scrapy only costs its speed profile.
+        if BACKENDS.get("scrapy") is _scrapy_document:
+            logger.warning("HTML_PARSER_BACKEND=scrapy but Scrapy is not installed; using lxml")
+            BACKENDS["scrapy"] = LxmlDocument
+        return LxmlDocument(text, url)
+    return HtmlResponse(url=url or "about:blank", body=text, encoding="utf-8")
+
+
+BACKENDS = {"lxml": LxmlDocument, "scrapy": _scrapy_document}
+
+
+def register_backend(name, factory):
+    """Register a backend: ``factory(text, url)`` must return an object with ``xpath()``."""
+    BACKENDS[name] = factory
+
+
+def parse_html(text, url=None, backend=None):
+    """
+    Parse an HTML string with the configured backend.
+
+    Args:
+        text (str): HTML body.
+        url (str): Source URL.
+        backend (str): Backend name; defaults to HTML_PARSER_BACKEND.
+
+    Returns:
+        Document supporting Scrapy-style ``xpath()`` queries.
+
+    Raises:
+        ValueError: If the backend is not registered.
+    """
+    name = backend or HTML_PARSER_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}. Valid options: {list(BACKENDS)}")
+    return BACKENDS[name](text, url)
@@ -0,0 +1,253 @@
+"""
+Shared HTTP layer for every Cricbuzz request.
+
+One pooled keep-alive ``requests.Session`` is reused across calls. Every request
+gets connect/read timeouts, bounded retries with jittered exponential backoff,
+and a per-host circuit breaker, and its latency is recorded for ``/debug/stats``.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.metrics import observe_upstream
+
+logger = logging.getLogger(__name__)
+
+# Overridable so benchmarks can point every fetch at a local stand-in.
+CRICBUZZ_BASE_URL = os.environ.get("CRICBUZZ_BASE_URL", "https://www.cricbuzz.com").rstrip("/")
+CONNECT_TIMEOUT = float(os.environ.get("UPSTREAM_CONNECT_TIMEOUT", 3.05))
+READ_TIMEOUT = float(os.environ.get("UPSTREAM_READ_TIMEOUT", 10))
+MAX_RETRIES = int(os.environ.get("UPSTREAM_RETRIES", 2))
+BACKOFF_BASE = float(os.environ.get("UPSTREAM_BACKOFF_BASE", 0.25))
+BACKOFF_MAX = float(os.environ.get("UPSTREAM_BACKOFF_MAX", 4))
+POOL_SIZE = int(os.environ.get("UPSTREAM_POOL_SIZE", 20))
+BREAKER_THRESHOLD = int(os.environ.get("UPSTREAM_BREAKER_THRESHOLD", 5))
+BREAKER_COOLDOWN = float(os.environ.get("UPSTREAM_BREAKER_COOLDOWN", 30))
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+USER_AGENT = "Mozilla/5.0 (compatible; ipl-scorecard-api)"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without touching the network while a host's circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``threshold`` failed requests in a row the circuit opens and calls
+    fail fast for ``cooldown`` seconds; the next call after that is a trial
+    request that closes the circuit on success.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # Half-open: let one trial request through.
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive upstream failures")
+                self.opened_at = time.monotonic()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "open" if time.monotonic() - self.opened_at < self.cooldown else "half-open"
+
+
+class RateLimiter:
+    """
+    Minimum spacing between requests, shared by every thread that uses it.
+
+    Args:
+        rate (float): Maximum requests per second; 0 disables limiting.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LatencyStats:
+    """Per-host request counters and a rolling window of latencies."""
+
+    def __init__(self, window=500):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.short_circuited = 0
+        self.status_codes = {}
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, status=None, error=False):
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(seconds)
+            if error:
+                self.errors += 1
+            if status is not None:
+                self.status_codes[status] = self.status_codes.get(status, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "retries": self.retries,
+                "short_circuited": self.short_circuited,
+                "status_codes": dict(self.status_codes)
+            }
+        if latencies:
+            pick = lambda q: round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 2)
+            stats["latency_ms"] = {
+                "avg": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50": pick(0.50),
+                "p95": pick(0.95),
+                "p99": pick(0.99),
+                "max": round(latencies[-1] * 1000, 2)
+            }
+        return stats
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+session = _build_session()
+_breakers = {}
+_stats = {}
+_registry_lock = threading.Lock()
+
+
+def host_state(host):
+    with _registry_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+            _stats[host] = LatencyStats()
+        return _breakers[host], _stats[host]
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff: uniform(0, min(max, base * 2**attempt))."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def get(url, timeout=None, retries=None, headers=None, rate_limiter=None):
+    """
+    GET a URL through the shared pooled session.
+
+    Connection errors, timeouts and 429/5xx responses are retried with
+    jittered backoff. If every attempt returns a retryable status, the last
+    response is returned so callers can inspect ``status_code`` as before.
+
+    Args:
+        url (str): URL to fetch.
+        timeout (tuple|float): (connect, read) timeout; defaults to module settings.
+        retries (int): Extra attempts after the first; defaults to UPSTREAM_RETRIES.
+        headers (dict): Optional extra request headers.
+        rate_limiter (RateLimiter): Optional limiter acquired before every attempt.
+
+    Returns:
+        requests.Response: The upstream response.
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open.
+        requests.RequestException: If every attempt failed at the transport level.
+    """
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    retries = MAX_RETRIES if retries is None else retries
+    breaker, stats = host_state(urlsplit(url).netloc)
+
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            stats.short_circuited += 1
+            raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}")
+        if attempt:
+            stats.retries += 1
+            time.sleep(backoff_delay(attempt - 1))
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = session.get(url, timeout=timeout, headers=headers)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            stats.observe(time.perf_counter() - start, error=True)
+            observe_upstream(urlsplit(url).netloc, time.perf_counter() - start, "error")
+            breaker.record_failure()
+            logger.warning(f"Upstream error for {url} (attempt {attempt + 1}/{retries + 1}): {e}")
+            if attempt == retries:
+                raise
+            continue
+
+        elapsed = time.perf_counter() - start
+        stats.observe(elapsed, status=response.status_code, error=response.status_code >= 500)
+        observe_upstream(urlsplit(url).netloc, elapsed, response.status_code)
+        if response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+            if attempt < retries:
+                continue
+        else:
+            breaker.record_success()
+        return response
+
+
+def upstream_stats():
+    """
+    Return request counters, latency percentiles and breaker state per upstream host.
+
+    Returns:
+        dict: Host to stats mapping.
+    """
+    with _registry_lock:
+        hosts = list(_stats)
+    return {host: dict(_stats[host].snapshot(), circuit=_breakers[host].state) for host in hosts}
@@ -0,0 +1,105 @@
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJob:
+    """
+    A callable run on a daemon thread, with status that can be polled.
+
+    The target is called as ``target(job, *args, **kwargs)`` so it can publish
+    progress by updating ``job.progress`` while it runs.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name, target, *args, **kwargs):
+        self.id = f"{name}-{next(self._ids)}"
+        self.name = name
+        self.status = "pending"
+        self.progress = {}
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs
+        self._thread = threading.Thread(target=self._run, name=self.id, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _run(self):
+        self.status = "running"
+        self.started_at = time.time()
+        try:
+            self.result = self._target(self, *self._args, **self._kwargs)
+            self.status = "succeeded"
+        except Exception as e:
+            logger.exception(f"Job {self.id} failed")
+            self.error = str(e)
+            self.status = "failed"
+        finally:
+            self.finished_at = time.time()
+
+    @property
+    def done(self):
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self):
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else None
+        }
+
+
+class JobRegistry:
+    """Keeps recent jobs by id and allows at most one running job per name."""
+
+    def __init__(self, keep=20):
+        self.keep = keep
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def start(self, name, target, *args, **kwargs):
+        """
+        Start a job unless one with the same name is still running.
+
+        Returns:
+            tuple: (job, created) where created is False if an existing job was returned.
+        """
+        with self._lock:
+            for job in reversed(list(self._jobs.values())):
+                if job.name == name and not job.done:
+                    return job, False
+            job = BackgroundJob(name, target, *args, **kwargs)
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.keep:
+                self._jobs.pop(next(iter(self._jobs)))
+        return job.start(), True
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def latest(self, name):
+        for job in reversed(list(self._jobs.values())):
+            if job.name == name:
+                return job
+        return None
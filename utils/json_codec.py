@@ -0,0 +1,179 @@
+"""
+Pluggable JSON encoding, plus pre-serialized payloads for immutable responses.
+
+``dumps`` produces the same canonical form as Flask's ``jsonify`` (sorted keys,
+compact separators) using orjson when it is installed, falling back to the
+standard library for anything orjson refuses. ``FastJSONProvider`` routes
+every ``jsonify`` in the Flask app through it.
+
+A ``Payload`` holds a document that will never change (the match list for one
+version of match_ids.json, a completed scorecard) as encoded bytes with its
+ETag, and compresses them at most once per content coding, so serving it again
+copies bytes instead of re-encoding.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKEND = os.environ.get("JSON_BACKEND", "orjson" if orjson is not None else "json").lower()
+# Payloads smaller than this are not worth compressing.
+PRECOMPRESS_MIN_BYTES = int(os.environ.get("PRECOMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.environ.get("GZIP_LEVEL", 6))
+
+if JSON_BACKEND == "orjson" and orjson is None:
+    logger.warning("JSON_BACKEND=orjson but orjson is not installed; using the json module")
+    JSON_BACKEND = "json"
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _default(obj):
+    """Encode model objects (see utils.model) through their ``to_dict``."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _json_dumps(obj, default=None):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=default or _default).encode("utf-8")
+
+
+def dumps(obj, default=None):
+    """
+    Encode a JSON-compatible object with sorted keys and compact separators.
+
+    Args:
+        obj: Object to encode.
+        default (callable): Converts objects the encoder does not support;
+            by default objects with a ``to_dict`` method are encoded as its result.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.dumps(obj, default=default or _default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the json module copes
+    return _json_dumps(obj, default)
+
+
+def loads(data):
+    """Decode JSON from bytes or str."""
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with ``dumps``."""
+
+    @staticmethod
+    def default(obj):
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() - {"separators"}:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj, default=self.default) + b"\n", mimetype=self.mimetype)
+
+
+def _compress(body, coding):
+    if coding == "br":
+        return brotli.compress(body)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def accepted_codings(accept_encoding):
+    """Content codings the client accepts, most preferred first (br, then gzip)."""
+    offered = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[coding.strip().lower()] = q
+    codings = ["br"] if brotli is not None else []
+    codings.append("gzip")
+    return [c for c in codings if offered.get(c, offered.get("*", 0)) > 0]
+
+
+class Payload:
+    """
+    Immutable, pre-serialized JSON response body.
+
+    Args:
+        body (bytes): Encoded JSON, including the trailing newline.
+        etag (str): Strong ETag for the identity body; defaults to its SHA-1.
+    """
+
+    __slots__ = ("body", "etag", "_encoded")
+
+    def __init__(self, body, etag=None):
+        self.body = body
+        self.etag = etag or hashlib.sha1(body).hexdigest()
+        self._encoded = {}
+
+    @classmethod
+    def from_obj(cls, obj, etag=None):
+        """Encode ``obj`` exactly as ``jsonify`` would (trailing newline included)."""
+        return cls(dumps(obj) + b"\n", etag)
+
+    def etag_for(self, coding=None):
+        """ETag of one representation; compressed bodies get their own, as strong validators must."""
+        return self.etag if coding is None else f"{self.etag}-{coding}"
+
+    def encoded(self, accept_encoding=None):
+        """
+        Pick the best representation for an Accept-Encoding header.
+
+        Compressed bodies are built on first use and kept with the payload.
+
+        Returns:
+            tuple: (body bytes, content coding or None for identity).
+        """
+        if len(self.body) < PRECOMPRESS_MIN_BYTES:
+            return self.body, None
+        for coding in accepted_codings(accept_encoding):
+            body = self._encoded.get(coding)
+            if body is None:
+                body = self._encoded[coding] = _compress(self.body, coding)
+            return body, coding
+        return self.body, None
+
+    def __len__(self):
+        return len(self.body)
@@ -0,0 +1,90 @@
+"""
+Minimal JSON Patch (RFC 6902) diff and apply for JSON-compatible documents.
+
+``diff`` emits only ``add``, ``remove`` and ``replace`` operations: dicts are
+compared key by key, lists index by index (appending or trimming at the end),
+and anything else is replaced wholesale. That is enough to describe a live
+scorecard update as a handful of small operations.
+"""
+
+
+def _escape(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old, new, path=""):
+    """
+    Compute the JSON Patch that turns ``old`` into ``new``.
+
+    Returns:
+        list: Patch operations; empty if the documents are equal.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(diff(old[i], new[i], f"{path}/{i}"))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply(document, patch):
+    """
+    Apply ``add``/``remove``/``replace`` operations to a document in place.
+
+    Returns:
+        The patched document (a new object when the whole document is replaced).
+
+    Raises:
+        ValueError: On an unsupported operation.
+    """
+    for op in patch:
+        if op["path"] == "":
+            if op["op"] not in ("add", "replace"):
+                raise ValueError(f"Cannot {op['op']} the document root")
+            document = op["value"]
+            continue
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            index = len(target) if last == "-" else int(last)
+            if op["op"] == "add":
+                target.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del target[index]
+            elif op["op"] == "replace":
+                target[index] = op["value"]
+            else:
+                raise ValueError(f"Unsupported JSON Patch operation: {op['op']}")
+        else:
+            if op["op"] in ("add", "replace"):
+                target[last] = op["value"]
+            elif op["op"] == "remove":
+                del target[last]
+            else:
+                raise ValueError(f"Unsupported JSON Patch operation: {op['op']}")
+    return document
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+
+from utils import json_codec, jsonpatch
+from utils.deltas import new_epoch
+from utils.model import as_document
+
+logger = logging.getLogger(__name__)
+
+# Versions whose encoded patch events are kept for subscribers that fall behind.
+PATCH_HISTORY = 16
+
+
+class LivePoller:
+    """
+    Background thread that keeps the latest live IPL scorecard in memory.
+
+    Every ``interval`` seconds it resolves the live match id and refreshes its
+    scorecard. Readers take the in-memory snapshot and never wait on Cricbuzz;
+    stream subscribers are woken only when the scorecard actually changes.
+
+    Args:
+        find_match_id (callable): Returns the live match id, or -1 if none.
+        fetch_scorecard (callable): Fetches and parses a scorecard by match id.
+        interval (float): Seconds between refreshes.
+    """
+
+    def __init__(self, find_match_id, fetch_scorecard, interval=10.0):
+        self.find_match_id = find_match_id
+        self.fetch_scorecard = fetch_scorecard
+        self.interval = interval
+        self.version = 0
+        # Prefix of SSE event ids, so ids from different workers never collide.
+        self.epoch = new_epoch()
+        self.match_id = None
+        self.scorecard = None
+        self.updated_at = None
+        self.last_error = None
+        # Encoded SSE events, built once per version and shared by every subscriber.
+        self._scorecard_event = (None, None)
+        self._patch_events = {}
+        self._changed = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the polling thread once; safe to call on every request."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="live-poller", daemon=True)
+                self._thread.start()
+                logger.info(f"Live poller started (interval {self.interval}s)")
+
+    def stop(self):
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll_once()
+            self._stop.wait(self.interval)
+
+    def poll_once(self):
+        """Refresh the snapshot and notify subscribers if the scorecard changed."""
+        try:
+            match_id = self.find_match_id()
+            scorecard = None if match_id == -1 else self.fetch_scorecard(match_id)
+            self.last_error = None
+        except Exception as e:
+            logger.warning(f"Live poller refresh failed: {e}")
+            self.last_error = str(e)
+            return
+
+        match_id = None if match_id == -1 else str(match_id)
+        with self._changed:
+            self.updated_at = time.time()
+            if match_id == self.match_id and scorecard == self.scorecard:
+                return
+            patch_event = None
+            if match_id is not None and match_id == self.match_id:
+                patch_event = self._encode_patch(self.version + 1, self.scorecard, scorecard)
+            self.match_id = match_id
+            self.scorecard = scorecard
+            self.version += 1
+            self._patch_events[self.version] = patch_event
+            self._patch_events.pop(self.version - PATCH_HISTORY, None)
+            self._changed.notify_all()
+
+    def _encode_patch(self, version, old, new):
+        event_id = self.event_id(version)
+        delta = {
+            "match_id": self.match_id,
+            "seq": event_id,
+            "since": self.event_id(version - 1),
+            "patch": jsonpatch.diff(as_document(old), as_document(new))
+        }
+        return f"id: {event_id}\nevent: patch\ndata: {json_codec.dumps(delta).decode()}\n\n"
+
+    def is_fresh(self):
+        """True if the snapshot was refreshed within the last few intervals."""
+        return self.updated_at is not None and time.time() - self.updated_at < 3 * self.interval
+
+    def snapshot(self):
+        with self._changed:
+            return {
+                "version": self.version,
+                "match_id": self.match_id,
+                "updated_at": self.updated_at,
+                "scorecard": self.scorecard
+            }
+
+    def stats(self):
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "interval": self.interval,
+            "version": self.version,
+            "match_id": self.match_id,
+            "updated_at": self.updated_at,
+            "last_error": self.last_error
+        }
+
+    def event_id(self, version):
+        """SSE event id of a snapshot version: '<epoch>-<version>'."""
+        return f"{self.epoch}-{version}"
+
+    def wait_for_change(self, version, timeout):
+        """Block until the snapshot version moves past ``version`` or ``timeout`` elapses."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version or self._stop.is_set(), timeout=timeout)
+            return self.version != version
+
+    def events_since(self, version=None, patches=False):
+        """
+        Encoded SSE events that bring a subscriber from ``version`` to the current snapshot.
+
+        Events are encoded once per version and shared by all subscribers. With
+        ``patches``, a subscriber that saw an earlier version of the same match
+        gets the ``patch`` event of every version since; otherwise, or once
+        those are no longer kept, it gets one full ``scorecard`` event.
+
+        Returns:
+            tuple: (list of event strings, version they bring the subscriber to).
+        """
+        with self._changed:
+            current = self.version
+            if patches and version is not None:
+                events = [self._patch_events.get(v) for v in range(version + 1, current + 1)]
+                if all(events):
+                    return events, current
+            cached_version, event = self._scorecard_event
+            if cached_version != current:
+                snap = {"version": current, "match_id": self.match_id, "updated_at": self.updated_at,
+                        "scorecard": self.scorecard}
+                event = f"id: {self.event_id(current)}\nevent: scorecard\ndata: {json_codec.dumps(snap).decode()}\n\n"
+                self._scorecard_event = (current, event)
+            return [event], current
+
+    def stream(self, heartbeat=15.0, patches=False):
+        """
+        Generate Server-Sent Events for every scorecard change.
+
+        The current snapshot is sent first; a comment line is emitted every
+        ``heartbeat`` seconds so proxies keep the connection open. With
+        ``patches`` later changes to the same match are sent as ``patch``
+        events carrying a JSON Patch against the previous event, and a full
+        ``scorecard`` event only when the live match itself changes. Every
+        subscriber is sent the same pre-encoded events (see ``events_since``).
+        """
+        version = None
+        while not self._stop.is_set():
+            if version is None or self.wait_for_change(version, heartbeat):
+                events, version = self.events_since(version, patches)
+                yield from events
+            else:
+                yield ": keep-alive\n\n"
@@ -0,0 +1,436 @@
+"""
+Schedule-aware discovery of the live IPL match.
+
+Finding the live match means downloading and scanning the whole Cricbuzz
+live-scores page. ``LiveMatchFinder`` caches the answer and only asks
+upstream again when it may have changed:
+
+- Outside the match windows of the schedule in match_ids.json it answers
+  "no live match" without any request.
+- A live match ID is trusted until that match's scorecard shows a result
+  (or LIVE_MATCH_ID_MAX_AGE passes); "no live match" inside a window is
+  rechecked every LIVE_MATCH_ID_TTL seconds.
+- An expired answer is still served while it is revalidated in the
+  background, so callers do not wait on Cricbuzz.
+
+``LiveSchedule`` derives the windows from the unplayed matches of the
+current season. Cricbuzz gives unplayed fixtures a result like 'Match starts
+at Apr 01, 14:00 GMT', which is an exact start. Otherwise the IST
+``match_time`` slots ('07:30 PM') repeat daily. It also reports fixtures
+about to start, so their scorecards can be fetched ahead of the first
+/scorecard/live request.
+"""
+
+import bisect
+import calendar
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+from utils.match_index import match_status
+
+logger = logging.getLogger(__name__)
+
+LIVE_SCHEDULE_AWARE = os.environ.get("LIVE_SCHEDULE_AWARE", "1").lower() in ("1", "true", "yes")
+# A window opens this many seconds before a scheduled start...
+LIVE_WINDOW_BEFORE = float(os.environ.get("LIVE_WINDOW_BEFORE", 900))
+# ...and stays open this long after it (a T20 plus rain delays).
+LIVE_MATCH_DURATION = float(os.environ.get("LIVE_MATCH_DURATION", 5 * 3600))
+# Offset of the match_time values in match_ids.json from UTC, in minutes (IST).
+MATCH_TIME_UTC_OFFSET = int(os.environ.get("MATCH_TIME_UTC_OFFSET", 330))
+# Seconds a "no live match" answer is reused inside a match window.
+LIVE_MATCH_ID_TTL = float(os.environ.get("LIVE_MATCH_ID_TTL", 60))
+# Seconds a live match ID is reused while its match is unfinished.
+LIVE_MATCH_ID_MAX_AGE = float(os.environ.get("LIVE_MATCH_ID_MAX_AGE", 900))
+# Outside match windows, still check upstream this often (0: never).
+LIVE_OFF_WINDOW_RECHECK = float(os.environ.get("LIVE_OFF_WINDOW_RECHECK", 0))
+# Fetch a fixture's scorecard this many seconds before its start (0: off).
+LIVE_PREWARM_LEAD = float(os.environ.get("LIVE_PREWARM_LEAD", 300))
+
+_STARTS_AT = re.compile(r"starts at (\w{3}) (\d{1,2}), (\d{1,2}):(\d{2}) GMT", re.IGNORECASE)
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_abbr) if name}
+
+# Window states.
+IN_WINDOW = "in_window"
+OFF_WINDOW = "off_window"
+UNKNOWN = "unknown"
+
+
+def parse_start(result, year):
+    """
+    Start time of an unplayed fixture from its Cricbuzz result text.
+
+    Returns:
+        float: UTC timestamp, or None if the text has no start time.
+    """
+    found = _STARTS_AT.search(result or "")
+    month = _MONTHS.get(found.group(1).lower()) if found else None
+    if month is None:
+        return None
+    day, hour, minute = (int(found.group(i)) for i in (2, 3, 4))
+    try:
+        return datetime(year, month, day, hour, minute, tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_slot(match_time):
+    """
+    Minute of the UTC day of a local 'HH:MM AM/PM' match_time, or None.
+    """
+    try:
+        local = datetime.strptime(match_time.strip(), "%I:%M %p")
+    except (AttributeError, ValueError):
+        return None
+    return (local.hour * 60 + local.minute - MATCH_TIME_UTC_OFFSET) % (24 * 60)
+
+
+class _Schedule:
+    """Match windows of one version of match_ids.json."""
+
+    __slots__ = ("version", "known", "starts", "slots")
+
+    def __init__(self, version, data, now):
+        self.version = version
+        # False when there is nothing to go on (no match_ids.json), so every check goes upstream.
+        self.known = bool(data)
+        self.starts = []  # sorted (start timestamp, match_id)
+        self.slots = set()  # minutes of the UTC day
+        if not data:
+            return
+        season = max(data)
+        year = int(season[3:]) if season[3:].isdigit() else None
+        if year is None or year < datetime.fromtimestamp(now, timezone.utc).year:
+            # No fixtures for this year yet (match_ids.json not refreshed), so the schedule cannot tell.
+            self.known = False
+            return
+        for match in data[season]:
+            result = match.get("match_result")
+            if match_status(result) != "scheduled":
+                continue
+            start = parse_start(result, year)
+            if start is not None:
+                self.starts.append((start, str(match["match_id"])))
+                continue
+            slot = parse_slot(match.get("match_time"))
+            if slot is None:
+                self.known = False  # an unplayed match at an unknown time
+            else:
+                self.slots.add(slot)
+        self.starts.sort()
+
+    def _slot_starts(self, now):
+        midnight = now - now % 86400
+        return [midnight + day * 86400 + slot * 60 for day in (-1, 0, 1) for slot in self.slots]
+
+    def _candidates(self, now):
+        """Distinct start times that can still be on at ``now`` or are still ahead."""
+        candidates = set(self._slot_starts(now))
+        # Only fixtures that started within LIVE_MATCH_DURATION can still be on.
+        first = bisect.bisect_left(self.starts, (now - LIVE_MATCH_DURATION,))
+        candidates.update(start for start, _ in self.starts[first:])
+        return candidates
+
+    def quiet_until(self, now):
+        """
+        How long checks can pause after the live match finished at ``now``.
+
+        Until the end of the window, or the opening of the next fixture's
+        window if that is sooner. No pause while the windows of two fixtures
+        overlap (a double-header afternoon and evening match): the other one
+        may be on, or about to start.
+
+        Returns:
+            float: Timestamp to stay quiet until; 0.0 for no pause.
+        """
+        if not self.known:
+            return 0.0
+        candidates = self._candidates(now)
+        on = [start for start in candidates if start - LIVE_WINDOW_BEFORE <= now <= start + LIVE_MATCH_DURATION]
+        if len(on) != 1:
+            return 0.0
+        later = [start - LIVE_WINDOW_BEFORE for start in candidates if start - LIVE_WINDOW_BEFORE > now]
+        return min([on[0] + LIVE_MATCH_DURATION] + later)
+
+    def window(self, now):
+        """
+        Where ``now`` falls in the schedule.
+
+        Returns:
+            tuple: (IN_WINDOW, end of the window), (OFF_WINDOW, next window
+            opening or None), or (UNKNOWN, None).
+        """
+        if not self.known:
+            return UNKNOWN, None
+        end = None
+        opening = None
+        for start in self._candidates(now):
+            if start - LIVE_WINDOW_BEFORE <= now <= start + LIVE_MATCH_DURATION:
+                end = max(end or 0, start + LIVE_MATCH_DURATION)
+            elif start - LIVE_WINDOW_BEFORE > now:
+                opening = min(opening or float("inf"), start - LIVE_WINDOW_BEFORE)
+        if end is not None:
+            return IN_WINDOW, end
+        return OFF_WINDOW, opening
+
+    def starting(self, now, lead):
+        """(match ID, start) of fixtures starting within ``lead`` seconds."""
+        due = []
+        for start, match_id in self.starts[bisect.bisect_left(self.starts, (now,)):]:
+            if start > now + lead:
+                break
+            due.append((match_id, start))
+        return due
+
+    def next_start(self, now):
+        """Timestamp of the next exact fixture start after ``now``, or None."""
+        later = self.starts[bisect.bisect_right(self.starts, (now, chr(0x10FFFF))):]
+        return later[0][0] if later else None
+
+
+class LiveSchedule:
+    """
+    Match windows for the current version of a MatchIndex.
+
+    Args:
+        match_index (MatchIndex): Source of match_ids.json snapshots.
+        clock (callable): Current UTC timestamp.
+    """
+
+    def __init__(self, match_index, clock=time.time):
+        self.match_index = match_index
+        self.clock = clock
+        self._schedule = None
+        self._prewarmed = set()
+        self._lock = threading.Lock()
+
+    def current(self):
+        snapshot = self.match_index.current()
+        schedule = self._schedule
+        if schedule is None or schedule.version != snapshot.version:
+            schedule = self._schedule = _Schedule(snapshot.version, snapshot.data, self.clock())
+        return schedule
+
+    def window(self, now=None):
+        """See ``_Schedule.window``; always IN_WINDOW when LIVE_SCHEDULE_AWARE is off."""
+        now = self.clock() if now is None else now
+        if not LIVE_SCHEDULE_AWARE:
+            return IN_WINDOW, None
+        return self.current().window(now)
+
+    def quiet_until(self, now=None):
+        """See ``_Schedule.quiet_until``; never quiet when LIVE_SCHEDULE_AWARE is off."""
+        now = self.clock() if now is None else now
+        if not LIVE_SCHEDULE_AWARE:
+            return 0.0
+        return self.current().quiet_until(now)
+
+    def due_for_prewarm(self, lead=LIVE_PREWARM_LEAD):
+        """
+        Fixtures starting within ``lead`` seconds that were not returned before.
+
+        Returns:
+            list: (match ID, scheduled start) of fixtures whose scorecards should be fetched now.
+        """
+        if lead <= 0:
+            return []
+        due = self.current().starting(self.clock(), lead)
+        with self._lock:
+            due = [(match_id, start) for match_id, start in due if match_id not in self._prewarmed]
+            self._prewarmed.update(match_id for match_id, _ in due)
+        return due
+
+    def stats(self):
+        now = self.clock()
+        schedule = self.current()
+        state, edge = self.window(now)
+        return {
+            "state": state,
+            "window_ends" if state == IN_WINDOW else "next_window": edge,
+            "scheduled_starts": len(schedule.starts),
+            "daily_slots_utc": sorted(f"{slot // 60:02d}:{slot % 60:02d}" for slot in schedule.slots)
+        }
+
+
+class LiveMatchFinder:
+    """
+    Cached, schedule-gated live match ID.
+
+    Args:
+        fetch (callable): Scrapes the live match ID from upstream (-1 if none).
+        schedule (LiveSchedule): Decides when a match can be on.
+        is_finished (callable): True if a match ID's scorecard already has a result.
+        clock (callable): Current UTC timestamp.
+    """
+
+    def __init__(self, fetch, schedule, is_finished=lambda match_id: False, clock=time.time):
+        self.fetch = fetch
+        self.schedule = schedule
+        self.is_finished = is_finished
+        self.clock = clock
+        self.match_id = None
+        self.checked_at = None
+        # After the live match of a window finishes, no checks until the window closes.
+        self._quiet_until = 0.0
+        self._revalidating = False
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.skipped = 0
+
+    def lookup(self):
+        """
+        Answer from the cache or the schedule without going upstream.
+
+        Returns:
+            tuple: (match ID or -1, fresh). The ID is None when upstream must be
+            asked first; ``fresh`` is False for a stale answer the caller should
+            revalidate.
+        """
+        now = self.clock()
+        match_id, checked_at = self.match_id, self.checked_at
+        if match_id not in (None, -1) and self.is_finished(match_id):
+            # The live match is over; nothing more until the next fixture can be on.
+            self._quiet_until = self.schedule.quiet_until(now)
+            match_id = None
+
+        if match_id in (None, -1):
+            state, _ = self.schedule.window(now)
+            if state == OFF_WINDOW or now < self._quiet_until:
+                recheck = LIVE_OFF_WINDOW_RECHECK
+                if not recheck or (checked_at is not None and now - checked_at < recheck):
+                    self.skipped += 1
+                    return -1, True
+            if match_id is None:
+                return None, False
+
+        age = now - checked_at
+        ttl = LIVE_MATCH_ID_TTL if match_id == -1 else LIVE_MATCH_ID_MAX_AGE
+        if age < ttl:
+            self.hits += 1
+            return match_id, True
+        if age < 2 * ttl:
+            self.stale_hits += 1
+            return match_id, False
+        return None, False
+
+    def record(self, match_id):
+        """Store a freshly scraped answer."""
+        with self._lock:
+            self.fetches += 1
+            self.match_id = match_id
+            self.checked_at = self.clock()
+            if match_id != -1:
+                self._quiet_until = 0.0
+        return match_id
+
+    def get(self):
+        """
+        The live match ID (-1 if none), scraping only when the cache cannot answer.
+
+        Stale answers are returned at once and revalidated on a background thread.
+        """
+        match_id, fresh = self.lookup()
+        if match_id is None:
+            return self.refresh()
+        if not fresh:
+            self.revalidate_in_background()
+        return match_id
+
+    def refresh(self):
+        return self.record(self.fetch())
+
+    def revalidate_in_background(self):
+        with self._lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Live match revalidation failed: {e}")
+            finally:
+                self._revalidating = False
+
+        threading.Thread(target=run, name="live-match-revalidate", daemon=True).start()
+
+    def stats(self):
+        return {
+            "match_id": self.match_id,
+            "checked_at": self.checked_at,
+            "fetches": self.fetches,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "skipped": self.skipped,
+            "schedule": self.schedule.stats()
+        }
+
+
+class Prewarmer:
+    """
+    Background thread that fetches scorecards shortly before scheduled starts.
+
+    It sleeps until the next fixture is ``lead`` seconds away (checking again
+    at least every ``max_sleep`` seconds, so a reloaded match_ids.json is
+    noticed), then calls ``warm(match_id, start)`` for every fixture due.
+
+    Args:
+        schedule (LiveSchedule): Source of the fixtures.
+        warm (callable): Fetches and caches one scorecard; given the match ID and its start.
+        lead (float): Seconds before a start to warm its scorecard.
+        max_sleep (float): Longest wait between checks.
+    """
+
+    def __init__(self, schedule, warm, lead=LIVE_PREWARM_LEAD, max_sleep=600.0):
+        self.schedule = schedule
+        self.warm = warm
+        self.lead = lead
+        self.max_sleep = max_sleep
+        self.warmed = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the thread once (no-op when ``lead`` is 0); safe to call on every request."""
+        if self.lead <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="scorecard-prewarm", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self):
+        """Warm every fixture now due; returns seconds until the next check."""
+        for match_id, start in self.schedule.due_for_prewarm(self.lead):
+            try:
+                self.warm(match_id, start)
+                self.warmed += 1
+            except Exception as e:
+                logger.warning(f"Pre-warming scorecard of match {match_id} failed: {e}")
+        now = self.schedule.clock()
+        start = self.schedule.current().next_start(now + self.lead)  # the first fixture not due yet
+        if start is None:
+            return self.max_sleep
+        return min(max(start - self.lead - now, 1.0), self.max_sleep)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.run_once())
+
+    def stats(self):
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "lead": self.lead,
+            "warmed": self.warmed
+        }
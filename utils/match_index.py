@@ -0,0 +1,245 @@
+"""
+In-memory index over match_ids.json.
+
+The file is parsed once into lookup tables; a reload builds a complete new
+snapshot and swaps it in with a single assignment, so concurrent readers always
+see either the old or the new index, never a partially built one.
+"""
+
+import bisect
+import hashlib
+import logging
+import os
+import threading
+
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+def _key(text):
+    return " ".join(text.split()).upper()
+
+
+def parse_teams(match_name):
+    """
+    Split a match name such as 'CSK vs MI, 1st match' into its two teams.
+
+    Returns:
+        tuple: The two team names, or () if the name has no 'vs'.
+    """
+    fixture = match_name.split(',')[0]
+    if " vs " not in fixture:
+        return ()
+    return tuple(team.strip() for team in fixture.split(" vs ", 1))
+
+
+MATCH_STATUSES = ("completed", "no_result", "scheduled")
+
+
+def match_status(result):
+    """
+    Classify a stored match_result string.
+
+    Returns:
+        str: 'completed' (a side won, including super overs and eliminators),
+        'no_result' (abandoned or washed out) or 'scheduled' (not played yet,
+        postponed, or unknown).
+    """
+    text = (result or "").lower()
+    if " won" in text:
+        return "completed"
+    if "no result" in text or "abandoned" in text:
+        return "no_result"
+    return "scheduled"
+
+
+class _Snapshot:
+    __slots__ = ("data", "by_season_no", "by_id", "season_of", "mtime", "version", "etag",
+                 "rows", "season_rows", "team_rows", "venue_rows", "status_rows")
+
+    def __init__(self, data, mtime, version, etag=None):
+        self.data = data
+        self.mtime = mtime
+        self.version = version
+        # Content hash of the file, identical in every worker process (unlike ``version``).
+        self.etag = etag
+        self.by_season_no = {}
+        self.by_id = {}
+        self.season_of = {}
+        # Positions into ``rows`` (file order) for the filterable fields, so a
+        # query only touches the matches it returns.
+        self.rows = []
+        self.season_rows = {}
+        self.team_rows = {}
+        self.venue_rows = {}
+        self.status_rows = {}
+        for season, matches in data.items():
+            for match in matches:
+                position = len(self.rows)
+                self.rows.append((season, match))
+                self.season_rows.setdefault(season, []).append(position)
+                self.status_rows.setdefault(match_status(match.get("match_result")), []).append(position)
+                match_id = str(match["match_id"])
+                self.by_season_no[(season, match["match_no"])] = match_id
+                self.by_id[match_id] = match
+                self.season_of[match_id] = season
+                for team in parse_teams(match.get("match_name", "NA")):
+                    self.team_rows.setdefault(_key(team), []).append(position)
+                venue = match.get("match_venue", "NA")
+                if venue != "NA":
+                    self.venue_rows.setdefault(_key(venue), []).append(position)
+
+
+class MatchIndex:
+    """
+    Indexed, auto-reloading view of match_ids.json.
+
+    Args:
+        path (str): Path to match_ids.json.
+    """
+
+    def __init__(self, path="match_ids.json"):
+        self.path = path
+        self._snapshot = _Snapshot({}, None, 0)
+        self._reload_lock = threading.Lock()
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def reload(self):
+        """Re-read the file and atomically swap in a freshly built index."""
+        with self._reload_lock:
+            return self._reload_locked()
+
+    def _reload_locked(self):
+        mtime = self._mtime()
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            data = json_codec.loads(raw)
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"Could not load {self.path}: {e}")
+            return self._snapshot
+        self._snapshot = _Snapshot(data, mtime, self._snapshot.version + 1, hashlib.sha1(raw).hexdigest())
+        logger.info(f"Match index loaded: {len(self._snapshot.by_id)} matches, version {self._snapshot.version}")
+        return self._snapshot
+
+    def current(self):
+        """Return the current snapshot, reloading first if the file's mtime changed."""
+        snapshot = self._snapshot
+        if snapshot.version == 0 or self._mtime() != snapshot.mtime:
+            with self._reload_lock:
+                if self._snapshot is snapshot:  # nobody reloaded while we waited
+                    self._reload_locked()
+                return self._snapshot
+        return snapshot
+
+    @property
+    def version(self):
+        return self.current().version
+
+    @property
+    def etag(self):
+        return self.current().etag
+
+    @property
+    def data(self):
+        """The raw season -> matches mapping, as stored in match_ids.json."""
+        return self.current().data
+
+    def seasons(self):
+        return list(self.current().data.keys())
+
+    def latest_season(self):
+        seasons = self.seasons()
+        return max(seasons) if seasons else None
+
+    def normalize_season(self, season):
+        """Accept 'IPL2025', 'ipl2025' or '2025'; default to the latest season."""
+        if season is None:
+            return self.latest_season()
+        season = str(season).upper()
+        return season if season.startswith("IPL") else f"IPL{season}"
+
+    def match_id_for(self, match_no, season=None):
+        """
+        Look up the Cricbuzz match ID for a match number in a season.
+
+        Returns:
+            str: Match ID, or -1 if not found.
+        """
+        return self.current().by_season_no.get((self.normalize_season(season), match_no), -1)
+
+    def match(self, match_id):
+        """Return the stored metadata for a match ID, or None."""
+        return self.current().by_id.get(str(match_id))
+
+    def season_of(self, match_id):
+        return self.current().season_of.get(str(match_id))
+
+    def matches_for_team(self, team):
+        snapshot = self.current()
+        return [snapshot.rows[position][1] for position in snapshot.team_rows.get(_key(team), [])]
+
+    def matches_for_venue(self, venue):
+        snapshot = self.current()
+        return [snapshot.rows[position][1] for position in snapshot.venue_rows.get(_key(venue), [])]
+
+    def query(self, season=None, team=None, venue=None, status=None, start=0, limit=None):
+        """
+        Filter the match list using the pre-built indexes.
+
+        Team and venue match any indexed name containing the given text, so
+        'kolkata' finds both 'Kolkata Knight Riders' and 'Eden Gardens, Kolkata'.
+
+        Args:
+            season (str): '2025' or 'IPL2025'.
+            team (str): Team name or part of one.
+            venue (str): Venue name or part of one.
+            status (str): 'completed', 'no_result' or 'scheduled'.
+            start (int): Position (in file order) to resume from.
+            limit (int): Maximum matches to return; None for all.
+
+        Returns:
+            tuple: (list of (season, match) pairs, total matching, position
+            to resume from or None when there are no more).
+        """
+        snapshot = self.current()
+        candidates = []
+        if season is not None:
+            candidates.append(snapshot.season_rows.get(self.normalize_season(season), []))
+        if status is not None:
+            candidates.append(snapshot.status_rows.get(status, []))
+        if team is not None:
+            candidates.append(_containing(snapshot.team_rows, team))
+        if venue is not None:
+            candidates.append(_containing(snapshot.venue_rows, venue))
+
+        if not candidates:
+            positions = range(len(snapshot.rows))
+        else:
+            candidates.sort(key=len)
+            positions, others = candidates[0], [set(c) for c in candidates[1:]]
+            if others:
+                positions = [p for p in positions if all(p in other for other in others)]
+
+        total = len(positions)
+        begin = bisect.bisect_left(positions, start)
+        end = total if limit is None else min(total, begin + limit)
+        page = [snapshot.rows[p] for p in positions[begin:end]]
+        return page, total, (positions[end] if end < total else None)
+
+
+def _containing(rows_by_key, text):
+    """Sorted positions under every key that contains ``text``."""
+    needle = _key(text)
+    if needle in rows_by_key:
+        return rows_by_key[needle]
+    matches = [rows for key, rows in rows_by_key.items() if needle in key]
+    if len(matches) == 1:
+        return matches[0]
+    return sorted(set().union(*matches))
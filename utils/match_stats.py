@@ -0,0 +1,377 @@
+"""
+Head-to-head, venue and standings aggregates over match_ids.json.
+
+Every stored match already carries its teams (``match_name``), venue and
+result string. Results are parsed once per season into a ``SeasonAggregate``,
+which holds that season's head-to-head records, venue records and points
+table. ``MatchStats`` combines the seasons and precomputes every response
+document, so ``/stats/*`` lookups are dictionary reads.
+
+When match_ids.json changes (e.g. a refresh fetched the current season), only
+seasons whose match list differs are parsed again. The combined documents
+are rebuilt from the cached season aggregates and swapped in with a single
+assignment, like the MatchIndex snapshot.
+"""
+
+import logging
+import re
+import threading
+from collections import Counter
+
+from utils.match_index import _key, match_status, parse_teams
+
+logger = logging.getLogger(__name__)
+
+# Points-table scoring: a win (including a super over) or a no result.
+POINTS_FOR_WIN = 2
+POINTS_FOR_NO_RESULT = 1
+
+_MARGIN = re.compile(r"won by \d+\s*(runs?|wkts?|wickets?)", re.IGNORECASE)
+_TIE_WINNER = re.compile(r"\(([^()]*?) won the", re.IGNORECASE)
+# Older result strings use the city's former spelling.
+_ALIASES = {"BANGALORE": "BENGALURU"}
+
+
+def _words(name):
+    return {_ALIASES.get(word, word) for word in _key(name).split()}
+
+
+def _resolve_team(text, teams):
+    """The one of ``teams`` that ``text`` (a possibly older or shortened team name) refers to, or None."""
+    key = _key(text)
+    if key in teams:
+        return key
+    words = _words(text)
+    overlap = [(len(words & _words(team)), team) for team in teams]
+    best = max(count for count, _ in overlap)
+    winners = [team for count, team in overlap if count == best]
+    return winners[0] if best and len(winners) == 1 else None
+
+
+def parse_result(match):
+    """
+    Parse a stored match into teams, winner and how the game was won.
+
+    Returns:
+        dict: ``teams`` (two team keys), ``outcome`` ('won', 'tied' for a
+        tie decided by a super over, or 'no_result'), ``winner`` and ``loser``
+        (team keys, or None), and ``won_batting_first`` (True, False, or None
+        when unknown). None for matches not played yet or without two teams.
+    """
+    teams = tuple(_key(team) for team in parse_teams(match.get("match_name", "NA")))
+    result = match.get("match_result") or ""
+    status = match_status(result)
+    if len(teams) != 2 or status == "scheduled":
+        return None
+    parsed = {"teams": teams, "outcome": "no_result", "winner": None, "loser": None, "won_batting_first": None}
+    if status == "no_result":
+        return parsed
+
+    tie = _TIE_WINNER.search(result) if result.lower().startswith("match tied") else None
+    winner = _resolve_team(tie.group(1) if tie else result.split(" won", 1)[0], teams)
+    parsed["outcome"] = "tied" if tie else "won"
+    if winner is not None:
+        parsed["winner"] = winner
+        parsed["loser"] = teams[1] if winner == teams[0] else teams[0]
+    margin = _MARGIN.search(result)
+    if margin and not tie:
+        parsed["won_batting_first"] = margin.group(1).lower().startswith("run")
+    return parsed
+
+
+def is_league_match(match):
+    """True for a league-stage match ('14th Match'), False for playoffs ('Qualifier 1', 'Final')."""
+    stage = match.get("match_name", "").partition(",")[2]
+    return "match" in stage.lower()
+
+
+def _pair(a, b):
+    return (a, b) if a <= b else (b, a)
+
+
+class SeasonAggregate:
+    """
+    Records of one season, built from its list of matches.
+
+    Attributes:
+        head_to_head (dict): (team, team) sorted pair to Counter of
+            'matches', 'tied', 'no_result' and one win count per team key.
+        venues (dict): Venue key to Counter of 'matches', 'decided',
+            'bat_first_wins', 'chase_wins', 'tied' and 'no_result'.
+        standings (dict): Team key to Counter of league-stage 'played',
+            'won', 'lost', 'tied', 'no_result' and 'points'.
+        playoffs (list): Playoff results in match order.
+        names (dict): Display name of every team and venue key seen.
+    """
+
+    def __init__(self, season, matches):
+        self.season = season
+        self.matches = matches
+        self.head_to_head = {}
+        self.venues = {}
+        self.standings = {}
+        self.playoffs = []
+        self.names = {}
+        for match in matches:
+            self._add(match)
+
+    def _add(self, match):
+        parsed = parse_result(match)
+        if parsed is None:
+            return
+        teams, winner, outcome = parsed["teams"], parsed["winner"], parsed["outcome"]
+        for name in parse_teams(match["match_name"]):
+            self.names.setdefault(_key(name), name.title() if name.isupper() else name)
+
+        record = self.head_to_head.setdefault(_pair(*teams), Counter())
+        record["matches"] += 1
+        if winner is not None:
+            record[winner] += 1
+        if outcome != "won":
+            record[outcome] += 1
+
+        venue = match.get("match_venue", "NA")
+        if venue != "NA":
+            self.names.setdefault(_key(venue), venue)
+            venue_record = self.venues.setdefault(_key(venue), Counter())
+            venue_record["matches"] += 1
+            if outcome != "won":
+                venue_record[outcome] += 1
+            elif parsed["won_batting_first"] is not None:
+                venue_record["decided"] += 1
+                venue_record["bat_first_wins" if parsed["won_batting_first"] else "chase_wins"] += 1
+
+        if not is_league_match(match):
+            self.playoffs.append({
+                "match_id": str(match["match_id"]),
+                "stage": match["match_name"].partition(",")[2].strip(),
+                "teams": [self.names[team] for team in teams],
+                "winner": self.names.get(winner),
+                "result": match.get("match_result")
+            })
+            return
+        for team in teams:
+            row = self.standings.setdefault(team, Counter())
+            row["played"] += 1
+            if outcome == "no_result" or winner is None:
+                row["no_result" if outcome == "no_result" else "tied"] += 1
+                row["points"] += POINTS_FOR_NO_RESULT
+            elif team == winner:
+                row["won"] += 1
+                row["points"] += POINTS_FOR_WIN
+            else:
+                row["lost"] += 1
+
+    def standings_document(self):
+        table = sorted(self.standings.items(), key=lambda item: (-item[1]["points"], -item[1]["won"], item[0]))
+        finals = [playoff for playoff in self.playoffs if playoff["stage"].lower().startswith("final")]
+        return {
+            "season": self.season,
+            "table": [
+                {
+                    "position": position,
+                    "team": self.names[team],
+                    "played": row["played"],
+                    "won": row["won"],
+                    "lost": row["lost"],
+                    "tied": row["tied"],
+                    "no_result": row["no_result"],
+                    "points": row["points"]
+                }
+                for position, (team, row) in enumerate(table, start=1)
+            ],
+            "playoffs": self.playoffs,
+            "champion": finals[-1]["winner"] if finals else None
+        }
+
+
+def _rate(part, whole):
+    return round(part * 100 / whole, 1) if whole else None
+
+
+def _venue_document(name, record):
+    return {
+        "venue": name,
+        "matches": record["matches"],
+        "decided": record["decided"],
+        "bat_first_wins": record["bat_first_wins"],
+        "chase_wins": record["chase_wins"],
+        "bat_first_win_pct": _rate(record["bat_first_wins"], record["decided"]),
+        "chase_win_pct": _rate(record["chase_wins"], record["decided"]),
+        "tied": record["tied"],
+        "no_result": record["no_result"]
+    }
+
+
+class _Documents:
+    """Every /stats response for one version of match_ids.json."""
+
+    __slots__ = ("version", "teams", "head_to_head", "team_records", "venues", "venue_names", "venue_list",
+                 "standings")
+
+    def __init__(self, version, seasons):
+        self.version = version
+        names = {}
+        pairs = {}
+        venues = {}
+        for season, aggregate in seasons.items():
+            names.update(aggregate.names)
+            for pair, record in aggregate.head_to_head.items():
+                total, by_season = pairs.setdefault(pair, (Counter(), {}))
+                total.update(record)
+                by_season[season] = record
+            for venue, record in aggregate.venues.items():
+                venues.setdefault(venue, Counter()).update(record)
+
+        self.teams = {team: names[team] for pair in pairs for team in pair}
+        self.head_to_head = {}
+        self.team_records = {}
+        for (a, b), (total, by_season) in pairs.items():
+            document = self._head_to_head_document(names, a, b, total, by_season)
+            self.head_to_head[(a, b)] = document
+            for team, opponent in ((a, b), (b, a)):
+                self.team_records.setdefault(team, []).append({
+                    "opponent": names[opponent],
+                    "matches": total["matches"],
+                    "won": total[team],
+                    "lost": total[opponent],
+                    "tied": total["tied"],
+                    "no_result": total["no_result"]
+                })
+        for team, records in self.team_records.items():
+            records.sort(key=lambda record: (-record["matches"], record["opponent"]))
+            self.team_records[team] = {
+                "team": names[team],
+                "matches": sum(record["matches"] for record in records),
+                "won": sum(record["won"] for record in records),
+                "lost": sum(record["lost"] for record in records),
+                "opponents": records
+            }
+
+        self.venues = {venue: _venue_document(names[venue], record) for venue, record in venues.items()}
+        self.venue_names = {venue: names[venue] for venue in venues}
+        self.venue_list = sorted(self.venues.values(), key=lambda venue: (-venue["matches"], venue["venue"]))
+        self.standings = {season: aggregate.standings_document() for season, aggregate in seasons.items()}
+
+    @staticmethod
+    def _head_to_head_document(names, a, b, total, by_season):
+        def wins(record):
+            return {names[a]: record[a], names[b]: record[b]}
+
+        return {
+            "teams": [names[a], names[b]],
+            "matches": total["matches"],
+            "wins": wins(total),
+            "tied": total["tied"],
+            "no_result": total["no_result"],
+            "seasons": {
+                season: {"matches": record["matches"], "wins": wins(record)}
+                for season, record in sorted(by_season.items())
+            }
+        }
+
+
+def _lookup(text, names):
+    """
+    Resolve a team or venue by key, or by a part of one that matches a single entry.
+
+    Returns:
+        tuple: (key or None, candidate display names when ambiguous).
+    """
+    key = _key(text)
+    if key in names:
+        return key, []
+    matches = sorted(candidate for candidate in names if key in candidate)
+    if len(matches) == 1:
+        return matches[0], []
+    return None, [names[match] for match in matches]
+
+
+class MatchStats:
+    """
+    Aggregates for the current version of a MatchIndex, rebuilt when it reloads.
+
+    Args:
+        match_index (MatchIndex): Source of match_ids.json snapshots.
+    """
+
+    def __init__(self, match_index):
+        self.match_index = match_index
+        self._seasons = {}
+        self._documents = _Documents(None, {})
+        self._lock = threading.Lock()
+        self.seasons_rebuilt = 0
+
+    def current(self):
+        """Documents for the current snapshot, updating the changed seasons first if it moved on."""
+        snapshot = self.match_index.current()
+        documents = self._documents
+        if documents.version == snapshot.version:
+            return documents
+        with self._lock:
+            if self._documents.version != snapshot.version:
+                self._update(snapshot)
+            return self._documents
+
+    def _update(self, snapshot):
+        seasons = {}
+        rebuilt = []
+        for season, matches in snapshot.data.items():
+            previous = self._seasons.get(season)
+            if previous is not None and previous.matches == matches:
+                seasons[season] = previous
+            else:
+                seasons[season] = SeasonAggregate(season, matches)
+                rebuilt.append(season)
+        self._seasons = seasons
+        self._documents = _Documents(snapshot.version, seasons)
+        self.seasons_rebuilt += len(rebuilt)
+        logger.info(f"Match stats updated for version {snapshot.version}: "
+                    f"{len(rebuilt)} of {len(seasons)} season(s) rebuilt")
+
+    def head_to_head(self, team, opponent=None):
+        """
+        Head-to-head record of two teams, or of one team against every opponent.
+
+        Team names may be partial ('kolkata') if they match a single team.
+
+        Returns:
+            tuple: (document or None, candidate names when a name was ambiguous).
+        """
+        documents = self.current()
+        team_key, candidates = _lookup(team, documents.teams)
+        if team_key is None:
+            return None, candidates
+        if opponent is None:
+            return documents.team_records.get(team_key), []
+        opponent_key, candidates = _lookup(opponent, documents.teams)
+        if opponent_key is None:
+            return None, candidates
+        return documents.head_to_head.get(_pair(team_key, opponent_key)), []
+
+    def venues(self):
+        return self.current().venue_list
+
+    def venue(self, venue):
+        """
+        Record of one venue, by name or a part of one that matches a single venue.
+
+        Returns:
+            tuple: (document or None, candidate names when ambiguous).
+        """
+        documents = self.current()
+        key, candidates = _lookup(venue, documents.venue_names)
+        return (documents.venues[key] if key is not None else None), candidates
+
+    def standings(self, season):
+        return self.current().standings.get(season)
+
+    def stats(self):
+        documents = self.current()
+        return {
+            "version": documents.version,
+            "seasons": len(documents.standings),
+            "teams": len(documents.teams),
+            "venues": len(documents.venues),
+            "seasons_rebuilt": self.seasons_rebuilt
+        }
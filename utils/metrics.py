@@ -0,0 +1,212 @@
+"""
+Prometheus-style metrics and per-request stage timing.
+
+Counters, gauges and histograms are kept in-process and rendered in the
+Prometheus text exposition format by ``render()`` for ``/metrics``. Each
+gunicorn worker reports its own series, so scrape every worker or run one.
+
+``stage(name)`` times a block into the ``stage_duration_seconds`` histogram and,
+when a request has called ``start_request_timings()``, also adds the time to
+that request's breakdown, which the app can send as a ``Server-Timing`` header.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PARSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+def _label_text(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_number(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = [(key, (list(counts), total, count))
+                     for key, (counts, total, count) in sorted(self._values.items())]
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for upper, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _label_text(self.labelnames + ("le",), key + (_number(upper),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """Holds metrics plus collector callbacks that report externally kept counters at scrape time."""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector):
+        """``collector()`` returns an iterable of (name, kind, help, labelnames, {label values: value})."""
+        self._collectors.append(collector)
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            for name, kind, documentation, labelnames, values in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(values.items()):
+                    lines.append(f"{name}{_label_text(labelnames, key)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUESTS = registry.register(Counter(
+    "http_requests_total", "HTTP requests served, by route and status.", ("endpoint", "status")))
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "Time to produce a response, by route.", ("endpoint",)))
+IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served."))
+UPSTREAM_LATENCY = registry.register(Histogram(
+    "upstream_request_duration_seconds", "Cricbuzz request latency, by host.", ("host",)))
+UPSTREAM_RESPONSES = registry.register(Counter(
+    "upstream_responses_total", "Cricbuzz responses by host and status code ('error' for transport failures).",
+    ("host", "status")))
+STAGE_LATENCY = registry.register(Histogram(
+    "stage_duration_seconds", "Time spent per processing stage (HTML parse and each extractor).",
+    ("stage",), buckets=PARSE_BUCKETS))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def start_request_timings():
+    """Begin collecting a per-stage breakdown for the current request context."""
+    timings = {}
+    _timings.set(timings)
+    return timings
+
+
+def request_timings():
+    return _timings.get()
+
+
+def record_stage(name, seconds):
+    STAGE_LATENCY.observe(seconds, stage=name)
+    timings = _timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def stage(name):
+    """Time a block as one processing stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+def observe_upstream(host, seconds, status):
+    """Record one upstream attempt; ``status`` is the HTTP status or 'error'."""
+    UPSTREAM_LATENCY.observe(seconds, host=host)
+    UPSTREAM_RESPONSES.inc(host=host, status=status)
+    timings = _timings.get()
+    if timings is not None:
+        timings["upstream"] = timings.get("upstream", 0.0) + seconds
+
+
+def server_timing_header(timings):
+    """Format a stage -> seconds mapping as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items())
+
+
+def render():
+    return registry.render()
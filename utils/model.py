@@ -0,0 +1,268 @@
+"""
+Typed scorecard model.
+
+The parser used to keep every stat as a stripped string in a fresh dict per
+batter and bowler, and fantasy scoring converted those strings back to numbers
+on every request. These classes hold the numbers parsed once, in ``__slots__``
+instead of per-object dicts, and ``to_dict`` renders the JSON shape the API has
+always returned:
+
+    {"Innings1": [{"Batsman": [...]}, {"Bowlers": [...]}, {score}],
+     "Innings2": [...], "Result": {...}, "Playing_Eleven": {...}, "Toss_Result": {...}}
+
+Batting and bowling rows also answer ``get(stat)`` for the names in
+utils.fantasy_points.STAT_FIELDS, so they can be scored directly.
+"""
+
+
+def to_int(text):
+    """Parse an integer cell; anything else (such as '-') counts as 0."""
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return 0
+
+
+def to_float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def overs_to_balls(overs):
+    """Convert cricket overs notation ('3.2' or 3.2 = 3 overs 2 balls) to balls."""
+    overs = to_float(overs)
+    whole = int(overs)
+    return whole * 6 + int(round((overs - whole) * 10))
+
+
+def balls_to_overs(balls):
+    """Render balls in overs notation the way Cricbuzz does ('4', '3.2')."""
+    whole, rest = divmod(balls, 6)
+    return f"{whole}.{rest}" if rest else str(whole)
+
+
+class _Record:
+    __slots__ = ()
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class _Row(_Record):
+    __slots__ = ()
+    _STATS = {}
+
+    def get(self, stat, default=0):
+        """Fantasy stat by its STAT_FIELDS name, or ``default`` if this row has none."""
+        attribute = self._STATS.get(stat)
+        return default if attribute is None else getattr(self, attribute)
+
+
+class BattingRow(_Row):
+    """One batter's innings."""
+
+    __slots__ = ("name", "dismissal", "runs", "balls", "fours", "sixes", "strike_rate")
+    _STATS = {"runs": "runs", "fours": "fours", "sixes": "sixes", "balls_faced": "balls", "dismissed": "dismissed"}
+    NOT_OUT = ("", "not out", "batting", "retired hurt")
+
+    def __init__(self, name, dismissal, runs, balls, fours, sixes, strike_rate):
+        self.name = name
+        self.dismissal = dismissal
+        self.runs = runs
+        self.balls = balls
+        self.fours = fours
+        self.sixes = sixes
+        self.strike_rate = strike_rate
+
+    @property
+    def dismissed(self):
+        """1 if the batter is out, 0 if not out, still batting or retired hurt."""
+        return int(self.dismissal.strip().lower() not in self.NOT_OUT)
+
+    @classmethod
+    def from_dict(cls, row):
+        return cls(row.get("name", ""), row.get("dismissal", ""), to_int(row.get("runs")), to_int(row.get("balls")),
+                   to_int(row.get("fours")), to_int(row.get("sixes")), to_float(row.get("sr")))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "dismissal": self.dismissal,
+            "runs": str(self.runs),
+            "balls": str(self.balls),
+            "fours": str(self.fours),
+            "sixes": str(self.sixes),
+            "sr": f"{self.strike_rate:.2f}"
+        }
+
+
+class BowlingRow(_Row):
+    """One bowler's figures in an innings."""
+
+    __slots__ = ("name", "balls_bowled", "maidens", "runs", "wickets", "economy")
+    _STATS = {"wickets": "wickets", "overs_bowled": "overs", "balls_bowled": "balls_bowled",
+              "runs_conceded": "runs", "maidens": "maidens"}
+
+    def __init__(self, name, balls_bowled, maidens, runs, wickets, economy):
+        self.name = name
+        self.balls_bowled = balls_bowled
+        self.maidens = maidens
+        self.runs = runs
+        self.wickets = wickets
+        self.economy = economy
+
+    @property
+    def overs(self):
+        """Overs bowled in cricket notation as a number (3.2 = 3 overs 2 balls)."""
+        whole, rest = divmod(self.balls_bowled, 6)
+        return whole + rest / 10
+
+    @classmethod
+    def from_dict(cls, row):
+        return cls(row.get("name", ""), overs_to_balls(row.get("overs")), to_int(row.get("maidens")),
+                   to_int(row.get("runs")), to_int(row.get("wicket")), to_float(row.get("economy")))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "overs": balls_to_overs(self.balls_bowled),
+            "maidens": str(self.maidens),
+            "runs": str(self.runs),
+            "wicket": str(self.wickets),
+            "economy": f"{self.economy:.2f}"
+        }
+
+
+class Innings(_Record):
+    """
+    Batting, bowling and total of one innings.
+
+    ``team`` is None when the innings total could not be parsed (or the
+    innings has not started); its score then renders as ``{}``.
+    """
+
+    __slots__ = ("batting", "bowling", "team", "score", "runs", "wickets", "balls")
+
+    def __init__(self, batting=(), bowling=(), team=None, score=None, runs=0, wickets=0, balls=0):
+        self.batting = list(batting)
+        self.bowling = list(bowling)
+        self.team = team
+        self.score = score
+        self.runs = runs
+        self.wickets = wickets
+        self.balls = balls
+
+    @classmethod
+    def from_dict(cls, innings):
+        score = innings[2] if len(innings) > 2 else {}
+        return cls([BattingRow.from_dict(row) for row in innings[0].get("Batsman", [])],
+                   [BowlingRow.from_dict(row) for row in innings[1].get("Bowlers", [])],
+                   score.get("team"), score.get("score"), to_int(score.get("runs")), to_int(score.get("wickets")),
+                   overs_to_balls(score.get("overs")))
+
+    def score_dict(self):
+        if self.team is None:
+            return {}
+        return {
+            "team": self.team,
+            "score": self.score,
+            "runs": self.runs,
+            "wickets": self.wickets,
+            "overs": balls_to_overs(self.balls)
+        }
+
+    def to_dict(self):
+        return [
+            {"Batsman": [row.to_dict() for row in self.batting]},
+            {"Bowlers": [row.to_dict() for row in self.bowling]},
+            self.score_dict()
+        ]
+
+
+class Match(_Record):
+    """
+    A complete scorecard.
+
+    Result, toss and playing XI are kept as the small dicts the API returns.
+    ``match["Result"]`` and the other top-level JSON keys still work, for code
+    written against the dict form.
+    """
+
+    __slots__ = ("innings", "result", "playing_eleven", "toss")
+
+    def __init__(self, innings, result, playing_eleven, toss):
+        self.innings = list(innings)
+        self.result = result
+        self.playing_eleven = playing_eleven
+        self.toss = toss
+
+    @property
+    def completed(self):
+        """True if the result names a winning team."""
+        return self.result["winning_team"] not in ("Not Completed", "NA")
+
+    def rows(self):
+        """Every batting and bowling row of both innings."""
+        for innings in self.innings:
+            yield from innings.batting
+            yield from innings.bowling
+
+    @classmethod
+    def from_dict(cls, scorecard):
+        """Build a Match from the JSON form (e.g. an archived scorecard)."""
+        innings = []
+        number = 1
+        while f"Innings{number}" in scorecard:
+            innings.append(Innings.from_dict(scorecard[f"Innings{number}"]))
+            number += 1
+        return cls(innings, scorecard.get("Result", {}), scorecard.get("Playing_Eleven", {}),
+                   scorecard.get("Toss_Result", {}))
+
+    def to_dict(self):
+        scorecard = {f"Innings{number}": innings.to_dict() for number, innings in enumerate(self.innings, start=1)}
+        scorecard["Result"] = self.result
+        scorecard["Playing_Eleven"] = self.playing_eleven
+        scorecard["Toss_Result"] = self.toss
+        return scorecard
+
+    def __getitem__(self, key):
+        if key == "Result":
+            return self.result
+        if key == "Playing_Eleven":
+            return self.playing_eleven
+        if key == "Toss_Result":
+            return self.toss
+        if key.startswith("Innings") and key[7:].isdigit() and 0 < int(key[7:]) <= len(self.innings):
+            return self.innings[int(key[7:]) - 1].to_dict()
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def as_document(scorecard):
+    """JSON form of a scorecard (a Match, a plain dict, or None)."""
+    return scorecard.to_dict() if isinstance(scorecard, Match) else scorecard
@@ -0,0 +1,99 @@
+"""
+Optional process pool for scorecard parsing.
+
+Building the HTML tree and walking the innings tables is CPU-bound, so
+under threaded gunicorn workers concurrent parses contend for one GIL. With
+PARSE_POOL_SIZE > 0 the raw HTML is shipped to worker processes and the parsed
+scorecard comes back as a pickled utils.model.Match. While fewer than
+PARSE_POOL_INLINE_BELOW parses are in flight, parsing stays inline because the
+pickling round-trip costs more than it saves under light load.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.scorecard import SCORECARD_URL, parse_scorecard_html
+
+logger = logging.getLogger(__name__)
+
+PARSE_POOL_SIZE = int(os.environ.get("PARSE_POOL_SIZE", 0))
+PARSE_POOL_INLINE_BELOW = int(os.environ.get("PARSE_POOL_INLINE_BELOW", 2))
+
+
+class ParsePool:
+    """
+    Parse scorecard HTML inline or in a process pool depending on load.
+
+    Args:
+        size (int): Worker processes; 0 always parses inline.
+        inline_below (int): Parse inline while fewer than this many parses are in flight.
+    """
+
+    def __init__(self, size=PARSE_POOL_SIZE, inline_below=PARSE_POOL_INLINE_BELOW):
+        self.size = size
+        self.inline_below = inline_below
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.inline = 0
+        self.offloaded = 0
+        self.fallbacks = 0
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the parent runs threads whose locks must not leak into children.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def parse(self, html, url=SCORECARD_URL):
+        """
+        Parse raw scorecard HTML.
+
+        Args:
+            html (str): Scorecard page body.
+            url (str): Source URL.
+
+        Returns:
+            Match: Complete scorecard.
+        """
+        with self._lock:
+            self.in_flight += 1
+            offload = self.size > 0 and self.in_flight > self.inline_below
+        try:
+            if offload:
+                try:
+                    result = self._pool().submit(parse_scorecard_html, html, url).result()
+                    self.offloaded += 1
+                    return result
+                except BrokenProcessPool as e:
+                    logger.error(f"Parse pool broken, parsing inline: {e}")
+                    self.fallbacks += 1
+                    with self._lock:
+                        self._executor = None
+            self.inline += 1
+            return parse_scorecard_html(html, url=url)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "inline_below": self.inline_below,
+            "in_flight": self.in_flight,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "fallbacks": self.fallbacks
+        }
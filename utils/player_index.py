@@ -0,0 +1,486 @@
+"""
+Per-player career index over completed scorecards.
+
+Every batting and bowling row of an indexed match becomes one ``PlayerLine``
+(a player's line in that match) in an inverted index keyed by player name.
+Each player keeps running career and per-season totals (runs, strike rate,
+wickets, economy, fantasy points) that are updated as lines are added, so a
+lookup reads a few counters instead of scraping or re-scoring any scorecard.
+
+Completed scorecards never change, so the index only ever grows: a newly
+archived match is added in place, and a match already indexed is skipped.
+
+Build it offline from match_ids.json and the scorecard archive:
+    python -m utils.player_index build --season all
+    python -m utils.player_index build --season 2024 --fetch
+    python -m utils.player_index show "Virat Kohli" --season 2024
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+
+from utils import json_codec
+from utils.fantasy_engine import clean_player_name, roster_resolver
+from utils.fantasy_points import calculate_total_points
+from utils.fetcher import load_match_ids, resolve_seasons
+from utils.model import balls_to_overs
+
+logger = logging.getLogger(__name__)
+
+PLAYER_INDEX_PATH = os.environ.get("PLAYER_INDEX_PATH", "player_index.json")
+INDEX_FORMAT = 2
+# Season of an archived match that match_ids.json does not list (yet).
+UNKNOWN_SEASON = "unknown"
+
+
+def player_key(name):
+    """Lookup key of a player name: whitespace collapsed, role markers dropped, lowercased."""
+    return clean_player_name(name).lower()
+
+
+class PlayerLine:
+    """
+    One player's batting and bowling in one match.
+
+    ``batted`` and ``bowled`` tell a 0 apart from not batting or bowling.
+    """
+
+    __slots__ = ("match_id", "season", "team", "batted", "runs", "balls", "fours", "sixes", "not_out",
+                 "bowled", "balls_bowled", "maidens", "runs_conceded", "wickets", "points")
+
+    def __init__(self, match_id, season, team=None, batted=False, runs=0, balls=0, fours=0, sixes=0,
+                 not_out=False, bowled=False, balls_bowled=0, maidens=0, runs_conceded=0, wickets=0, points=0.0):
+        self.match_id = match_id
+        self.season = season
+        self.team = team
+        self.batted = batted
+        self.runs = runs
+        self.balls = balls
+        self.fours = fours
+        self.sixes = sixes
+        self.not_out = not_out
+        self.bowled = bowled
+        self.balls_bowled = balls_bowled
+        self.maidens = maidens
+        self.runs_conceded = runs_conceded
+        self.wickets = wickets
+        self.points = points
+
+    def to_list(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    @classmethod
+    def from_list(cls, values):
+        return cls(*values)
+
+    def to_dict(self):
+        line = {"match_id": self.match_id, "season": self.season, "team": self.team,
+                "fantasy_points": round(self.points, 2)}
+        if self.batted:
+            line["batting"] = {
+                "runs": self.runs,
+                "balls": self.balls,
+                "fours": self.fours,
+                "sixes": self.sixes,
+                "not_out": self.not_out
+            }
+        if self.bowled:
+            line["bowling"] = {
+                "overs": balls_to_overs(self.balls_bowled),
+                "maidens": self.maidens,
+                "runs": self.runs_conceded,
+                "wickets": self.wickets
+            }
+        return line
+
+
+class PlayerTotals:
+    """Running totals over a player's lines, with the derived averages and rates."""
+
+    __slots__ = ("matches", "innings", "runs", "balls", "fours", "sixes", "not_outs", "highest", "highest_not_out",
+                 "fifties", "hundreds", "bowling_innings", "balls_bowled", "maidens", "runs_conceded", "wickets",
+                 "best_wickets", "best_runs", "points", "best_points")
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+        self.highest_not_out = False
+        self.best_runs = None
+        self.best_points = None
+
+    def add(self, line):
+        self.matches += 1
+        self.points += line.points
+        if self.best_points is None or line.points > self.best_points:
+            self.best_points = line.points
+        if line.batted:
+            self.innings += 1
+            self.runs += line.runs
+            self.balls += line.balls
+            self.fours += line.fours
+            self.sixes += line.sixes
+            self.not_outs += line.not_out
+            if line.runs > self.highest or (line.runs == self.highest and line.not_out):
+                self.highest, self.highest_not_out = line.runs, line.not_out
+            if line.runs >= 100:
+                self.hundreds += 1
+            elif line.runs >= 50:
+                self.fifties += 1
+        if line.bowled:
+            self.bowling_innings += 1
+            self.balls_bowled += line.balls_bowled
+            self.maidens += line.maidens
+            self.runs_conceded += line.runs_conceded
+            self.wickets += line.wickets
+            if (self.best_runs is None or line.wickets > self.best_wickets
+                    or (line.wickets == self.best_wickets and line.runs_conceded < self.best_runs)):
+                self.best_wickets, self.best_runs = line.wickets, line.runs_conceded
+
+    def to_dict(self):
+        outs = self.innings - self.not_outs
+        return {
+            "matches": self.matches,
+            "batting": {
+                "innings": self.innings,
+                "runs": self.runs,
+                "balls": self.balls,
+                "fours": self.fours,
+                "sixes": self.sixes,
+                "not_outs": self.not_outs,
+                "highest": f"{self.highest}*" if self.highest_not_out else str(self.highest),
+                "average": round(self.runs / outs, 2) if outs else None,
+                "strike_rate": round(self.runs * 100 / self.balls, 2) if self.balls else None,
+                "fifties": self.fifties,
+                "hundreds": self.hundreds
+            },
+            "bowling": {
+                "innings": self.bowling_innings,
+                "overs": balls_to_overs(self.balls_bowled),
+                "maidens": self.maidens,
+                "runs": self.runs_conceded,
+                "wickets": self.wickets,
+                "average": round(self.runs_conceded / self.wickets, 2) if self.wickets else None,
+                "economy": round(self.runs_conceded * 6 / self.balls_bowled, 2) if self.balls_bowled else None,
+                "best": f"{self.best_wickets}/{self.best_runs}" if self.best_runs is not None else None
+            },
+            "fantasy_points": {
+                "total": round(self.points, 2),
+                "average": round(self.points / self.matches, 2) if self.matches else None,
+                "best": round(self.best_points, 2) if self.best_points is not None else None
+            }
+        }
+
+
+class _Player:
+    __slots__ = ("name", "lines", "career", "seasons")
+
+    def __init__(self, name):
+        self.name = name
+        self.lines = []
+        self.career = PlayerTotals()
+        self.seasons = {}
+
+    def add(self, line):
+        self.lines.append(line)
+        self.career.add(line)
+        totals = self.seasons.get(line.season)
+        if totals is None:
+            totals = self.seasons[line.season] = PlayerTotals()
+        totals.add(line)
+
+
+def scorecard_lines(match_id, season, scorecard, scoring=None):
+    """
+    Merge a scorecard's batting and bowling rows into one line per player.
+
+    Row names are resolved against the playing XI, so a player listed as
+    'Sunil Narine' when batting and 'Narine' when bowling gets one line.
+
+    Args:
+        match_id (str): Cricbuzz match ID.
+        season (str): Season key such as 'IPL2024'.
+        scorecard (Match): Parsed scorecard.
+        scoring (dict): Fantasy scoring table; defaults to the default table.
+
+    Returns:
+        dict: Player name to PlayerLine.
+    """
+    lines = {}
+    teams = [innings.team for innings in scorecard.innings]
+    resolve = roster_resolver(scorecard.playing_eleven)
+
+    def line_for(name, team):
+        name = resolve(name, team)
+        line = lines.get(name)
+        if line is None:
+            line = lines[name] = PlayerLine(match_id, season, team)
+        elif line.team is None:
+            line.team = team
+        return line
+
+    for number, innings in enumerate(scorecard.innings):
+        # Bowlers play for the team batting in the other innings of the pair.
+        fielding_team = teams[number ^ 1] if (number ^ 1) < len(teams) else None
+        for row in innings.batting:
+            line = line_for(row.name, innings.team)
+            line.batted = True
+            line.runs += row.runs
+            line.balls += row.balls
+            line.fours += row.fours
+            line.sixes += row.sixes
+            line.not_out = row.dismissal.strip().lower() == "not out"
+            line.points += calculate_total_points(row, scoring)
+        for row in innings.bowling:
+            line = line_for(row.name, fielding_team)
+            line.bowled = True
+            line.balls_bowled += row.balls_bowled
+            line.maidens += row.maidens
+            line.runs_conceded += row.runs
+            line.wickets += row.wickets
+            line.points += calculate_total_points(row, scoring)
+    return lines
+
+
+class PlayerIndex:
+    """
+    Inverted index of player name to per-match lines and running totals.
+
+    Adds are serialized by a lock; lookups take none, so one that runs while
+    a match is being added may already see that match for some players only.
+    """
+
+    def __init__(self):
+        self._players = {}
+        self._matches = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._players)
+
+    def __contains__(self, match_id):
+        return str(match_id) in self._matches
+
+    @property
+    def match_count(self):
+        return len(self._matches)
+
+    def add_match(self, match_id, season, scorecard, scoring=None):
+        """
+        Index a completed scorecard; a match already indexed is left alone.
+
+        A match without a known season is filed under UNKNOWN_SEASON.
+
+        Returns:
+            bool: True if the match was added.
+        """
+        match_id = str(match_id)
+        if match_id in self._matches:
+            return False
+        season = season or UNKNOWN_SEASON
+        lines = scorecard_lines(match_id, season, scorecard, scoring)
+        with self._lock:
+            if match_id in self._matches:
+                return False
+            self._add_lines(lines.items())
+            self._matches[match_id] = season
+        return True
+
+    def _add_lines(self, lines):
+        for name, line in lines:
+            key = player_key(name)
+            player = self._players.get(key)
+            if player is None:
+                player = self._players[key] = _Player(name)
+            player.add(line)
+
+    def sync(self, archive, season_of):
+        """
+        Add every archived match the index does not have yet.
+
+        Args:
+            archive (ScorecardArchive): Source of completed scorecards.
+            season_of (callable): Match ID to season key.
+
+        Returns:
+            int: Number of matches added.
+        """
+        added = 0
+        for match_id in archive.match_ids() - self._matches.keys():
+            scorecard = archive.get(match_id)
+            if scorecard is not None and self.add_match(match_id, season_of(match_id), scorecard):
+                added += 1
+        return added
+
+    def find(self, name):
+        """
+        Resolve a player by exact name, or by a part of one that matches a single player.
+
+        Returns:
+            tuple: (player name or None, up to 10 candidate names when ambiguous).
+        """
+        key = player_key(name)
+        player = self._players.get(key)
+        if player is not None:
+            return player.name, []
+        candidates = sorted(player.name for candidate, player in list(self._players.items()) if key in candidate)
+        if len(candidates) == 1:
+            return candidates[0], []
+        return None, candidates[:10]
+
+    def career(self, name):
+        """
+        Career totals of a player with a summary per season.
+
+        Returns:
+            dict: Totals (see PlayerTotals.to_dict), or None for an unknown player.
+        """
+        player = self._players.get(player_key(name))
+        if player is None:
+            return None
+        summary = {"player": player.name, **player.career.to_dict()}
+        summary["seasons"] = {
+            season: {
+                "matches": totals.matches,
+                "runs": totals.runs,
+                "wickets": totals.wickets,
+                "fantasy_points": round(totals.points, 2)
+            }
+            for season, totals in sorted(player.seasons.items())
+        }
+        return summary
+
+    def season(self, name, season):
+        """
+        One season's totals of a player, with the line of every match.
+
+        Returns:
+            dict: Totals and per-match lines, or None if the player did not play that season.
+        """
+        player = self._players.get(player_key(name))
+        if player is None or season not in player.seasons:
+            return None
+        return {
+            "player": player.name,
+            "season": season,
+            **player.seasons[season].to_dict(),
+            "lines": [line.to_dict() for line in player.lines if line.season == season]
+        }
+
+    def stats(self):
+        return {"players": len(self._players), "matches": len(self._matches)}
+
+    # --------------- Persistence ---------------
+
+    def save(self, path=PLAYER_INDEX_PATH):
+        """Write the index to ``path`` (via a temporary file, so readers never see half of it)."""
+        with self._lock:
+            document = {
+                "format": INDEX_FORMAT,
+                "matches": self._matches,
+                "players": {player.name: [line.to_list() for line in player.lines]
+                            for player in self._players.values()}
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_codec.dumps(document))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=PLAYER_INDEX_PATH):
+        """
+        Read an index written by ``save``; totals are recomputed from the lines.
+
+        Returns:
+            PlayerIndex: The loaded index, or an empty one if the file is missing or unreadable.
+        """
+        index = cls()
+        try:
+            with open(path, "rb") as f:
+                document = json_codec.loads(f.read())
+        except FileNotFoundError:
+            return index
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable player index {path}: {e}")
+            return index
+        if document.get("format") != INDEX_FORMAT:
+            logger.warning(f"Ignoring player index {path} in format {document.get('format')}")
+            return index
+        index._matches = dict(document["matches"])
+        index._add_lines((name, PlayerLine.from_list(values))
+                         for name, lines in document["players"].items() for values in lines)
+        return index
+
+
+def build(index, archive, season="all", fetch=False, workers=4):
+    """
+    Index every archived match of one or all seasons listed in match_ids.json.
+
+    Args:
+        fetch (bool): Scrape and archive completed matches missing from the archive first.
+
+    Returns:
+        dict: Counts of 'indexed', 'already_indexed' and 'not_archived' matches.
+    """
+    if fetch:
+        from utils.archive import backfill
+
+        backfill(archive, season, workers)
+    stored = load_match_ids()
+    outcomes = {"indexed": 0, "already_indexed": 0, "not_archived": 0}
+    for key in [key for key in resolve_seasons(season) if key in stored]:
+        for match in stored[key]:
+            match_id = str(match["match_id"])
+            if match_id in index:
+                outcomes["already_indexed"] += 1
+                continue
+            scorecard = archive.get(match_id)
+            if scorecard is None:
+                outcomes["not_archived"] += 1
+                continue
+            index.add_match(match_id, key, scorecard)
+            outcomes["indexed"] += 1
+    logger.info(f"Player index build finished: {outcomes}, {len(index)} players")
+    return outcomes
+
+
+def cli():
+    from utils.archive import ARCHIVE_PATH, ScorecardArchive
+
+    parser = argparse.ArgumentParser(description="Player career index maintenance")
+    parser.add_argument("--path", default=PLAYER_INDEX_PATH, help="Player index file")
+    parser.add_argument("--archive", default=ARCHIVE_PATH, help="SQLite scorecard archive path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_cmd = commands.add_parser("build", help="Index archived matches listed in match_ids.json")
+    build_cmd.add_argument("--season", default="all", help="'all', '2024' or 'IPL2024'")
+    build_cmd.add_argument("--fetch", action="store_true", help="Archive missing completed matches first")
+    build_cmd.add_argument("--workers", type=int, default=4)
+    build_cmd.add_argument("--rebuild", action="store_true", help="Start from an empty index")
+    show_cmd = commands.add_parser("show", help="Print one player's career or season")
+    show_cmd.add_argument("name")
+    show_cmd.add_argument("--season", help="'2024' or 'IPL2024'; omit for the whole career")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    index = PlayerIndex() if args.command == "build" and args.rebuild else PlayerIndex.load(args.path)
+    if args.command == "build":
+        outcomes = build(index, ScorecardArchive(args.archive), args.season, args.fetch, args.workers)
+        index.save(args.path)
+        print(json.dumps(dict(outcomes, **index.stats()), indent=2))
+        return
+    name, candidates = index.find(args.name)
+    if name is None:
+        message = f"Several players match {args.name}." if candidates else f"No indexed matches found for {args.name}."
+        print(json.dumps({"message": message, "candidates": candidates}, indent=2))
+        return
+    if args.season:
+        season = args.season.upper() if args.season.upper().startswith("IPL") else f"IPL{args.season}"
+        print(json.dumps(index.season(name, season), indent=2))
+    else:
+        print(json.dumps(index.career(name), indent=2))
+
+
+if __name__ == "__main__":
+    cli()
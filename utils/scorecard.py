@@ -0,0 +1,362 @@
+"""
+Scorecard parsing engine for Cricbuzz scorecard HTML.
+
+The original extractors ran one full-tree XPath query per cell, re-locating
+the ``innings_N`` container every time. This module locates every innings
+container with a single query and then walks its rows directly on the
+underlying lxml elements, so a whole scorecard is extracted in one pass.
+Numbers are parsed as rows are read and the result is a utils.model.Match;
+``Match.to_dict()`` gives the JSON form.
+"""
+
+from utils.html_backend import parse_html
+from utils.http_client import CRICBUZZ_BASE_URL
+from utils.metrics import stage
+from utils.model import BattingRow, BowlingRow, Innings, Match, overs_to_balls, to_float, to_int
+
+SCORECARD_URL = CRICBUZZ_BASE_URL + "/api/html/cricket-scorecard/"
+LIVE_SCORES_URL = CRICBUZZ_BASE_URL + "/cricket-match/live-scores"
+INNINGS_IDS = ("innings_1", "innings_2")
+
+
+def _first_text(element):
+    """Return the first direct text node of an element (XPath ``text()[1]``)."""
+    if element.text is not None:
+        return element.text
+    for child in element:
+        if child.tail is not None:
+            return child.tail
+    raise IndexError("element has no text")
+
+
+def _child_text(element, tag):
+    """Return the first direct text node found under ``element/tag``."""
+    for child in element.iterchildren(tag):
+        try:
+            return _first_text(child)
+        except IndexError:
+            continue
+    raise IndexError(f"no <{tag}> text")
+
+
+def _divs(element):
+    return list(element.iterchildren("div"))
+
+
+def _innings_containers(response):
+    """
+    Locate every ``innings_N`` container with a single document query.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        dict: Container id to lxml element.
+    """
+    containers = {}
+    for selector in response.xpath('//*[starts-with(@id, "innings_")]'):
+        containers[selector.root.get("id")] = selector.root
+    return containers
+
+
+def parse_batting_rows(container):
+    """
+    Extract every batter row of an innings container.
+
+    Args:
+        container: lxml element of the ``innings_N`` div.
+
+    Returns:
+        list: BattingRow per batter.
+    """
+    blocks = _divs(container)
+    if not blocks:
+        return []
+    batting = []
+    for row in _divs(blocks[0])[2:]:
+        try:
+            cells = _divs(row)
+            batsman = BattingRow(
+                _child_text(cells[0], "a").strip(),
+                _child_text(cells[1], "span").strip(),
+                to_int(_first_text(cells[2])),
+                to_int(_first_text(cells[3])),
+                to_int(_first_text(cells[4])),
+                to_int(_first_text(cells[5])),
+                to_float(_first_text(cells[6]))
+            )
+            batting.append(batsman)
+        except (IndexError, AttributeError):
+            pass
+    return batting
+
+
+def parse_bowling_rows(container):
+    """
+    Extract every bowler row of an innings container.
+
+    Args:
+        container: lxml element of the ``innings_N`` div.
+
+    Returns:
+        list: BowlingRow per bowler.
+    """
+    blocks = _divs(container)
+    if len(blocks) < 4:
+        return []
+    bowling = []
+    for row in _divs(blocks[3])[1:]:
+        try:
+            cells = _divs(row)
+            bowler = BowlingRow(
+                _child_text(cells[0], "a").strip(),
+                overs_to_balls(_first_text(cells[1])),
+                to_int(_first_text(cells[2])),
+                to_int(_first_text(cells[3])),
+                to_int(_first_text(cells[4])),
+                to_float(_first_text(cells[7]))
+            )
+            bowling.append(bowler)
+        except (IndexError, AttributeError):
+            pass
+    return bowling
+
+
+def parse_innings_score(container):
+    """
+    Extract the innings total from the header row of an innings container.
+
+    Args:
+        container: lxml element of the ``innings_N`` div.
+
+    Returns:
+        dict: Innings score, or an empty dict if it cannot be parsed.
+    """
+    try:
+        header = _divs(_divs(container)[0])[0]
+        spans = list(header.iterchildren("span"))
+        team = _first_text(spans[0]).strip().replace("Innings", "").strip()
+        score = _first_text(spans[1]).strip().replace("Innings", "").strip()
+        return {
+            "team": team,
+            "score": score,
+            "runs": int(score.split('-')[0].strip()),
+            "wickets": int(score.split('-')[1].split('(')[0].strip()),
+            "overs": score.split('(')[1].split(')')[0].replace('Ov', '').strip()
+        }
+    except Exception:
+        return {}
+
+
+def parse_innings(container):
+    """
+    Extract batting, bowling and score of one innings in a single walk.
+
+    Args:
+        container: lxml element of the ``innings_N`` div, or None.
+
+    Returns:
+        Innings: Rows and total; an empty Innings if there is no container.
+    """
+    if container is None:
+        return Innings()
+    with stage("batting"):
+        batting = parse_batting_rows(container)
+    with stage("bowling"):
+        bowling = parse_bowling_rows(container)
+    with stage("scores"):
+        score = parse_innings_score(container)
+    if not score:
+        return Innings(batting, bowling)
+    return Innings(batting, bowling, score["team"], score["score"], score["runs"], score["wickets"],
+                   overs_to_balls(score["overs"]))
+
+
+def parse_scorecard(response):
+    """
+    Extract the complete scorecard in one pass over the innings containers.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        Match: Complete scorecard with batting, bowling, toss, result, and playing XI.
+    """
+    containers = _innings_containers(response)
+    innings = [parse_innings(containers.get(innings_id)) for innings_id in INNINGS_IDS]
+    with stage("result"):
+        result = get_result_update(response)
+    with stage("playing_eleven"):
+        playing_eleven = get_playing_eleven(response)
+    with stage("toss"):
+        toss = get_toss(response)
+    return Match(innings, result, playing_eleven, toss)
+
+
+def parse_scorecard_html(html, url=SCORECARD_URL):
+    """
+    Parse raw Cricbuzz scorecard HTML.
+
+    Args:
+        html (str): Scorecard page body.
+        url (str): Source URL.
+
+    Returns:
+        Match: Complete scorecard.
+    """
+    with stage("parse_tree"):
+        response = parse_html(html, url=url)
+    return parse_scorecard(response)
+
+
+def parse_live_ipl_match_id(response):
+    """
+    Find the first live IPL match on the Cricbuzz live-scores page.
+
+    Args:
+        response: Parsed live-scores page (see utils.html_backend).
+
+    Returns:
+        str: Cricbuzz match ID if found, else -1.
+    """
+    live_links = response.xpath('//a[contains(@href, "/live-cricket-scores/")]/@href').extract()
+    for link in live_links:
+        if "premier-league" in link.lower() or "ipl" in link.lower():
+            return link.split('/')[2]
+    return -1
+
+
+def is_match_completed(scorecard):
+    """
+    Check whether a parsed scorecard reports a winner.
+
+    Args:
+        scorecard: Parsed scorecard (Match, or its JSON form).
+
+    Returns:
+        bool: True if the match result names a winning team.
+    """
+    return scorecard["Result"]["winning_team"] not in ("Not Completed", "NA")
+
+
+# --------------- Single-extractor helpers ---------------
+
+def _innings_container(innings, response):
+    """Resolve a quoted innings identifier such as '"innings_1"' to its element."""
+    found = response.xpath(f'//*[@id={innings}]')
+    return found[0].root if found else None
+
+
+def get_scores(response):
+    """
+    Extract innings scores from Cricbuzz scorecard HTML.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        tuple: Innings 1 and Innings 2 score dictionaries.
+    """
+    containers = _innings_containers(response)
+    return tuple(
+        parse_innings_score(containers[innings_id]) if innings_id in containers else {}
+        for innings_id in INNINGS_IDS
+    )
+
+
+def get_playing_eleven(response):
+    """
+    Extract playing XI from scorecard.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        dict: Team-wise playing eleven.
+    """
+    try:
+        playing_eleven = {}
+        team_name_one = response.xpath('/html/body/div[4]/div[2]/div[9]/text()').extract()[0].replace('Squad', '').strip()
+        team_one_playing_eleven = response.xpath('/html/body/div[4]/div[2]/div[10]/div[2]/a/text()').extract()
+        team_name_two = response.xpath('/html/body/div[4]/div[2]/div[12]/text()').extract()[0].replace('Squad', '').strip()
+        team_two_playing_eleven = response.xpath('/html/body/div[4]/div[2]/div[13]/div[2]/a/text()').extract()
+        playing_eleven = {team_name_one: team_one_playing_eleven, team_name_two: team_two_playing_eleven}
+    except Exception:
+        playing_eleven = {}
+    return playing_eleven
+
+
+def get_toss(response):
+    """
+    Extract toss result from scorecard.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        dict: Toss details.
+    """
+    try:
+        toss = {}
+        toss_text = response.xpath('/html/body/div[4]/div[2]/div[3]/div[2]/text()').extract()[0].strip()
+        toss_won_by = toss_text.split('won')[0].strip()
+        chosen_to = toss_text.split('opt to')[1].strip()
+        toss["update"] = toss_text
+        toss["winning_team"] = toss_won_by
+        toss["chose_to"] = chosen_to
+    except Exception:
+        toss = {}
+    return toss
+
+
+def get_result_update(response):
+    """
+    Extract match result from scorecard.
+
+    Args:
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        dict: Match result.
+    """
+    try:
+        result = response.xpath('/html/body/div[1]/text()').extract()[0].strip().lower()
+        if "won" not in result:
+            final_result = "Not Completed"
+            margin = "NA"
+        else:
+            final_result = result.split('won')[0].replace('(', '').replace("match tied", "").strip()
+            margin = result.split('by')[1].strip()
+    except Exception:
+        final_result, margin, result = "NA", "NA", "NA"
+    return {"winning_team": final_result, "update": result, "winning_margin": margin}
+
+
+def get_batting_scorecard(innings, response):
+    """
+    Extract batting scorecard.
+
+    Args:
+        innings (str): Innings identifier.
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        list: List of batsman stats.
+    """
+    container = _innings_container(innings, response)
+    return [row.to_dict() for row in parse_batting_rows(container)] if container is not None else []
+
+
+def get_bowling_scorecard(innings, response):
+    """
+    Extract bowling scorecard.
+
+    Args:
+        innings (str): Innings identifier.
+        response: Parsed HTML document (see utils.html_backend).
+
+    Returns:
+        list: List of bowler stats.
+    """
+    container = _innings_container(innings, response)
+    return [row.to_dict() for row in parse_bowling_rows(container)] if container is not None else []
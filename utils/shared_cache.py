@@ -0,0 +1,416 @@
+"""
+Optional cache tier shared by every worker process.
+
+Each gunicorn worker keeps its own in-process TTLCache, so without a shared
+tier every worker fetches the same scorecard from Cricbuzz on its own. A
+SharedCache stores encoded values with TTLs where all workers can see them,
+and hands out named locks so that only one worker refreshes a live match at a
+time while the others wait for its result.
+
+Backends are chosen by SHARED_CACHE_URL:
+
+- unset or empty: disabled.
+- ``sqlite:`` or ``sqlite:///<path>``: SQLite file on local disk (by default
+  in /dev/shm, i.e. shared memory), for workers on one machine.
+- ``redis://host:6379/0``: any server speaking the Redis protocol (requires
+  the ``redis`` package). ``RedisSharedCache`` also accepts a client object,
+  such as ``fakeredis.FakeRedis()``.
+
+Backend errors are logged and counted, then treated as cache misses, so the
+shared tier can fail without taking requests down with it.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_URL = os.environ.get("SHARED_CACHE_URL", "")
+# A lock expires on its own after this long, in case its holder died mid-refresh.
+SHARED_CACHE_LOCK_TTL = float(os.environ.get("SHARED_CACHE_LOCK_TTL", 30))
+# How long a worker waits for another worker's refresh before doing its own.
+SHARED_CACHE_LOCK_WAIT = float(os.environ.get("SHARED_CACHE_LOCK_WAIT", 10))
+
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+DEFAULT_SQLITE_PATH = os.path.join(_SHM_DIR, "ipl-scorecard-shared-cache.db")
+
+
+class SharedLock:
+    """
+    Named lock held in a SharedCache, identified by a random token.
+
+    Args:
+        cache (SharedCache): Backend holding the lock.
+        name (str): Lock name.
+        ttl (float): Seconds after which the lock expires if never released.
+    """
+
+    def __init__(self, cache, name, ttl=SHARED_CACHE_LOCK_TTL):
+        self.cache = cache
+        self.name = name
+        self.ttl = ttl
+        self.token = uuid.uuid4().hex
+        self.acquired = False
+        # True if another process held the lock when we first tried.
+        self.contended = False
+
+    def acquire(self, wait=0.0, poll=0.05):
+        """
+        Try to take the lock, retrying for up to ``wait`` seconds.
+
+        Returns:
+            bool: True if the lock is now held by this object.
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            if self.cache._try_lock(self.name, self.token, self.ttl):
+                self.acquired = True
+                return True
+            self.contended = True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+
+    def release(self):
+        if self.acquired:
+            self.cache._unlock(self.name, self.token)
+            self.acquired = False
+
+
+class SharedCache:
+    """
+    Interface of a cross-process cache of bytes values with TTLs and locks.
+
+    Subclasses implement ``_get``, ``_set``, ``_delete``, ``_try_lock`` and ``_unlock``.
+    """
+
+    backend = None
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.errors = 0
+        self.lock_waits = 0
+        self.peer_refreshes = 0
+
+    def _failed(self, operation, key, error):
+        self.errors += 1
+        logger.warning(f"Shared cache {operation} failed for {key}: {error}")
+
+    def get_with_ttl(self, key):
+        """
+        Look up a value and how long it has left.
+
+        Returns:
+            tuple: (bytes, remaining seconds or None if it never expires), or (None, None) on a miss.
+        """
+        try:
+            value, ttl = self._get(key)
+        except Exception as e:
+            self._failed("get", key, e)
+            value, ttl = None, None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value, ttl
+
+    def get(self, key):
+        return self.get_with_ttl(key)[0]
+
+    def set(self, key, value, ttl=None):
+        """Store bytes under ``key``, expiring after ``ttl`` seconds (None: never)."""
+        try:
+            self._set(key, value, ttl)
+            self.sets += 1
+        except Exception as e:
+            self._failed("set", key, e)
+
+    def delete(self, key):
+        try:
+            self._delete(key)
+        except Exception as e:
+            self._failed("delete", key, e)
+
+    def lock(self, name, ttl=SHARED_CACHE_LOCK_TTL):
+        return SharedLock(self, name, ttl)
+
+    def claim_refresh(self, key, wait=SHARED_CACHE_LOCK_WAIT, min_ttl=None):
+        """
+        Take the refresh lock of ``key`` before refreshing it.
+
+        If another process was already refreshing the key, wait up to ``wait``
+        seconds for it and hand back what it stored, so the caller can skip
+        its own refresh. With ``min_ttl``, a stored value that still has at
+        least that many seconds left is handed back even when nobody else
+        was refreshing, e.g. when every worker polls the same live match.
+
+        Args:
+            key (str): Cache key the refresh stores its result under.
+            wait (float): Seconds to wait for another process's refresh.
+            min_ttl (float): Seconds a stored value must have left to count
+                as fresh; None refreshes unless the lock was contended.
+
+        Returns:
+            tuple: (lock to pass to ``release_refresh``, or None if not taken;
+            (bytes, ttl) stored by another process, or None if the caller
+            should refresh).
+        """
+        lock = self.lock(f"refresh:{key}")
+        try:
+            acquired = lock.acquire(wait)
+        except Exception as e:
+            self._failed("lock", key, e)
+            return None, None
+        if lock.contended:
+            self.lock_waits += 1
+        if lock.contended or min_ttl is not None:
+            value, ttl = self.get_with_ttl(key)
+            fresh = lock.contended or ttl is None or ttl >= min_ttl
+            if value is not None and fresh:
+                self.peer_refreshes += 1
+                return (lock if acquired else None), (value, ttl)
+        return (lock if acquired else None), None
+
+    def release_refresh(self, lock):
+        if lock is None:
+            return
+        try:
+            lock.release()
+        except Exception as e:
+            self._failed("unlock", lock.name, e)
+
+    def refresh_once(self, key, refresh, wait=SHARED_CACHE_LOCK_WAIT, min_ttl=None):
+        """
+        Run ``refresh()`` for ``key`` in at most one process at a time.
+
+        If another process was already refreshing the key, its stored result
+        is returned instead. If the wait times out, or it stored nothing,
+        refresh anyway.
+
+        Args:
+            key (str): Cache key the refresh stores its result under.
+            refresh (callable): Fetches, stores and returns the fresh value.
+            wait (float): Seconds to wait for another process's refresh.
+            min_ttl (float): See ``claim_refresh``.
+
+        Returns:
+            tuple: (result of ``refresh()``, None), or (None, (bytes, ttl)) with
+            the value another process stored.
+        """
+        lock, peer = self.claim_refresh(key, wait, min_ttl)
+        try:
+            if peer is not None:
+                return None, peer
+            return refresh(), None
+        finally:
+            self.release_refresh(lock)
+
+    def stats(self):
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "errors": self.errors,
+            "lock_waits": self.lock_waits,
+            "peer_refreshes": self.peer_refreshes
+        }
+
+    def close(self):
+        pass
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS locks (
+    name TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteSharedCache(SharedCache):
+    """
+    SharedCache in a SQLite file, for worker processes on one machine.
+
+    Expiry uses wall-clock time, which every process agrees on. Expired
+    entries are dropped on read and purged every ``purge_every`` writes.
+
+    Args:
+        path (str): Database file; defaults to a file in /dev/shm.
+        purge_every (int): Writes between purges of expired entries.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path=DEFAULT_SQLITE_PATH, purge_every=256):
+        super().__init__()
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SQLITE_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _get(self, key):
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None, None
+        value, expires_at = row
+        if expires_at is None:
+            return bytes(value), None
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return None, None
+        return bytes(value), remaining
+
+    def _set(self, key, value, ttl):
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                         (key, value, expires_at))
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge()
+
+    def _delete(self, key):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def _try_lock(self, name, token, ttl):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM locks WHERE name = ? AND expires_at <= ?", (name, now))
+            cursor = conn.execute("INSERT OR IGNORE INTO locks (name, token, expires_at) VALUES (?, ?, ?)",
+                                  (name, token, now + ttl))
+            return cursor.rowcount == 1
+
+    def _unlock(self, name, token):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM locks WHERE name = ? AND token = ?", (name, token))
+
+    def purge(self):
+        """Delete expired entries and locks."""
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            conn.execute("DELETE FROM locks WHERE expires_at <= ?", (now,))
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisSharedCache(SharedCache):
+    """
+    SharedCache on a Redis-protocol server.
+
+    Values are plain keys with millisecond expiry. A lock is a key set with
+    NX; it is released only by the token that took it, checked and deleted
+    under WATCH so no server-side scripting is needed.
+
+    Args:
+        client: A ``redis.Redis``-compatible client (e.g. ``fakeredis.FakeRedis()``).
+        prefix (str): Prepended to every key.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, prefix="ipl-scorecard:"):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis  # optional dependency, only needed for this backend
+
+        return cls(redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2), **kwargs)
+
+    def _get(self, key):
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(self.prefix + key)
+        pipe.pttl(self.prefix + key)
+        value, pttl = pipe.execute()
+        if value is None:
+            return None, None
+        return value, (pttl / 1000 if pttl is not None and pttl >= 0 else None)
+
+    def _set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, px=None if ttl is None else max(1, int(ttl * 1000)))
+
+    def _delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def _try_lock(self, name, token, ttl):
+        return bool(self.client.set(f"{self.prefix}lock:{name}", token, nx=True, px=max(1, int(ttl * 1000))))
+
+    def _unlock(self, name, token):
+        from redis.exceptions import WatchError
+
+        key = f"{self.prefix}lock:{name}"
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                held_by = pipe.get(key)
+                if held_by is not None and held_by.decode() == token:
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+            except WatchError:
+                pass  # the lock expired and was taken by someone else meanwhile
+
+    def close(self):
+        self.client.close()
+
+
+def open_shared_cache(url=SHARED_CACHE_URL):
+    """
+    Open the shared cache configured by ``url``.
+
+    Returns:
+        SharedCache: The backend, or None if disabled or it cannot be opened.
+    """
+    if not url:
+        return None
+    try:
+        if url.startswith(("redis://", "rediss://", "unix://")):
+            cache = RedisSharedCache.from_url(url)
+        elif url.startswith("sqlite:"):
+            path = url[len("sqlite:"):]
+            path = path[2:] if path.startswith("//") else path  # sqlite:///tmp/x.db -> /tmp/x.db
+            cache = SQLiteSharedCache(path or DEFAULT_SQLITE_PATH)
+        else:
+            logger.error(f"Shared cache disabled, unsupported SHARED_CACHE_URL: {url}")
+            return None
+    except (ImportError, sqlite3.Error) as e:
+        logger.error(f"Shared cache disabled, cannot open {url}: {e}")
+        return None
+    logger.info(f"Shared cache: {cache.backend}")
+    return cache
@@ -1,12 +1,13 @@
 import json
-import requests
-from scrapy.http import HtmlResponse
+from utils import http_client
+from utils.html_backend import parse_html
+from utils.fetcher import write_json_atomic
 
 
 def update_ipl_series():
-    url = "https://www.cricbuzz.com/cricket-series"
-    cricbuzz_resp = requests.get(url)
-    response = HtmlResponse(url=url, body=cricbuzz_resp.text, encoding='utf-8')
+    url = f"{http_client.CRICBUZZ_BASE_URL}/cricket-series"
+    cricbuzz_resp = http_client.get(url)
+    response = parse_html(cricbuzz_resp.text, url=url)
 
     series_cards = response.xpath('//a[contains(@href, "/cricket-series/")]/@href').extract()
     updated_series = {}
@@ -29,8 +30,7 @@ def update_ipl_series():
     # Merge and save
     existing_series.update(updated_series)
 
-    with open("ipl_series.json", "w") as f:
-        json.dump(existing_series, f, indent=2)
+    write_json_atomic("ipl_series.json", existing_series)
 
     print(f"✅ IPL Series IDs updated: {list(updated_series.keys())}")
     return updated_series